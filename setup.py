@@ -100,7 +100,6 @@ ext_modules = [
     window_specialization('label'),
     Extension('zipline.lib.rank', ['zipline/lib/rank.pyx']),
     Extension('zipline.data._equities', ['zipline/data/_equities.pyx']),
-    Extension('zipline.data._adjustments', ['zipline/data/_adjustments.pyx']),
     Extension('zipline._protocol', ['zipline/_protocol.pyx']),
     Extension(
         'zipline.finance._finance_ext',
@@ -247,7 +246,7 @@ def extras_requires(conda_format=False):
         extra: read_requirements('etc/requirements_{0}.txt'.format(extra),
                                  strict_bounds=True,
                                  conda_format=conda_format)
-        for extra in ('dev', 'talib')
+        for extra in ('arrow', 'dev', 'talib')
     }
     extras['all'] = [req for reqs in extras.values() for req in reqs]
 
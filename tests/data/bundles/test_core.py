@@ -1,4 +1,6 @@
+from multiprocessing.pool import Pool
 import os
+from unittest import SkipTest
 
 from nose_parameterized import parameterized
 import pandas as pd
@@ -14,7 +16,9 @@ from zipline.assets.synthetic import make_simple_equity_info
 from zipline.data.bundles import UnknownBundle, from_bundle_ingest_dirname, \
     ingestions_for_bundle
 from zipline.data.bundles.core import _make_bundle_core, BadClean, \
-    to_bundle_ingest_dirname, asset_db_path
+    to_bundle_ingest_dirname, asset_db_path, resampled_daily_path
+from zipline.data import parquet_bars
+from zipline.errors import SymbolNotFound
 from zipline.lib.adjustment import Float64Multiply
 from zipline.pipeline.loaders.synthetic import (
     make_bar_data,
@@ -38,6 +42,7 @@ from zipline.testing.predicates import (
 )
 from zipline.utils.cache import dataframe_cache
 from zipline.utils.functional import apply
+from zipline.utils.pool import SequentialPool, bounded_imap
 import zipline.utils.paths as pth
 
 
@@ -123,7 +128,34 @@ class BundleCoreTestCase(WithInstanceTmpDir,
         self.ingest('bundle', self.environ)
         assert_true(called[0])
 
-    def test_ingest(self):
+    @parameterized.expand([(1, SequentialPool), (2, Pool)])
+    def test_parallel_ingest(self, jobs, expected_pool_type):
+        results = []
+
+        @self.register('bundle', create_writers=False, parallel_ingest=True)
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir,
+                          pool):
+            assert_is_instance(pool, expected_pool_type)
+            results.extend(bounded_imap(pool, abs, range(0, -10, -1), 3))
+
+        self.ingest('bundle', self.environ, jobs=jobs)
+        assert_equal(results, list(range(10)))
+
+    @parameterized.expand([('bcolz',), ('parquet',)])
+    def test_ingest(self, storage):
+        if storage == 'parquet' and parquet_bars.pq is None:
+            raise SkipTest('pyarrow is not installed')
+
         calendar = get_calendar('NYSE')
         sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
         minutes = calendar.minutes_for_sessions_in_range(
@@ -159,6 +191,7 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             calendar_name='NYSE',
             start_session=self.START_DATE,
             end_session=self.END_DATE,
+            storage=storage,
         )
         def bundle_ingest(environ,
                           asset_db_writer,
@@ -265,6 +298,152 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             msg='volume',
         )
 
+    def test_incremental_ingest(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE, self.END_DATE,
+        )
+
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        splits = pd.DataFrame.from_records([
+            {
+                'effective_date': str_to_seconds('2014-01-08'),
+                'ratio': 0.5,
+                'sid': 0,
+            },
+            {
+                'effective_date': str_to_seconds('2014-01-10'),
+                'ratio': 0.1,
+                'sid': 1,
+            },
+        ])
+        ingested_sessions = []
+
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            ingested_sessions.append((start_session, end_session))
+            start_minute = calendar.open_and_close_for_session(
+                start_session,
+            )[0]
+            end_minute = calendar.open_and_close_for_session(end_session)[1]
+
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(
+                (sid, df[start_minute:end_minute])
+                for sid, df in make_bar_data(equities, minutes)
+            )
+            daily_bar_writer.write(
+                (sid, df[start_session:end_session])
+                for sid, df in make_bar_data(equities, sessions)
+            )
+            adjustment_writer.write(
+                splits=splits[
+                    splits.effective_date >= start_session.value // 10 ** 9
+                ],
+            )
+
+        self.register(
+            'bundle',
+            bundle_ingest,
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=sessions[2],
+        )
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-08 22:00', tz='utc'),
+        )
+
+        self.unregister('bundle')
+        self.register(
+            'bundle',
+            bundle_ingest,
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-10 22:00', tz='utc'),
+            incremental=True,
+        )
+        assert_equal(
+            ingested_sessions,
+            [(self.START_DATE, sessions[2]), (sessions[3], self.END_DATE)],
+        )
+
+        bundle = self.load('bundle', environ=self.environ)
+        assert_equal(set(bundle.asset_finder.sids), set(sids))
+
+        columns = 'open', 'high', 'low', 'close', 'volume'
+        actual = bundle.equity_minute_bar_reader.load_raw_arrays(
+            columns,
+            minutes[0],
+            minutes[-1],
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(minutes, equities, colname),
+                msg=colname,
+            )
+
+        actual = bundle.equity_daily_bar_reader.load_raw_arrays(
+            columns,
+            self.START_DATE,
+            self.END_DATE,
+            sids,
+        )
+        for actual_column, colname in zip(actual, columns):
+            assert_equal(
+                actual_column,
+                expected_bar_values_2d(sessions, equities, colname),
+                msg=colname,
+            )
+
+        adjustments = bundle.adjustment_reader.load_adjustments(
+            ['close'],
+            sessions,
+            pd.Index(sids),
+        )[0]
+        assert_equal(
+            adjustments,
+            {
+                2: [Float64Multiply(
+                    first_row=0,
+                    last_row=2,
+                    first_col=0,
+                    last_col=0,
+                    value=0.5,
+                )],
+                4: [Float64Multiply(
+                    first_row=0,
+                    last_row=4,
+                    first_col=1,
+                    last_col=1,
+                    value=0.1,
+                )],
+            },
+        )
+
     def test_ingest_assets_versions(self):
         versions = (1, 2)
 
@@ -331,6 +510,80 @@ class BundleCoreTestCase(WithInstanceTmpDir,
             version_table = metadata.tables['version_info']
             check_version_info(eng, version_table, version)
 
+    def test_incremental_ingest_keeps_asset_history(self):
+        calendar = get_calendar('NYSE')
+        sessions = calendar.sessions_in_range(self.START_DATE, self.END_DATE)
+        sids = tuple(range(3))
+        # The last asset changes its symbol in the second ingestion.
+        symbols = [['A', 'B', 'C'], ['A', 'B', 'D']]
+
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            # Like most data sources, the metadata only covers the sessions
+            # being ingested.
+            equities = make_simple_equity_info(
+                sids,
+                start_session,
+                end_session,
+                symbols=symbols.pop(0),
+            )
+            asset_db_writer.write(equities=equities)
+            daily_bar_writer.write(
+                (sid, df[start_session:end_session])
+                for sid, df in make_bar_data(equities, sessions)
+            )
+            adjustment_writer.write()
+
+        self.register(
+            'bundle',
+            bundle_ingest,
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=sessions[2],
+        )
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-08 22:00', tz='utc'),
+        )
+
+        self.unregister('bundle')
+        self.register(
+            'bundle',
+            bundle_ingest,
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        self.ingest(
+            'bundle',
+            environ=self.environ,
+            timestamp=pd.Timestamp('2014-01-10 22:00', tz='utc'),
+            incremental=True,
+        )
+
+        finder = self.load('bundle', environ=self.environ).asset_finder
+        for sid in sids:
+            asset = finder.retrieve_asset(sid)
+            assert_equal(asset.start_date, self.START_DATE)
+            assert_equal(asset.end_date, self.END_DATE)
+
+        assert_equal(finder.lookup_symbol('A', sessions[0]).sid, 0)
+        assert_equal(finder.lookup_symbol('A', sessions[-1]).sid, 0)
+        assert_equal(finder.lookup_symbol('C', sessions[2]).sid, 2)
+        assert_equal(finder.lookup_symbol('D', sessions[-1]).sid, 2)
+        with assert_raises(SymbolNotFound):
+            finder.lookup_symbol('D', sessions[2])
+
     @parameterized.expand([('clean',), ('load',)])
     def test_bundle_doesnt_exist(self, fnname):
         with assert_raises(UnknownBundle) as e:
@@ -338,6 +591,119 @@ class BundleCoreTestCase(WithInstanceTmpDir,
 
         assert_equal(e.exception.name, 'ayy')
 
+    def test_load_unregistered(self):
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+        sessions = get_calendar('NYSE').sessions_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            daily_bar_writer.write(make_bar_data(equities, sessions))
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+
+        # The ingested data can be loaded without registering the bundle
+        # again, e.g. in another process.
+        self.unregister('bundle')
+        bundle = self.load('bundle', environ=self.environ)
+
+        assert_equal(set(bundle.asset_finder.sids), set(sids))
+        assert_equal(
+            bundle.equity_daily_bar_reader.load_raw_arrays(
+                ['close'],
+                self.START_DATE,
+                self.END_DATE,
+                sids,
+            )[0],
+            expected_bar_values_2d(sessions, equities, 'close'),
+        )
+
+    def test_load_resampled_daily_bars(self):
+        calendar = get_calendar('NYSE')
+        minutes = calendar.minutes_for_sessions_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+        sids = tuple(range(3))
+        equities = make_simple_equity_info(
+            sids,
+            self.START_DATE,
+            self.END_DATE,
+        )
+
+        @self.register(
+            'bundle',
+            calendar_name='NYSE',
+            start_session=self.START_DATE,
+            end_session=self.END_DATE,
+        )
+        def bundle_ingest(environ,
+                          asset_db_writer,
+                          minute_bar_writer,
+                          daily_bar_writer,
+                          adjustment_writer,
+                          calendar,
+                          start_session,
+                          end_session,
+                          cache,
+                          show_progress,
+                          output_dir):
+            asset_db_writer.write(equities=equities)
+            minute_bar_writer.write(make_bar_data(equities, minutes))
+            adjustment_writer.write()
+
+        self.ingest('bundle', environ=self.environ)
+        bundle = self.load('bundle', environ=self.environ)
+
+        closes = calendar.session_closes_in_range(
+            self.START_DATE,
+            self.END_DATE,
+        )
+        assert_equal(
+            bundle.resampled_daily_bar_reader.load_raw_arrays(
+                ['close'],
+                self.START_DATE,
+                self.END_DATE,
+                sids,
+            )[0],
+            expected_bar_values_2d(closes, equities, 'close'),
+        )
+
+        # The resampled bars are stored in the ingestion.
+        timestr = to_bundle_ingest_dirname(
+            ingestions_for_bundle('bundle', self.environ)[0],
+        )
+        assert_equal(
+            os.listdir(
+                resampled_daily_path('bundle', timestr, environ=self.environ),
+            ),
+            ['0'],
+        )
+
     def test_load_no_data(self):
         # register but do not ingest data
         self.register('bundle', lambda *args: None)
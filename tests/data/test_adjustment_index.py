@@ -0,0 +1,82 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from contextlib import closing
+import sqlite3
+
+from numpy.testing import assert_array_equal
+
+from zipline.data.adjustment_index import AdjustmentIndex
+from zipline.testing.fixtures import ZiplineTestCase
+
+
+class AdjustmentIndexTestCase(ZiplineTestCase):
+
+    def init_instance_fixtures(self):
+        super(AdjustmentIndexTestCase, self).init_instance_fixtures()
+
+        conn = self.enter_instance_context(
+            closing(sqlite3.connect(':memory:')),
+        )
+        conn.execute(
+            'CREATE TABLE splits '
+            '(effective_date INTEGER, ratio REAL, sid INTEGER)',
+        )
+        conn.executemany(
+            'INSERT INTO splits VALUES (?, ?, ?)',
+            [
+                (30, 0.5, 2),
+                (10, 0.25, 1),
+                (20, 2.0, 2),
+                (50, 3.0, 1),
+                (10, 0.1, 5),
+            ],
+        )
+        self.conn = conn
+        self.index = AdjustmentIndex.from_sqlite(conn, 'splits')
+
+    def test_sorted(self):
+        self.assertEqual(len(self.index), 5)
+        assert_array_equal(self.index.sids, [1, 1, 2, 2, 5])
+        assert_array_equal(self.index.effective_dates, [10, 50, 20, 30, 10])
+
+    def test_query(self):
+        sid_ixs, effective_dates, ratios = self.index.query(
+            [2, 1, 3, 5],
+            10,
+            30,
+        )
+        assert_array_equal(sid_ixs, [0, 0, 1, 3])
+        assert_array_equal(effective_dates, [20, 30, 10, 10])
+        assert_array_equal(ratios, [2.0, 0.5, 0.25, 0.1])
+
+    def test_query_no_matches(self):
+        for sids, start, end in (([3], 0, 100), ([1], 11, 49), ([], 0, 100)):
+            sid_ixs, effective_dates, ratios = self.index.query(
+                sids,
+                start,
+                end,
+            )
+            self.assertEqual(len(sid_ixs), 0)
+            self.assertEqual(len(effective_dates), 0)
+            self.assertEqual(len(ratios), 0)
+
+    def test_empty_table(self):
+        self.conn.execute(
+            'CREATE TABLE mergers '
+            '(effective_date INTEGER, ratio REAL, sid INTEGER)',
+        )
+        index = AdjustmentIndex.from_sqlite(self.conn, 'mergers')
+        self.assertEqual(len(index), 0)
+        self.assertEqual(len(index.query([1, 2], 0, 100)[0]), 0)
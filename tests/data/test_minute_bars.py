@@ -1165,6 +1165,59 @@ class BcolzMinuteBarTestCase(WithTradingCalendars,
                           "close, even when data is written between the early "
                           "close and the next open.")
 
+    def test_last_traded_index(self):
+        sessions = self.market_opens.index
+        first_open = self.market_opens[sessions[0]]
+        third_open = self.market_opens[sessions[2]]
+        minutes = [
+            first_open + Timedelta('10 min'),
+            first_open + Timedelta('20 min'),
+            third_open + Timedelta('5 min'),
+        ]
+        sid = 1
+        data = DataFrame(
+            data={
+                'open': [10.0, 11.0, 12.0],
+                'high': [20.0, 21.0, 22.0],
+                'low': [30.0, 31.0, 32.0],
+                'close': [40.0, 41.0, 42.0],
+                'volume': [50, 51, 52]
+            },
+            index=minutes)
+        self.writer.write_sid(sid, data)
+
+        asset = self.asset_finder.retrieve_asset(sid)
+        indexed_reader = BcolzMinuteBarReader(
+            self.dest, last_traded_index=True,
+        )
+
+        queries = [
+            (first_open, NaT),
+            (first_open + Timedelta('15 min'), minutes[0]),
+            (first_open + Timedelta('20 min'), minutes[1]),
+            (self.market_opens[sessions[1]], minutes[1]),
+            (third_open, minutes[1]),
+            (third_open + Timedelta('30 min'), minutes[2]),
+            (self.market_opens[sessions[5]], minutes[2]),
+        ]
+        for dt, expected in queries:
+            for reader in self.reader, indexed_reader:
+                if expected is NaT:
+                    self.assertIs(reader.get_last_traded_dt(asset, dt), NaT)
+                else:
+                    self.assertEqual(reader.get_last_traded_dt(asset, dt),
+                                     expected)
+
+        for reader in self.reader, indexed_reader:
+            last_traded = reader.get_last_traded_dts(
+                [asset, asset],
+                third_open + Timedelta('1 min'),
+            )
+            assert_array_equal(
+                last_traded,
+                DatetimeIndex([minutes[1], minutes[1]]),
+            )
+
     def test_minute_updates(self):
         """
         Test minute updates.
@@ -0,0 +1,258 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import skipIf
+
+from numpy import arange, nan
+from numpy.testing import assert_array_equal
+from pandas import DataFrame, NaT, Timestamp
+
+from zipline.data import parquet_bars
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.parquet_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+    ParquetMinuteBarReader,
+    ParquetMinuteBarWriter,
+)
+from zipline.testing.fixtures import (
+    WithAssetFinder,
+    WithInstanceTmpDir,
+    WithTradingCalendars,
+    ZiplineTestCase,
+)
+
+TEST_CALENDAR_START = Timestamp('2015-06-01', tz='UTC')
+TEST_CALENDAR_STOP = Timestamp('2015-08-31', tz='UTC')
+
+no_pyarrow = parquet_bars.pq is None
+
+
+def make_bars(index, sid):
+    count = len(index)
+    return DataFrame(
+        {
+            'open': arange(count) + 10.0 * sid + 1,
+            'high': arange(count) + 10.0 * sid + 2,
+            'low': arange(count) + 10.0 * sid,
+            'close': arange(count) + 10.0 * sid + 1.5,
+            'volume': arange(count) % 3,
+        },
+        index=index,
+    )
+
+
+@skipIf(no_pyarrow, 'pyarrow is not installed')
+class ParquetDailyBarTestCase(WithTradingCalendars,
+                              WithInstanceTmpDir,
+                              ZiplineTestCase):
+
+    def init_instance_fixtures(self):
+        super(ParquetDailyBarTestCase, self).init_instance_fixtures()
+
+        self.sessions = self.trading_calendar.sessions_in_range(
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+        )
+        dest = self.instance_tmpdir.getpath('daily_bars')
+        ParquetDailyBarWriter(
+            dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            row_group_sessions=10,
+        ).write([
+            (1, make_bars(self.sessions[5:40], 1)),
+            (2, make_bars(self.sessions, 2)),
+        ])
+        self.reader = ParquetDailyBarReader(dest)
+
+    def test_row_groups(self):
+        starts, ends = self.reader._row_group_bounds
+        self.assertEqual(
+            len(starts),
+            (len(self.sessions) + 9) // 10,
+        )
+        assert_array_equal(starts, self.sessions[::10].asi8)
+
+    def test_load_raw_arrays(self):
+        opens, volumes = self.reader.load_raw_arrays(
+            ['open', 'volume'],
+            self.sessions[3],
+            self.sessions[12],
+            [2, 1, 3],
+        )
+        assert_array_equal(opens[:, 0], arange(3, 13) + 21.0)
+        assert_array_equal(opens[:2, 1], [nan, nan])
+        assert_array_equal(opens[2:, 1], arange(8) + 11.0)
+        assert_array_equal(opens[:, 2], [nan] * 10)
+        assert_array_equal(volumes[:, 0], arange(3, 13) % 3)
+        assert_array_equal(volumes[:, 2], [0] * 10)
+
+    def test_load_raw_arrays_no_assets(self):
+        opens, volumes = self.reader.load_raw_arrays(
+            ['open', 'volume'],
+            self.sessions[3],
+            self.sessions[12],
+            [],
+        )
+        self.assertEqual(opens.shape, (10, 0))
+        self.assertEqual(volumes.shape, (10, 0))
+
+    def test_get_value(self):
+        self.assertEqual(
+            self.reader.get_value(1, self.sessions[6], 'open'),
+            12.0,
+        )
+        with self.assertRaises(NoDataBeforeDate):
+            self.reader.get_value(1, self.sessions[2], 'open')
+        with self.assertRaises(NoDataAfterDate):
+            self.reader.get_value(1, self.sessions[45], 'open')
+        with self.assertRaises(NoDataForSid):
+            self.reader.get_value(3, self.sessions[5], 'open')
+        with self.assertRaises(NoDataOnDate):
+            self.reader.get_value(1, Timestamp('2015-07-04', tz='UTC'), 'open')
+
+    def test_get_last_traded_dt(self):
+        self.assertEqual(
+            self.reader.get_last_traded_dt(1, self.sessions[-1]),
+            self.sessions[39],
+        )
+        # The first bar of each asset has no volume.
+        self.assertIs(self.reader.get_last_traded_dt(1, self.sessions[5]), NaT)
+        self.assertEqual(self.reader.first_trading_day, self.sessions[0])
+
+
+@skipIf(no_pyarrow, 'pyarrow is not installed')
+class ParquetMinuteBarTestCase(WithTradingCalendars,
+                               WithAssetFinder,
+                               WithInstanceTmpDir,
+                               ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = 1, 2
+
+    def init_instance_fixtures(self):
+        super(ParquetMinuteBarTestCase, self).init_instance_fixtures()
+
+        self.minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            TEST_CALENDAR_START,
+            self.trading_calendar.sessions_in_range(
+                TEST_CALENDAR_START,
+                TEST_CALENDAR_STOP,
+            )[4],
+        )
+        dest = self.instance_tmpdir.getpath('minute_bars')
+        self.writer = ParquetMinuteBarWriter(
+            dest,
+            self.trading_calendar,
+            TEST_CALENDAR_START,
+            TEST_CALENDAR_STOP,
+            390,
+            row_group_sessions=2,
+        )
+        self.reader = ParquetMinuteBarReader(dest)
+
+    def test_append(self):
+        self.writer.write_sid(1, make_bars(self.minutes[:500], 1))
+        self.writer.write_sid(1, make_bars(self.minutes[500:], 1))
+        self.writer.close()
+
+        opens, = self.reader.load_raw_arrays(
+            ['open'],
+            self.minutes[0],
+            self.minutes[-1],
+            [1, 2],
+        )
+        assert_array_equal(opens[:500, 0], arange(500) + 11.0)
+        assert_array_equal(
+            opens[500:, 0],
+            arange(len(self.minutes) - 500) + 11.0,
+        )
+        assert_array_equal(opens[:, 1], [nan] * len(self.minutes))
+
+        self.assertEqual(len(self.reader._open_file(1)[1][0]), 3)
+
+    def test_append_after_close(self):
+        self.writer.write([(1, make_bars(self.minutes[:500], 1))])
+        self.writer.write([(1, make_bars(self.minutes[500:], 1))])
+
+        opens, = self.reader.load_raw_arrays(
+            ['open'],
+            self.minutes[0],
+            self.minutes[-1],
+            [1],
+        )
+        assert_array_equal(opens[:500, 0], arange(500) + 11.0)
+        assert_array_equal(
+            opens[500:, 0],
+            arange(len(self.minutes) - 500) + 11.0,
+        )
+        self.assertEqual(len(self.reader._open_file(1)[1][0]), 3)
+        self.assertEqual(
+            self.reader._metadata.asset_sessions[1],
+            (
+                self.trading_calendar.minute_to_session_label(
+                    self.minutes[0],
+                ),
+                self.trading_calendar.minute_to_session_label(
+                    self.minutes[-1],
+                ),
+            ),
+        )
+
+    def test_overlapping_write(self):
+        self.writer.write_sid(1, make_bars(self.minutes[:500], 1))
+        with self.assertRaises(ValueError):
+            self.writer.write_sid(1, make_bars(self.minutes[400:], 1))
+        self.writer.close()
+        with self.assertRaises(ValueError):
+            self.writer.write_sid(1, make_bars(self.minutes[400:], 1))
+
+    def test_get_value(self):
+        self.writer.write([(2, make_bars(self.minutes, 2))])
+
+        self.assertEqual(
+            self.reader.get_value(2, self.minutes[800], 'close'),
+            821.5,
+        )
+        self.assertEqual(
+            self.reader.get_value(2, self.minutes[801], 'volume'),
+            0,
+        )
+        with self.assertRaises(NoDataForSid):
+            self.reader.get_value(1, self.minutes[0], 'close')
+        with self.assertRaises(NoDataOnDate):
+            self.reader.get_value(
+                2,
+                self.minutes[0] - self.trading_calendar.day,
+                'close',
+            )
+
+    def test_get_last_traded_dt(self):
+        self.writer.write([(2, make_bars(self.minutes, 2))])
+        asset = self.asset_finder.retrieve_asset(2)
+
+        self.assertEqual(
+            self.reader.get_last_traded_dt(asset, self.minutes[801]),
+            self.minutes[800],
+        )
+        self.assertIs(
+            self.reader.get_last_traded_dt(asset, self.minutes[0]),
+            NaT,
+        )
@@ -13,6 +13,7 @@
 # limitations under the License.
 from collections import OrderedDict
 from numbers import Real
+import os
 
 from nose_parameterized import parameterized
 from numpy.testing import assert_almost_equal
@@ -35,6 +36,7 @@ from zipline.testing.fixtures import (
     WithBcolzEquityMinuteBarReader,
     WithBcolzEquityDailyBarReader,
     WithBcolzFutureMinuteBarReader,
+    WithInstanceTmpDir,
     ZiplineTestCase,
 )
 
@@ -251,6 +253,22 @@ EXPECTED_SESSIONS = {
                                          utc=True)),
 }
 
+# Calls to the aggregators as (minutes, position in minutes, positions of the
+# requested assets). The calls move backwards within a session, go back to an
+# earlier session, and request different subsets of the assets.
+NON_MONOTONIC_CALLS = (
+    ('day_0_front', 1, [0, 1, 2, 3]),
+    ('day_0_front', 0, [0, 1]),
+    ('day_0_back', 1, [0, 1, 2, 3]),
+    ('day_0_front', 2, [2, 0]),
+    ('day_0_back', 2, [3, 3, 1]),
+    ('day_1_front', 0, [0, 1, 2, 3]),
+    ('day_1_back', 2, [1, 2]),
+    ('day_1_front', 2, [0, 1, 2, 3]),
+    ('day_0_back', 0, [0, 2]),
+    ('day_1_back', 0, [3, 2, 1, 0]),
+)
+
 
 class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                                        WithBcolzFutureMinuteBarReader,
@@ -523,6 +541,93 @@ class MinuteToDailyAggregationTestCase(WithBcolzEquityMinuteBarReader,
                     err_msg='sid={0} field={1} dt={2}'.format(
                         asset, field, minute))
 
+    @parameter_space(field=OHLCV, __fail_fast=True)
+    def test_equity_non_monotonic_minutes(self, field):
+        self._test_non_monotonic_minutes(
+            field,
+            self.asset_finder.retrieve_all(self.ASSET_FINDER_EQUITY_SIDS),
+            NYSE_MINUTES,
+            self.equity_daily_aggregator,
+            self.bcolz_equity_minute_bar_reader,
+            self.nyse_calendar,
+        )
+
+    @parameter_space(field=OHLCV, __fail_fast=True)
+    def test_future_non_monotonic_minutes(self, field):
+        self._test_non_monotonic_minutes(
+            field,
+            self.asset_finder.retrieve_all(self.ASSET_FINDER_FUTURE_SIDS),
+            FUT_MINUTES,
+            self.future_daily_aggregator,
+            self.bcolz_future_minute_bar_reader,
+            self.us_futures_calendar,
+        )
+
+    def _test_non_monotonic_minutes(self,
+                                    field,
+                                    assets,
+                                    minutes,
+                                    aggregator,
+                                    minute_reader,
+                                    calendar):
+        method_name = field + 's'
+        for key, i, asset_ixs in NON_MONOTONIC_CALLS:
+            minute = minutes[key][i]
+            requested = [assets[ix] for ix in asset_ixs]
+
+            values = getattr(aggregator, method_name)(requested, minute)
+
+            assert_almost_equal(
+                values,
+                self._aggregate_from_open(
+                    field,
+                    requested,
+                    minute,
+                    minute_reader,
+                    calendar,
+                ),
+                err_msg='field={0} dt={1} assets={2}'.format(
+                    field, minute, requested,
+                ),
+            )
+
+    def _aggregate_from_open(self,
+                             field,
+                             assets,
+                             dt,
+                             minute_reader,
+                             calendar):
+        """
+        Aggregate the minutes from the market open to ``dt`` for every asset,
+        the way the aggregator did before it kept state between calls.
+        """
+        session = calendar.minute_to_session_label(dt)
+        market_open, _ = calendar.open_and_close_for_session(session)
+        window = minute_reader.load_raw_arrays(
+            [field],
+            market_open,
+            dt,
+            assets,
+        )[0]
+
+        if field == 'volume':
+            return window.sum(axis=0)
+
+        out = full(len(assets), nan)
+        for j in range(len(assets)):
+            values = window[:, j][~isnan(window[:, j])]
+            if not len(values):
+                continue
+            if field == 'open':
+                out[j] = values[0]
+            elif field == 'high':
+                out[j] = values.max()
+            elif field == 'low':
+                out[j] = values.min()
+            else:
+                out[j] = values[-1]
+        return out
+
 
 class TestMinuteToSession(WithEquityMinuteBarData,
                           ZiplineTestCase):
@@ -666,6 +771,130 @@ class TestResampleSessionBars(WithBcolzFutureMinuteBarReader,
         )
 
 
+class TestCachedResampleSessionBars(WithInstanceTmpDir,
+                                    TestResampleSessionBars):
+
+    def init_instance_fixtures(self):
+        super(TestCachedResampleSessionBars, self).init_instance_fixtures()
+        self.cache_path = self.instance_tmpdir.getpath('resampled')
+        self.session_bar_reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_path=self.cache_path,
+        )
+
+    def test_cache_is_reused(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+
+        # Store the assets over two reads, so that the second read appends to
+        # the bars stored by the first.
+        for assets in sids[:2], sids:
+            self.session_bar_reader.load_raw_arrays(
+                OHLCV,
+                self.START_DATE,
+                self.END_DATE,
+                assets,
+            )
+
+        reader = MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_path=self.cache_path,
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError('minute bars were resampled again')
+
+        reader._get_resampled = fail
+
+        calendar = self.trading_calendar
+        for sid in sids:
+            case_frame = FUTURE_CASES[sid]
+            first = calendar.minute_to_session_label(
+                case_frame.index[0])
+            last = calendar.minute_to_session_label(
+                case_frame.index[-1])
+            result = reader.load_raw_arrays(OHLCV, first, last, [sid])
+            for i, field in enumerate(OHLCV):
+                assert_almost_equal(
+                    EXPECTED_SESSIONS[sid][[field]],
+                    result[i],
+                    err_msg="sid={0} field={1}".format(sid, field))
+
+    def test_superseded_versions_are_removed(self):
+        sids = list(self.ASSET_FINDER_FUTURE_SIDS)
+        first = self.session_bar_reader.load_raw_arrays(
+            OHLCV,
+            self.START_DATE,
+            self.END_DATE,
+            sids[:2],
+        )
+
+        # Storing more assets from another reader writes a new version.
+        MinuteResampleSessionBarReader(
+            self.trading_calendar,
+            self.bcolz_future_minute_bar_reader,
+            cache_path=self.cache_path,
+        ).load_raw_arrays(OHLCV, self.START_DATE, self.END_DATE, sids)
+        self.assertEqual(os.listdir(self.cache_path), ['1'])
+
+        # The first reader can still read the version it opened.
+        second = self.session_bar_reader.load_raw_arrays(
+            OHLCV,
+            self.START_DATE,
+            self.END_DATE,
+            sids[:2],
+        )
+        for expected, result in zip(first, second):
+            assert_almost_equal(expected, result)
+
+    def test_prices_are_not_rounded(self):
+        reader = self.session_bar_reader
+        sessions = reader.sessions
+
+        def resampled(columns, start_session, end_session, assets):
+            shape = len(sessions), len(assets)
+            results = []
+            for column in columns:
+                if column != 'volume':
+                    results.append(full(shape, 1.0 / 3))
+                else:
+                    results.append(full(shape, 0, dtype='uint32'))
+            return results
+
+        reader._get_resampled = resampled
+        sid = self.ASSET_FINDER_FUTURE_SIDS[0]
+        self.assertEqual(
+            reader.get_value(sid, sessions[0], 'close'),
+            1.0 / 3,
+        )
+
+    def test_missing_metadata_is_a_miss(self):
+        # A version without its metadata, e.g. from an interrupted write by
+        # an older version of zipline, is ignored.
+        os.makedirs(os.path.join(self.cache_path, '0'))
+        with open(os.path.join(self.cache_path, '0', 'metadata.json'),
+                  'w') as f:
+            f.write('{}')
+
+        sid = self.ASSET_FINDER_FUTURE_SIDS[0]
+        result = self.session_bar_reader.load_raw_arrays(
+            OHLCV,
+            self.START_DATE,
+            self.END_DATE,
+            [sid],
+        )
+        expected = self.session_bar_reader._get_resampled(
+            OHLCV,
+            self.START_DATE,
+            self.END_DATE,
+            [sid],
+        )
+        for expected_values, values in zip(expected, result):
+            assert_almost_equal(expected_values, values)
+        self.assertIn('1', os.listdir(self.cache_path))
+
+
 class TestReindexMinuteBars(WithBcolzEquityMinuteBarReader,
                             ZiplineTestCase):
 
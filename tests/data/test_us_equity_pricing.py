@@ -19,6 +19,7 @@ from nose_parameterized import parameterized
 from numpy import (
     arange,
     datetime64,
+    memmap,
     nan,
 )
 from numpy.testing import (
@@ -29,6 +30,7 @@ from pandas import (
     Timestamp,
 )
 from pandas.util.testing import assert_index_equal
+from six import iteritems
 from trading_calendars import get_calendar
 
 from zipline.data.us_equity_pricing import (
@@ -45,7 +47,7 @@ from zipline.pipeline.loaders.synthetic import (
     expected_bar_values_2d,
     make_bar_data,
 )
-from zipline.testing import seconds_to_timestamp
+from zipline.testing import seconds_to_timestamp, tmp_dir
 from zipline.testing.fixtures import (
     WithAssetFinder,
     WithBcolzEquityDailyBarReader,
@@ -370,6 +372,56 @@ class BcolzDailyBarNeverReadAllTestCase(BcolzDailyBarTestCase):
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = maxsize
 
 
+class BcolzDailyBarMmapTestCase(BcolzDailyBarTestCase):
+    """
+    Run the tests defined in BcolzDailyBarTestCase against a reader of the
+    memory mapped copies of the columns.
+    """
+    BCOLZ_DAILY_BAR_WRITE_MMAP = True
+
+    def test_reads_from_mmap(self):
+        reader = self.bcolz_equity_daily_bar_reader
+        self.assertIsNotNone(reader._mmap_dir)
+        self.assertIsInstance(reader._spot_col('close'), memmap)
+
+        reader = BcolzDailyBarReader(self.bcolz_daily_bar_path, use_mmap=False)
+        self.assertIsNone(reader._mmap_dir)
+
+    def test_unadjusted_get_value_empty_value(self):
+        # The memory mapped columns are read-only, so write a table with a
+        # zero close at the day and sid instead of patching the fixture.
+        zero_sid = 1
+        zero_day = Timestamp('2015-06-02', tz='UTC')
+
+        days = self.equity_daily_bar_days
+        bar_data = dict(make_bar_data(EQUITY_INFO, days))
+        bar_data[zero_sid].loc[zero_day, 'close'] = 0
+
+        with tmp_dir() as tmpdir:
+            BcolzDailyBarWriter(
+                tmpdir.path,
+                self.trading_calendar,
+                days[0],
+                days[-1],
+                write_mmap=True,
+            ).write(iteritems(bar_data))
+
+            reader = BcolzDailyBarReader(tmpdir.path)
+            self.assertIsInstance(reader._spot_col('close'), memmap)
+
+            close = reader.get_value(zero_sid, zero_day, 'close')
+            assert_array_equal(nan, close)
+
+            # The other days for the sid still read the written prices.
+            next_day = Timestamp('2015-06-03', tz='UTC')
+            self.assertEqual(
+                reader.get_value(zero_sid, next_day, 'close'),
+                self.bcolz_equity_daily_bar_reader.get_value(
+                    zero_sid, next_day, 'close',
+                ),
+            )
+
+
 class BcolzDailyBarWriterMissingDataTestCase(WithAssetFinder,
                                              WithTmpDir,
                                              WithTradingCalendars,
@@ -48,7 +48,10 @@ from zipline.utils.events import (
     MAX_MONTH_RANGE,
     MAX_WEEK_RANGE,
     TradingDayOfMonthRule,
-    TradingDayOfWeekRule
+    TradingDayOfWeekRule,
+    date_rules,
+    make_eventrule,
+    time_rules,
 )
 
 
@@ -168,6 +171,195 @@ class TestEventManager(TestCase):
 
         self.assertEqual(CountingRule.count, 5)
 
+    def test_compile(self):
+        minutes = pd.date_range(
+            '2014-01-06 14:31',
+            periods=5,
+            freq='min',
+            tz='UTC',
+        )
+        self.em.compile(minutes)
+        self.assertIsNone(self.em.next_trigger(minutes[0]))
+
+        class MinuteRule(StatelessRule):
+            def should_trigger(self, dt):
+                MinuteRule.count += 1
+                return dt.minute == 33
+
+        MinuteRule.count = 0
+        calls = []
+        self.em.add_event(
+            Event(Never(), lambda context, data: calls.append(0)),
+        )
+        self.em.add_event(
+            Event(MinuteRule(), lambda context, data: calls.append(1)),
+        )
+
+        next_triggers = []
+        for minute in minutes:
+            next_triggers.append(self.em.next_trigger(minute))
+            self.em.handle_data(None, None, minute)
+
+        self.assertEqual(
+            next_triggers,
+            [minutes[2].value] * 3 + [None] * 2,
+        )
+        self.assertEqual(calls, [1])
+        # The rule is only evaluated when the events are compiled.
+        self.assertEqual(MinuteRule.count, len(minutes))
+
+    def test_compile_event_added_later(self):
+        minutes = pd.date_range(
+            '2014-01-06 14:31',
+            periods=5,
+            freq='min',
+            tz='UTC',
+        )
+        self.em.compile(minutes)
+
+        calls = []
+        for minute in minutes[:2]:
+            self.em.handle_data(None, None, minute)
+
+        # The event is compiled from the first minute it is used at.
+        rule = OncePerDay()
+        rule.cal = get_calendar('NYSE')
+        self.em.add_event(Event(rule, lambda context, data: calls.append(0)))
+        for minute in minutes[2:]:
+            self.em.handle_data(None, None, minute)
+
+        self.assertEqual(calls, [0])
+        self.assertIsNone(self.em.next_trigger(minutes[3]))
+
+    def test_compile_stateful_rule(self):
+        minutes = pd.date_range(
+            '2014-01-06 14:31',
+            periods=5,
+            freq='min',
+            tz='UTC',
+        )
+
+        class CustomStatefulRule(StatefulRule):
+            def should_trigger(self, dt):
+                return True
+
+        calls = []
+        self.em.add_event(
+            Event(CustomStatefulRule(), lambda context, data: calls.append(0)),
+        )
+        self.em.compile(minutes)
+
+        # Stateful rules can't be evaluated ahead of time unless they know
+        # how, so they are called at every minute.
+        for minute in minutes:
+            self.assertEqual(self.em.next_trigger(minute), minute.value)
+            self.em.handle_data(None, None, minute)
+
+        self.assertEqual(calls, [0] * len(minutes))
+
+    def test_compile_other_calendar(self):
+        # The rules may use another calendar than the simulation, so they
+        # see minutes outside of the sessions of their calendar.
+        nyse = get_calendar('NYSE')
+        minutes = get_calendar('CME').minutes_for_sessions_in_range(
+            # The NYSE closes early on 2014-11-28.
+            pd.Timestamp('2014-11-25', tz='UTC'),
+            pd.Timestamp('2014-12-02', tz='UTC'),
+        )
+
+        def make_rules():
+            return [
+                Always(),
+                make_eventrule(
+                    date_rules.every_day(),
+                    time_rules.market_open(minutes=5),
+                    nyse,
+                ),
+                make_eventrule(
+                    date_rules.every_day(),
+                    time_rules.market_close(),
+                    nyse,
+                    half_days=False,
+                ),
+            ]
+
+        rules = make_rules()
+        expected = [
+            (ix, minute)
+            for minute in minutes
+            for ix, rule in enumerate(rules)
+            if rule.should_trigger(minute)
+        ]
+
+        calls = []
+        for ix, rule in enumerate(make_rules()):
+            self.em.add_event(
+                Event(rule, lambda context, dt, ix=ix: calls.append((ix, dt))),
+            )
+        self.em.compile(minutes)
+
+        for minute in minutes:
+            # The ``Always`` rule triggers at every minute.
+            self.assertEqual(self.em.next_trigger(minute), minute.value)
+            self.em.handle_data(None, minute, minute)
+
+        self.assertEqual(calls, expected)
+        # The open of each of the 5 NYSE sessions, and the close of the 4
+        # full days.
+        self.assertEqual(len([ix for ix, _ in calls if ix == 1]), 5)
+        self.assertEqual(len([ix for ix, _ in calls if ix == 2]), 4)
+
+        # The date rules can only be called at minutes of their sessions, so
+        # they are called at every minute like before.
+        rule = make_eventrule(
+            date_rules.week_start(),
+            time_rules.market_open(),
+            nyse,
+        )
+        self.assertIsNone(rule.trigger_minutes(minutes))
+        self.assertIsNotNone(
+            rule.trigger_minutes(nyse.minutes_for_session(
+                pd.Timestamp('2014-12-01', tz='UTC'),
+            )),
+        )
+
+    @parameterized.expand([
+        ('after_open', AfterOpen(minutes=5)),
+        ('before_close', BeforeClose(minutes=5)),
+    ])
+    def test_trigger_minutes_keeps_state(self, name, rule):
+        nyse = get_calendar('NYSE')
+        rule.cal = nyse
+        first_session = nyse.minutes_for_session(
+            pd.Timestamp('2014-01-06', tz='UTC'),
+        )
+        later_sessions = nyse.minutes_for_sessions_in_range(
+            pd.Timestamp('2014-01-07', tz='UTC'),
+            pd.Timestamp('2014-01-08', tz='UTC'),
+        )
+
+        self.assertEqual(
+            sum(rule.should_trigger(dt) for dt in first_session),
+            1,
+        )
+        state = rule._period_start, rule._period_end, rule._period_close
+
+        # Compiling the rule over other sessions doesn't change the periods
+        # used by ``should_trigger``.
+        rule.trigger_minutes(later_sessions)
+        self.assertEqual(
+            (rule._period_start, rule._period_end, rule._period_close),
+            state,
+        )
+
+        # A fresh rule gives the same answers as one used before.
+        fresh = type(rule)(minutes=5)
+        fresh.cal = nyse
+        self.assertEqual(
+            [rule.should_trigger(dt) for dt in later_sessions],
+            [fresh.should_trigger(dt) for dt in later_sessions],
+        )
+
 
 class TestEventRule(TestCase):
     def test_is_abstract(self):
@@ -502,3 +694,27 @@ class StatefulRulesTests(RuleTestCase):
                 rule.should_trigger(minute)
 
             self.assertEqual(rule.count, 1)
+
+    def test_OncePerDay_trigger_minutes(self):
+        def make_rule():
+            rule = OncePerDay(AfterOpen(minutes=5))
+            rule.cal = self.cal
+            return rule
+
+        every_minute_rule = make_rule()
+        trigger_minutes_rule = make_rule()
+
+        # The trigger minutes must be the minutes at which calling
+        # should_trigger at every minute returns True, and computing them
+        # must continue from the current state of the rule.
+        for session_minutes in minutes_for_days(self.cal, ordered_days=True):
+            expected = [
+                minute for minute in session_minutes
+                if every_minute_rule.should_trigger(minute)
+            ]
+
+            triggers = trigger_minutes_rule.trigger_minutes(session_minutes)
+            self.assertEqual(list(session_minutes[triggers]), expected)
+
+            for minute in session_minutes:
+                trigger_minutes_rule.should_trigger(minute)
@@ -291,6 +291,33 @@ class CommissionUnitTests(WithAssetFinder, ZiplineTestCase):
         self.assertAlmostEqual(25.755, model.calculate(order, txns[1]))
         self.assertAlmostEqual(15.3, model.calculate(order, txns[2]))
 
+    @parameterized.expand([
+        ('per_share', PerShare(cost=0.0075, min_trade_cost=None)),
+        ('per_share_with_minimum', PerShare(cost=0.0075, min_trade_cost=3.5)),
+        ('per_trade', PerTrade(cost=10)),
+        ('per_dollar', PerDollar(cost=0.0015)),
+        ('per_contract', PerContract(cost=.01, exchange_fee=0.3)),
+    ])
+    def test_calculate_many(self, name, model):
+        sid = 1000 if isinstance(model, PerContract) else 1
+        orders = []
+        txns = []
+        # Orders at each stage of being filled, with and without commission
+        # already paid.
+        for filled, commission in [(0, 0), (230, 0), (230, 1.725), (400, 5)]:
+            order, order_txns = self.generate_order_and_txns(
+                sid, 500, [230, 170, 100],
+            )
+            order.filled = filled
+            order.commission = commission
+            orders.append(order)
+            txns.append(order_txns[1])
+
+        self.assertEqual(
+            model.calculate_many(orders, txns).tolist(),
+            [model.calculate(order, txn) for order, txn in zip(orders, txns)],
+        )
+
 
 class CommissionAlgorithmTests(WithMakeAlgo, ZiplineTestCase):
     # make sure order commissions are properly incremented
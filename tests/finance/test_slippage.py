@@ -32,6 +32,7 @@ from zipline.finance.order import Order
 from zipline.finance.slippage import (
     EquitySlippageModel,
     fill_price_worse_than_limit_price,
+    FixedSlippage,
     FutureSlippageModel,
     SlippageModel,
     VolatilityVolumeShare,
@@ -68,7 +69,7 @@ class SlippageTestCase(WithCreateBarData,
     SIM_PARAMS_DATA_FREQUENCY = 'minute'
     SIM_PARAMS_EMISSION_RATE = 'daily'
 
-    ASSET_FINDER_EQUITY_SIDS = (133,)
+    ASSET_FINDER_EQUITY_SIDS = (133, 134, 135)
     ASSET_FINDER_EQUITY_START_DATE = pd.Timestamp('2006-01-05', tz='utc')
     ASSET_FINDER_EQUITY_END_DATE = pd.Timestamp('2006-01-07', tz='utc')
     minutes = pd.DatetimeIndex(
@@ -93,11 +94,35 @@ class SlippageTestCase(WithCreateBarData,
             },
             index=cls.minutes,
         )
+        # A thinly traded asset, whose orders hit the volume limit.
+        yield 134, pd.DataFrame(
+            {
+                'open': [3.0, 3.1, 3.2, 3.3, 3.4],
+                'high': [3.15, 3.25, 3.35, 3.45, 3.55],
+                'low': [2.85, 2.95, 3.05, 3.15, 3.25],
+                'close': [3.0, 3.1, 3.2, 3.3, 3.4],
+                'volume': [100, 100, 0, 100, 1000],
+            },
+            index=cls.minutes,
+        )
+        # An asset which does not trade in some minutes.
+        yield 135, pd.DataFrame(
+            {
+                'open': [5.0, 5.0, 4.5, 4.0, 4.5],
+                'high': [5.15, 5.15, 4.65, 4.15, 4.65],
+                'low': [4.85, 4.85, 4.35, 3.85, 4.35],
+                'close': [5.0, 4.5, 4.0, 4.5, 5.0],
+                'volume': [0, 3000, 3000, 0, 3000],
+            },
+            index=cls.minutes,
+        )
 
     @classmethod
     def init_class_fixtures(cls):
         super(SlippageTestCase, cls).init_class_fixtures()
         cls.ASSET133 = cls.asset_finder.retrieve_asset(133)
+        cls.ASSET134 = cls.asset_finder.retrieve_asset(134)
+        cls.ASSET135 = cls.asset_finder.retrieve_asset(135)
 
     def test_allowed_asset_types(self):
         # Custom equities model.
@@ -563,6 +588,123 @@ class SlippageTestCase(WithCreateBarData,
         for key, value in expected_txn.items():
             self.assertEquals(value, txn[key])
 
+    @parameterized.expand([
+        ('volume_share', VolumeShareSlippage(volume_limit=0.05)),
+        ('fixed_basis_points', FixedBasisPointsSlippage(volume_limit=0.05)),
+        ('fixed', FixedSlippage(spread=0.1)),
+    ])
+    def test_simulate_batch(self, name, slippage_model):
+        def make_orders():
+            return [
+                Order(
+                    dt=datetime.datetime(2006, 1, 5, 14, 30, tzinfo=pytz.utc),
+                    asset=self.ASSET133,
+                    id=str(i),
+                    **params
+                )
+                for i, params in enumerate((
+                    {'amount': 60, 'filled': 0},
+                    {'amount': -30, 'filled': 0, 'limit': 3.9},
+                    {'amount': 200, 'filled': 0, 'limit': 3.5},
+                    {'amount': 100, 'filled': 60},
+                    {'amount': 100, 'filled': 100},
+                    {'amount': -50, 'filled': 0},
+                ))
+            ]
+
+        for minute in self.minutes:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: minute,
+            )
+
+            expected = [
+                (order.id, txn.to_dict())
+                for order, txn in slippage_model.simulate(
+                    bar_data,
+                    self.ASSET133,
+                    make_orders(),
+                )
+            ]
+            result = [
+                (order.id, txn.to_dict())
+                for order, txn in slippage_model.simulate_batch(
+                    bar_data,
+                    [self.ASSET133],
+                    [make_orders()],
+                )
+            ]
+
+            self.assertTrue(expected)
+            self.assertEqual(result, expected)
+
+    @parameterized.expand([
+        ('volume_share', VolumeShareSlippage(volume_limit=0.05)),
+        ('fixed_basis_points', FixedBasisPointsSlippage(volume_limit=0.05)),
+        ('fixed', FixedSlippage(spread=0.1)),
+    ])
+    def test_simulate_batch_many_assets(self, name, slippage_model):
+        assets = [self.ASSET133, self.ASSET134, self.ASSET135]
+
+        def make_orders(asset):
+            return [
+                Order(
+                    dt=datetime.datetime(2006, 1, 5, 14, 30, tzinfo=pytz.utc),
+                    asset=asset,
+                    id='{}-{}'.format(asset.sid, i),
+                    **params
+                )
+                for i, params in enumerate((
+                    {'amount': 3, 'filled': 0},
+                    {'amount': -30, 'filled': 0, 'limit': 4.2},
+                    {'amount': 200, 'filled': 0, 'limit': 3.5},
+                    {'amount': 100, 'filled': 60},
+                    {'amount': -50, 'filled': 0},
+                ))
+            ]
+
+        filled_ids = set()
+        for minute in self.minutes:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: minute,
+            )
+
+            expected = [
+                (order.id, txn.to_dict())
+                for asset in assets
+                for order, txn in slippage_model.simulate(
+                    bar_data,
+                    asset,
+                    make_orders(asset),
+                )
+            ]
+            expected_volume_for_bar = slippage_model.volume_for_bar
+
+            result = [
+                (order.id, txn.to_dict())
+                for order, txn in slippage_model.simulate_batch(
+                    bar_data,
+                    assets,
+                    [make_orders(asset) for asset in assets],
+                )
+            ]
+
+            self.assertEqual(result, expected, 'minute={}'.format(minute))
+            self.assertEqual(
+                slippage_model.volume_for_bar,
+                expected_volume_for_bar,
+            )
+            filled_ids.update(order_id for order_id, _ in expected)
+
+        # Some orders of every asset are filled, but not all of them.
+        all_ids = {
+            order.id for asset in assets for order in make_orders(asset)
+        }
+        self.assertLess(filled_ids, all_ids)
+        self.assertEqual(
+            {order_id.split('-')[0] for order_id in filled_ids},
+            {str(asset.sid) for asset in assets},
+        )
+
 
 class VolumeShareSlippageTestCase(WithCreateBarData,
                                   WithSimParams,
@@ -1,4 +1,6 @@
+import empyrical as ep
 import numpy as np
+from numpy.testing import assert_allclose
 import pandas as pd
 
 from zipline import api
@@ -6,6 +8,7 @@ from zipline.assets import Equity, Future
 from zipline.assets.synthetic import make_commodity_future_info
 from zipline.data.data_portal import DataPortal
 from zipline.data.resample import MinuteResampleSessionBarReader
+from zipline.finance.ledger import ArrayPositionTracker, PositionTracker
 from zipline.testing import (
     parameter_space,
     prices_generating_returns,
@@ -1879,6 +1882,142 @@ class TestFixedReturns(WithMakeAlgo, WithWerror, ZiplineTestCase):
                 msg=field,
             )
 
+    @parameter_space(asset_type=['equity', 'future'])
+    def test_array_position_tracker(self, asset_type):
+        if asset_type == 'equity':
+            asset = self.equity
+            kwargs = {}
+        else:
+            asset = self.future
+            kwargs = {
+                'trading_calendar': self.trading_calendars[Future],
+                'data_portal': self.futures_data_portal,
+            }
+
+        # open, add to, close, and then reverse the position
+        orders = {0: 2, 100: 1, 500: -3, 800: -1}
+
+        def run(position_tracker_class):
+            snapshots = []
+
+            def initialize(context):
+                api.set_benchmark(self.equity)
+
+                api.set_slippage(
+                    us_equities=api.slippage.NoSlippage(),
+                    us_futures=api.slippage.NoSlippage(),
+                )
+                api.set_commission(
+                    us_equities=api.commission.PerShare(cost=0.01),
+                    us_futures=api.commission.NoCommission(),
+                )
+
+                context.bar_count = 0
+
+            def handle_data(context, data):
+                amount = orders.get(context.bar_count)
+                if amount is not None:
+                    api.order(asset, amount)
+                context.bar_count += 1
+
+                snapshots.append({
+                    held: (
+                        position.amount,
+                        position.cost_basis,
+                        position.last_sale_price,
+                        position.last_sale_date,
+                    )
+                    for held, position in context.portfolio.positions.items()
+                })
+
+            perf = self.run_algorithm(
+                initialize=initialize,
+                handle_data=handle_data,
+                position_tracker_class=position_tracker_class,
+                **kwargs
+            )
+            return perf, snapshots
+
+        expected_perf, expected_snapshots = run(PositionTracker)
+        perf, snapshots = run(ArrayPositionTracker)
+
+        assert_equal(snapshots, expected_snapshots)
+
+        # the order ids are random
+        ignored = ['orders', 'transactions']
+        assert_equal(
+            perf.drop(ignored, axis=1),
+            expected_perf.drop(ignored, axis=1),
+        )
+
+    def test_deferred_risk_metrics(self):
+        def initialize(context):
+            api.set_benchmark(self.equity)
+
+            api.set_slippage(api.slippage.NoSlippage())
+            api.set_commission(api.commission.NoCommission())
+
+            context.first_bar = True
+
+        def handle_data(context, data):
+            if context.first_bar:
+                api.order(self.equity, 1)
+                context.first_bar = False
+
+        default_perf = self.run_algorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+        )
+        deferred_perf = self.run_algorithm(
+            initialize=initialize,
+            handle_data=handle_data,
+            metrics_set='deferred',
+        )
+
+        assert_equal(
+            deferred_perf.columns.sort_values(),
+            default_perf.columns.sort_values(),
+        )
+        for field in ('algo_volatility',
+                      'sharpe',
+                      'sortino',
+                      'max_drawdown',
+                      'alpha',
+                      'beta'):
+            assert_equal(
+                deferred_perf[field],
+                default_perf[field],
+                msg=field,
+            )
+
+        # The alpha and beta of each session match empyrical over the returns
+        # up to that session.
+        returns = deferred_perf.returns.values
+        benchmark_returns = (
+            1 + deferred_perf.benchmark_period_return
+        ).pct_change().values
+        benchmark_returns[0] = deferred_perf.benchmark_period_return.iloc[0]
+
+        expected = np.array([
+            ep.alpha_beta_aligned(
+                returns[:session_ix + 1],
+                benchmark_returns[:session_ix + 1],
+            )
+            for session_ix in range(len(returns))
+        ])
+        assert_allclose(
+            deferred_perf.alpha.values.astype(float),
+            expected[:, 0],
+            atol=1e-12,
+            err_msg='alpha',
+        )
+        assert_allclose(
+            deferred_perf.beta.values.astype(float),
+            expected[:, 1],
+            atol=1e-12,
+            err_msg='beta',
+        )
+
     @parameter_space(
         direction=['long', 'short'],
         # checking the portfolio forces a sync; we want to ensure that the
@@ -0,0 +1,62 @@
+import empyrical as ep
+import numpy as np
+
+from zipline.finance.metrics.online import (
+    AlphaBeta,
+    ONLINE_STATISTICS,
+)
+from zipline.testing import parameter_space
+from zipline.testing.fixtures import ZiplineTestCase
+from zipline.testing.predicates import assert_equal
+
+
+class OnlineStatisticsTestCase(ZiplineTestCase):
+
+    def _simulate(self, returns, benchmark_returns):
+        """Feed ``returns`` to the online statistics session by session, with
+        a few partial values for each session before its final value, and
+        compare every result to empyrical.
+        """
+        rand = np.random.RandomState(1337)
+        daily_returns = np.full(len(returns), np.nan)
+
+        statistics = {
+            function: type_() for function, type_ in ONLINE_STATISTICS.items()
+        }
+        alpha_beta = AlphaBeta()
+
+        for session_ix, final in enumerate(returns):
+            for value in rand.normal(0, 0.01, 2).tolist() + [final]:
+                daily_returns[session_ix] = value
+                window = daily_returns[:session_ix + 1]
+
+                for function, statistic in statistics.items():
+                    assert_equal(
+                        statistic.update(session_ix, daily_returns),
+                        function(window),
+                        msg=function.__name__,
+                    )
+
+                assert_equal(
+                    alpha_beta.update(
+                        session_ix,
+                        daily_returns,
+                        benchmark_returns,
+                    ),
+                    tuple(ep.alpha_beta_aligned(
+                        window,
+                        benchmark_returns[:session_ix + 1],
+                    )),
+                )
+
+    @parameter_space(seed=[1, 2, 3], num_sessions=[1, 2, 30])
+    def test_matches_empyrical(self, seed, num_sessions):
+        rand = np.random.RandomState(seed)
+        returns = rand.normal(0, 0.01, num_sessions)
+        returns[rand.uniform(size=num_sessions) < 0.1] = np.nan
+        self._simulate(returns, rand.normal(0, 0.01, num_sessions))
+
+    def test_constant_returns(self):
+        # Flat returns give exactly zero volatility and drawdown, and an
+        # undefined beta against a flat benchmark.
+        self._simulate(np.zeros(10), np.full(10, 0.001))
@@ -360,7 +360,7 @@ class USEquityPricingLoaderTestCase(WithAdjustmentReader,
                     )
         return price_adjustments, volume_adjustments
 
-    def test_load_adjustments_from_sqlite(self):
+    def test_load_adjustments(self):
         columns = [USEquityPricing.close, USEquityPricing.volume]
         query_days = self.calendar_days_between(
             TEST_QUERY_START,
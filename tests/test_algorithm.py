@@ -1718,6 +1718,72 @@ def handle_data(context, data):
             )
         assert_equal(multi_stats, batch_stats)
 
+    def test_order_target_portfolio_matches_order_target_percent(self):
+        weights = [[0.3, 0.5], [0.5, 0.2], [0.0, 0.4]]
+
+        multi_blotter = RecordBatchBlotter()
+        multi_test_algo = self.make_algo(
+            script=dedent("""\
+                from zipline.api import sid, order_target_percent
+
+
+                def initialize(context):
+                    context.assets = [sid(0), sid(3)]
+                    context.bar = 0
+
+                def handle_data(context, data):
+                    weights = {weights}
+                    if context.bar < len(weights):
+                        it = zip(context.assets, weights[context.bar])
+                        for asset, weight in it:
+                            order_target_percent(asset, weight)
+
+                    context.bar += 1
+
+            """).format(weights=weights),
+            blotter=multi_blotter,
+        )
+        multi_stats = multi_test_algo.run()
+        self.assertFalse(multi_blotter.order_batch_called)
+
+        batch_blotter = RecordBatchBlotter()
+        batch_test_algo = self.make_algo(
+            script=dedent("""\
+                import pandas as pd
+
+                from zipline.api import sid, order_target_portfolio
+
+
+                def initialize(context):
+                    context.assets = [sid(0), sid(3)]
+                    context.bar = 0
+
+                def handle_data(context, data):
+                    weights = {weights}
+                    if context.bar < len(weights):
+                        orders = order_target_portfolio(pd.Series(
+                            index=context.assets, data=weights[context.bar]
+                        ))
+                        for o in orders:
+                            assert o is not None, "An order is None"
+
+                    context.bar += 1
+
+            """).format(weights=weights),
+            blotter=batch_blotter,
+        )
+        batch_stats = batch_test_algo.run()
+        self.assertTrue(batch_blotter.order_batch_called)
+
+        for stats in (multi_stats, batch_stats):
+            stats.orders = stats.orders.apply(
+                lambda orders: [toolz.dissoc(o, 'id') for o in orders]
+            )
+            stats.transactions = stats.transactions.apply(
+                lambda txns: [toolz.dissoc(txn, 'order_id') for txn in txns]
+            )
+        assert_equal(multi_stats, batch_stats)
+
     def test_batch_market_order_filters_null_orders(self):
         share_counts = [50, 0]
 
@@ -3085,6 +3151,74 @@ class TestTradingControls(zf.WithMakeAlgo,
         algo = self.make_algo(initialize=initialize, handle_data=handle_data)
         self.check_algo_fails(algo, 3)
 
+    def test_order_target_portfolio(self):
+        def initialize(algo, set_control):
+            algo.order_count = 0
+            set_control(algo)
+
+        def handle_data(algo, data):
+            algo.order_target_portfolio(pd.Series(algo.weights))
+            algo.order_count += 1
+
+        cases = [
+            (lambda algo: algo.set_max_order_size(max_shares=1), True),
+            (lambda algo: algo.set_max_order_size(max_notional=1.0), True),
+            (lambda algo: algo.set_max_order_size(max_shares=10 ** 9), False),
+            (
+                lambda algo: algo.set_max_order_size(
+                    asset=self.another_asset,
+                    max_shares=1,
+                ),
+                False,
+            ),
+            (lambda algo: algo.set_max_position_size(max_shares=1), True),
+            (
+                lambda algo: algo.set_max_position_size(max_notional=1.0),
+                True,
+            ),
+            (
+                lambda algo: algo.set_max_position_size(max_shares=10 ** 9),
+                False,
+            ),
+            (lambda algo: algo.set_long_only(), False),
+            (
+                lambda algo: algo.set_asset_restrictions(
+                    StaticRestrictions([self.sid]),
+                ),
+                True,
+            ),
+            (
+                lambda algo: algo.set_asset_restrictions(
+                    StaticRestrictions([self.another_asset.sid]),
+                ),
+                False,
+            ),
+        ]
+
+        for set_control, fails in cases:
+            algo = self.make_algo(
+                set_control=set_control,
+                initialize=initialize,
+                handle_data=handle_data,
+            )
+            algo.weights = {self.asset: 0.1}
+            if fails:
+                # None of the orders are placed.
+                self.check_algo_fails(algo, 0)
+                self.assertEqual(algo.blotter.orders, {})
+            else:
+                self.check_algo_succeeds(algo)
+
+        # Going short in one of the assets fails with set_long_only.
+        algo = self.make_algo(
+            set_control=lambda algo: algo.set_long_only(),
+            initialize=initialize,
+            handle_data=handle_data,
+        )
+        algo.weights = {self.asset: 0.1, self.another_asset: -0.1}
+        self.check_algo_fails(algo, 0)
+        self.assertEqual(algo.blotter.orders, {})
+
     def test_register_post_init(self):
 
         def initialize(algo):
@@ -486,6 +486,27 @@ class AssetFinderTestCase(WithTradingCalendars, ZiplineTestCase):
         assets = self.asset_finder.retrieve_equities(sids)
         assert_equal(viewkeys(assets), set(sids))
 
+    def test_retrieve_from_loaded_tables(self):
+        as_of = pd.Timestamp('2013-01-01', tz='UTC')
+        self.write_assets(equities=make_simple_equity_info(
+            [0, 1, 2],
+            as_of,
+            as_of,
+            symbols=['A', 'B', 'C'],
+        ))
+        finder = self.asset_finder
+        assert_equal(finder.retrieve_asset(0).symbol, 'A')
+
+        # The first lookup loads every row of the tables it reads, so later
+        # lookups of other assets don't touch the db.
+        for table in ('equity_symbol_mappings', 'equities', 'asset_router'):
+            finder.engine.execute('DELETE FROM %s' % table)
+
+        assets = finder.retrieve_all([2, 1, 3], default_none=True)
+        assert_equal([a.sid for a in assets[:2]], [2, 1])
+        assert_equal([a.symbol for a in assets[:2]], ['C', 'B'])
+        self.assertIsNone(assets[2])
+
     def test_lookup_symbol_delimited(self):
         as_of = pd.Timestamp('2013-01-01', tz='UTC')
         frame = pd.DataFrame.from_records(
@@ -1073,6 +1094,39 @@ class AssetFinderTestCase(WithTradingCalendars, ZiplineTestCase):
                 result = result[permuted_sids]
                 assert_equal(result, expected_no_start)
 
+    def test_lifetimes_of_sids(self):
+        equities = make_rotating_equity_info(
+            num_assets=4,
+            first_start=pd.Timestamp('2015-04-01', tz='UTC'),
+            frequency=self.trading_calendar.day,
+            periods_between_starts=3,
+            asset_lifetime=5,
+        )
+        self.write_assets(equities=equities)
+        finder = self.asset_finder
+
+        dates = pd.date_range(
+            start=equities.start_date.min(),
+            end=equities.end_date.max(),
+            freq=self.trading_calendar.day,
+        )
+        for include_start_date in (True, False):
+            everything = finder.lifetimes(
+                dates,
+                include_start_date=include_start_date,
+                country_codes={'??'},
+            )
+            # 10 is not an asset, so it never exists.
+            sids = [3, 10, 0]
+            result = finder.lifetimes(
+                dates,
+                include_start_date=include_start_date,
+                country_codes={'??'},
+                sids=sids,
+            )
+            expected = everything.reindex(columns=sids, fill_value=False)
+            assert_equal(result, expected)
+
     def test_sids(self):
         # Ensure that the sids property of the AssetFinder is functioning
         self.write_assets(equities=make_simple_equity_info(
@@ -1192,6 +1246,21 @@ class AssetFinderTestCase(WithTradingCalendars, ZiplineTestCase):
         ):
             af.lookup_by_supplementary_field('ALT_ID', '100000000', None)
 
+        # Looking up many values at once gives the same answers.
+        assets = af.lookup_by_supplementary_fields(
+            'ALT_ID',
+            ['100000000', '100000002', '100000001', '100000000'],
+            dt,
+        )
+        self.assertEqual([asset.sid for asset in assets], [2, 0, 1, 2])
+
+        with self.assertRaises(ValueNotFoundForField):
+            af.lookup_by_supplementary_fields(
+                'ALT_ID',
+                ['100000001', '100000002'],
+                pd.Timestamp('2013-6-28', tz='UTC'),
+            )
+
     def test_get_supplementary_field(self):
         equities = pd.DataFrame.from_records(
             [
@@ -78,7 +78,12 @@ class WithBarDataChecks(object):
         asset1_multi_field = bar_data.current(self.ASSET1, ALL_FIELDS)
         asset2_multi_field = bar_data.current(self.ASSET2, ALL_FIELDS)
 
-        for field in ALL_FIELDS:
+        values = bar_data.current_values(
+            [self.ASSET1, self.ASSET2], ALL_FIELDS
+        )
+        self.assertEqual(values.shape, (2, len(ALL_FIELDS)))
+
+        for field_ix, field in enumerate(ALL_FIELDS):
             asset1_value = bar_data.current(self.ASSET1, field)
             asset2_value = bar_data.current(self.ASSET2, field)
 
@@ -97,6 +102,18 @@ class WithBarDataChecks(object):
             self.assert_same(asset1_multi_field[field], asset1_value)
             self.assert_same(asset2_multi_field[field], asset2_value)
 
+            field_values = bar_data.current_values(
+                [self.ASSET1, self.ASSET2], field
+            )
+            self.assert_same(field_values[0], asset1_value)
+            self.assert_same(field_values[1], asset2_value)
+            if field == 'volume':
+                # Like ``current``, volumes are integers.
+                self.assertEqual(field_values.dtype, np.int64)
+
+            self.assert_same(values[0, field_ix], asset1_value)
+            self.assert_same(values[1, field_ix], asset2_value)
+
         # also verify that bar_data doesn't expose anything bad
         for field in ["data_portal", "simulation_dt_func", "data_frequency",
                       "_views", "_universe_func", "_last_calculated_universe",
@@ -104,6 +121,18 @@ class WithBarDataChecks(object):
             with self.assertRaises(AttributeError):
                 getattr(bar_data, field)
 
+    def check_multiple_assets(self, bar_data, assets):
+        """Check that ``can_trade`` and ``is_stale`` give the same results for
+        a list of assets as for each asset on its own.
+        """
+        for method in (bar_data.can_trade, bar_data.is_stale):
+            result = method(assets)
+            self.assertEqual(list(result.index), assets)
+            self.assertEqual(
+                result.tolist(),
+                [method(asset) for asset in assets],
+            )
+
 
 class TestMinuteBarData(WithCreateBarData,
                         WithBarDataChecks,
@@ -695,6 +724,14 @@ class TestMinuteBarData(WithCreateBarData,
                 # Assert the price is adjusted for the overnight split
                 self.assertEqual(value, expected[field])
 
+            values = bar_data.current_values(
+                [self.SPLIT_ASSET], OHLCP + ['volume'],
+            )
+            assert_almost_equal(
+                values,
+                [[expected[field] for field in OHLCP + ['volume']]],
+            )
+
     def test_can_trade_restricted(self):
         """
         Test that can_trade will return False for a sid if it is restricted
@@ -727,6 +764,40 @@ class TestMinuteBarData(WithCreateBarData,
             )
             self.assertEqual(bar_data.can_trade(self.ASSET1), info[1])
 
+    def test_can_trade_and_is_stale_multiple_assets(self):
+        assets = self.asset_finder.retrieve_all(
+            self.ASSET_FINDER_EQUITY_SIDS + (6, 7),
+        )
+        rlm = HistoricalRestrictions([
+            Restriction(2, str_to_ts('2016-01-06'),
+                        RESTRICTION_STATES.FROZEN),
+        ])
+
+        regular_minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            self.equity_minute_bar_days[0],
+            self.equity_minute_bar_days[-1]
+        )
+        bts_minutes = days_at_time(
+            self.equity_minute_bar_days,
+            time(8, 45),
+            "US/Eastern"
+        )
+
+        for minute in regular_minutes[::7]:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: minute,
+                restrictions=rlm,
+            )
+            self.check_multiple_assets(bar_data, assets)
+
+        for minute in bts_minutes:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: minute,
+                restrictions=rlm,
+            )
+            with handle_non_market_minutes(bar_data):
+                self.check_multiple_assets(bar_data, assets)
+
 
 class TestMinuteBarDataFuturesCalendar(WithCreateBarData,
                                        WithBarDataChecks,
@@ -829,6 +900,8 @@ class TestMinuteBarDataFuturesCalendar(WithCreateBarData,
             self.assertEqual(info[1], series.loc[nyse_asset])
             self.assertEqual(info[2], series.loc[ice_asset])
 
+            self.check_multiple_assets(bar_data, [nyse_asset, ice_asset])
+
     def test_can_trade_delisted(self):
         """
         Test that can_trade returns False for an asset after its auto close
@@ -852,6 +925,10 @@ class TestMinuteBarDataFuturesCalendar(WithCreateBarData,
         for info in minutes_to_check:
             bar_data = self.create_bardata(simulation_dt_func=lambda: info[0])
             self.assertEqual(bar_data.can_trade(auto_closing_asset), info[1])
+            self.assertEqual(
+                bar_data.can_trade([auto_closing_asset]).tolist(),
+                [info[1]],
+            )
 
 
 class TestDailyBarData(WithCreateBarData,
@@ -1241,3 +1318,17 @@ class TestDailyBarData(WithCreateBarData,
                 restrictions=rlm
             )
             self.assertEqual(bar_data.can_trade(self.ASSET1), info[1])
+
+    def test_can_trade_and_is_stale_multiple_assets(self):
+        assets = self.asset_finder.retrieve_all(sorted(self.sids))
+        rlm = HistoricalRestrictions([
+            Restriction(2, str_to_ts('2016-01-06'),
+                        RESTRICTION_STATES.FROZEN),
+        ])
+
+        for day in self.equity_daily_bar_days:
+            bar_data = self.create_bardata(
+                simulation_dt_func=lambda: day,
+                restrictions=rlm,
+            )
+            self.check_multiple_assets(bar_data, assets)
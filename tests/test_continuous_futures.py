@@ -24,7 +24,7 @@ from numpy import (
     repeat,
     tile,
 )
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 import pandas as pd
 from pandas import Timestamp, DataFrame
 
@@ -36,6 +36,7 @@ from zipline.assets.roll_finder import (
     ROLL_DAYS_FOR_CURRENT_CONTRACT,
     VolumeRollFinder,
 )
+from zipline.data.continuous_future_reader import _stitch
 from zipline.data.minute_bars import FUTURES_MINUTES_PER_DAY
 from zipline.errors import SymbolNotFound
 import zipline.testing.fixtures as zf
@@ -1518,6 +1519,52 @@ ACD -> 2017-05-19        0        0        0        0     3000 `---1000--> 2000
             ],
         )
 
+    def test_volume_roll_reuses_active_contracts(self):
+        roll_finder = VolumeRollFinder(
+            self.trading_calendar,
+            self.asset_finder,
+            self.bcolz_future_daily_bar_reader,
+        )
+        kwargs = dict(
+            root_symbol='CL',
+            start=self.START_DATE + self.trading_calendar.day,
+            end=self.second_end_date,
+            offset=0,
+        )
+        expected = roll_finder.get_rolls(**kwargs)
+
+        class NoVolumes(object):
+            def get_value(self, sid, dt, field):
+                raise AssertionError('volumes were read again')
+
+        # Searching the same range again must not read any volumes.
+        roll_finder.session_reader = NoVolumes()
+        self.assertEqual(roll_finder.get_rolls(**kwargs), expected)
+
+    def test_volume_roll_active_contract_cache_is_bounded(self):
+        roll_finder = VolumeRollFinder(
+            self.trading_calendar,
+            self.asset_finder,
+            self.bcolz_future_daily_bar_reader,
+            active_contract_cache_size=2,
+        )
+        rolls = roll_finder.get_rolls(
+            root_symbol='CL',
+            start=self.START_DATE + self.trading_calendar.day,
+            end=self.second_end_date,
+            offset=0,
+        )
+        self.assertEqual(
+            rolls,
+            self.volume_roll_finder.get_rolls(
+                root_symbol='CL',
+                start=self.START_DATE + self.trading_calendar.day,
+                end=self.second_end_date,
+                offset=0,
+            ),
+        )
+        self.assertLessEqual(len(roll_finder._active_contracts), 2)
+
     def test_no_roll(self):
         # If we call 'get_rolls' with start and end dates that do not have any
         # rolls between them, we should still expect the last roll date to be
@@ -1830,6 +1877,66 @@ class OrderedContractsTestCase(zf.WithAssetFinder, zf.ZiplineTestCase):
         )
 
 
+class StitchTestCase(zf.ZiplineTestCase):
+
+    def test_contracts_are_read_over_their_active_rows(self):
+        dts = pd.date_range('2016-01-04', periods=10, tz='UTC')
+        # Two continuous futures of the same chain, offset by one contract,
+        # and one on another chain.
+        contract_sids = array([
+            [1, 2, 10],
+            [1, 2, 10],
+            [1, 2, 10],
+            [2, 3, 10],
+            [2, 3, 10],
+            [2, 3, 11],
+            [2, 3, 11],
+            [4, 5, 11],
+            [4, 5, 11],
+            [4, 5, 11],
+        ], dtype=int64)
+
+        loads = []
+
+        class Reader(object):
+            def load_raw_arrays(self, columns, start_dt, end_dt, sids):
+                loads.append((start_dt, end_dt, sids))
+                rows = dts.slice_indexer(start_dt, end_dt)
+                return [
+                    arange(len(dts))[rows, None] + 100.0 * array(sids)
+                    for column in columns
+                ]
+
+        close, sid = _stitch(
+            Reader(),
+            ['close', 'sid'],
+            dts,
+            contract_sids,
+            {'close': float, 'sid': int64},
+        )
+
+        assert_array_equal(
+            close,
+            arange(len(dts))[:, None] + 100.0 * contract_sids,
+        )
+        assert_array_equal(sid, contract_sids)
+
+        # Each contract is only read over the rows in which it is active, and
+        # contracts 4 and 5, which are active over the same rows, are read
+        # together.
+        self.assertEqual(
+            sorted((start, end, sorted(sids)) for start, end, sids in loads),
+            [
+                (dts[0], dts[2], [1]),
+                (dts[0], dts[4], [10]),
+                (dts[0], dts[6], [2]),
+                (dts[3], dts[6], [3]),
+                (dts[5], dts[9], [11]),
+                (dts[7], dts[9], [4, 5]),
+            ],
+        )
+
+
 class NoPrefetchContinuousFuturesTestCase(ContinuousFuturesTestCase):
     DATA_PORTAL_MINUTE_HISTORY_PREFETCH = 0
     DATA_PORTAL_DAILY_HISTORY_PREFETCH = 0
@@ -34,7 +34,7 @@ from zipline.testing.fixtures import (
     alias,
 )
 from zipline.testing.predicates import assert_equal
-from zipline.utils.numpy_utils import float64_dtype
+from zipline.utils.numpy_utils import float64_dtype, int64_dtype
 
 
 class DataPortalTestBase(WithDataPortal,
@@ -398,6 +398,119 @@ class DataPortalTestBase(WithDataPortal,
         ]
         assert_almost_equal(expected.values.tolist(), result)
 
+    @parameter_space(
+        data_frequency=['daily', 'minute'],
+        field=['open', 'high', 'low', 'close', 'volume', 'price'],
+    )
+    def test_get_spot_values(self, data_frequency, field):
+        calendar = self.trading_calendars[Equity]
+        sessions = self.trading_days[:4]
+        if data_frequency == 'minute':
+            assets = self.asset_finder.retrieve_all([1, 2, 3, 10000, 10001])
+            # the first minutes have gaps which need to be forward filled
+            dts = [
+                minute
+                for session in sessions
+                for minute in calendar.minutes_for_session(session)[
+                    [0, 1, 2, 5, -1]
+                ]
+            ]
+        else:
+            assets = self.asset_finder.retrieve_all([1, 2, 3])
+            dts = sessions
+
+        perspective_dt = dts[-1]
+        for dt in dts:
+            assert_almost_equal(
+                self.data_portal.get_spot_values(
+                    assets,
+                    field,
+                    dt,
+                    data_frequency,
+                ),
+                [
+                    self.data_portal.get_scalar_asset_spot_value(
+                        asset,
+                        field,
+                        dt,
+                        data_frequency,
+                    )
+                    for asset in assets
+                ],
+                err_msg='dt={}'.format(dt),
+            )
+            assert_almost_equal(
+                self.data_portal.get_spot_values(
+                    assets,
+                    field,
+                    dt,
+                    data_frequency,
+                    perspective_dt=perspective_dt,
+                ),
+                [
+                    self.data_portal.get_adjusted_value(
+                        asset,
+                        field,
+                        dt,
+                        perspective_dt,
+                        data_frequency,
+                    )
+                    for asset in assets
+                ],
+                err_msg='dt={}'.format(dt),
+            )
+
+        # Volumes are integers, like the volumes of ``get_spot_value``.
+        self.assertEqual(
+            self.data_portal.get_spot_values(
+                assets,
+                field,
+                dt,
+                data_frequency,
+            ).dtype,
+            int64_dtype if field == 'volume' else float64_dtype,
+        )
+
+        if field == 'price':
+            assert_almost_equal(
+                self.data_portal.get_spot_prices(assets, dt, data_frequency),
+                self.data_portal.get_spot_values(
+                    assets,
+                    field,
+                    dt,
+                    data_frequency,
+                ),
+            )
+
+    @parameter_space(
+        field=['open', 'high', 'low', 'close', 'volume', 'price'],
+    )
+    def test_get_spot_values_before_market_open(self, field):
+        # The futures trade before the equity market opens, e.g. at the
+        # ``before_trading_start`` minute, which is not a minute of the
+        # reindexed futures reader.
+        assets = self.asset_finder.retrieve_all([1, 2, 10000, 10001])
+        for session in self.trading_days[1:4]:
+            dt = session + Timedelta(hours=12, minutes=45)
+            assert_almost_equal(
+                self.data_portal.get_spot_values(
+                    assets,
+                    field,
+                    dt,
+                    'minute',
+                ),
+                [
+                    self.data_portal.get_scalar_asset_spot_value(
+                        asset,
+                        field,
+                        dt,
+                        'minute',
+                    )
+                    for asset in assets
+                ],
+                err_msg='dt={}'.format(dt),
+            )
+
     @parameter_space(data_frequency=['daily', 'minute'],
                      field=['close', 'price'])
     def test_get_adjustments(self, data_frequency, field):
@@ -576,6 +689,53 @@ class DataPortalTestBase(WithDataPortal,
 
         assert_equal(result, expected_result)
 
+    def test_history_cache_stats(self):
+        assets = [self.asset_finder.retrieve_asset(sid) for sid in (1, 2)]
+        minutes = self.nyse_calendar.minutes_for_session(self.trading_days[1])
+
+        def history():
+            # A bar count which isn't requested by other tests, so that the
+            # windows aren't cached yet.
+            self.data_portal.get_history_window(
+                assets=assets,
+                end_dt=minutes[30],
+                bar_count=17,
+                frequency='1m',
+                field='close',
+                data_frequency='minute',
+            )
+
+        def delta(before, after):
+            return {
+                frequency: {
+                    counter: after[frequency][counter] - value
+                    for counter, value in iteritems(counters)
+                }
+                for frequency, counters in iteritems(before)
+            }
+
+        before = self.data_portal.history_cache_stats()
+        history()
+        after_miss = self.data_portal.history_cache_stats()
+        history()
+        after_hit = self.data_portal.history_cache_stats()
+
+        no_change = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self.assertEqual(
+            delta(before, after_miss),
+            {
+                'daily': no_change,
+                'minute': {'hits': 0, 'misses': 2, 'evictions': 0},
+            },
+        )
+        self.assertEqual(
+            delta(after_miss, after_hit),
+            {
+                'daily': no_change,
+                'minute': {'hits': 2, 'misses': 0, 'evictions': 0},
+            },
+        )
+
 
 class TestDataPortal(DataPortalTestBase,
                      ZiplineTestCase):
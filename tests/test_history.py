@@ -23,6 +23,7 @@ from six import iteritems
 
 from zipline._protocol import handle_non_market_minutes, BarData
 from zipline.assets import Asset, Equity
+from zipline.data.history_loader import DailyHistoryLoader
 from zipline.errors import (
     HistoryInInitialize,
     HistoryWindowStartsBeforeData,
@@ -1979,6 +1980,96 @@ class DailyEquityHistoryTestCase(WithHistory, zf.ZiplineTestCase):
         # digits. second value should be 0.96 of its original value
         np.testing.assert_array_equal([1.882, 2.88, 4], window3)
 
+    def test_daily_adjustments_multiple_assets(self):
+        # The adjustments for all of the assets are loaded together, but
+        # each asset's window should only see its own adjustments.
+        assets = [self.SPLIT_ASSET, self.MERGER_ASSET, self.DIVIDEND_ASSET]
+        window = self.data_portal.get_history_window(
+            assets,
+            pd.Timestamp('2015-01-07', tz='UTC'),
+            3,
+            '1d',
+            'close',
+            'daily',
+        )
+
+        np.testing.assert_array_equal(window[self.SPLIT_ASSET], [0.25, 1.5, 4])
+        np.testing.assert_array_equal(
+            window[self.MERGER_ASSET],
+            [0.25, 1.5, 4],
+        )
+        np.testing.assert_array_equal(
+            window[self.DIVIDEND_ASSET],
+            [1.882, 2.88, 4],
+        )
+
+        volume_window = self.data_portal.get_history_window(
+            assets,
+            pd.Timestamp('2015-01-07', tz='UTC'),
+            3,
+            '1d',
+            'volume',
+            'daily',
+        )
+
+        np.testing.assert_array_equal(
+            volume_window[self.SPLIT_ASSET],
+            [1600, 600, 400],
+        )
+        np.testing.assert_array_equal(
+            volume_window[self.MERGER_ASSET],
+            [200, 300, 400],
+        )
+
+    def test_daily_block_windows(self):
+        loader = DailyHistoryLoader(
+            self.trading_calendar,
+            self.bcolz_equity_daily_bar_reader,
+            self.adjustment_reader,
+            self.asset_finder,
+        )
+        sessions = self.trading_calendar.sessions_in_range(
+            pd.Timestamp('2015-01-05', tz='UTC'),
+            pd.Timestamp('2015-01-07', tz='UTC'),
+        )
+
+        # Windows created together share one block.
+        (split_window, split_col), (merger_window, merger_col) = \
+            loader._ensure_sliding_windows(
+                [self.SPLIT_ASSET, self.MERGER_ASSET],
+                sessions,
+                'close',
+                False,
+            )
+        self.assertIs(split_window, merger_window)
+        self.assertEqual((split_col, merger_col), (0, 1))
+
+        # Only the asset without a window gets a new one.
+        (div_window, div_col), (split_window2, split_col2) = \
+            loader._ensure_sliding_windows(
+                [self.DIVIDEND_ASSET, self.SPLIT_ASSET],
+                sessions,
+                'close',
+                False,
+            )
+        self.assertIsNot(div_window, split_window)
+        self.assertEqual(div_col, 0)
+        self.assertIs(split_window2, split_window)
+        self.assertEqual(split_col2, 0)
+
+        window = loader.history(
+            [self.DIVIDEND_ASSET, self.MERGER_ASSET, self.SPLIT_ASSET],
+            sessions,
+            'close',
+            False,
+        )
+        np.testing.assert_array_equal(
+            window,
+            [[1.882, 0.25, 0.25],
+             [2.88, 1.5, 1.5],
+             [4, 4, 4]],
+        )
+
     def test_daily_blended_some_assets_stopped(self):
         # asset1 ends on 2016-01-30
         # asset2 ends on 2016-01-04
@@ -22,6 +22,8 @@ from zipline.finance import metrics
 from zipline.finance.trading import SimulationParameters
 from zipline.gens.tradesimulation import AlgorithmSimulator
 from zipline.testing.core import parameter_space
+from zipline.testing.predicates import assert_equal
+from zipline.utils.events import date_rules, time_rules
 import zipline.testing.fixtures as zf
 
 
@@ -124,3 +126,67 @@ def initialize(context):
         # since the clock only ever emitted a single before_trading_start
         # event, we can check that the simulation_dt was properly set
         self.assertEqual(dt, algo_simulator.simulation_dt)
+
+
+class TestFastForwardIdleMinutes(zf.WithMakeAlgo, zf.ZiplineTestCase):
+
+    ASSET_FINDER_EQUITY_SIDS = (1,)
+    BENCHMARK_SID = 1
+
+    def run_algo(self, handle_data):
+        def initialize(context):
+            context.schedule_function(
+                buy,
+                date_rules.every_day(),
+                time_rules.market_open(minutes=10),
+            )
+            context.schedule_function(
+                record_price,
+                date_rules.every_day(),
+                time_rules.market_close(),
+            )
+
+        def buy(context, data):
+            context.order(context.sid(1), 10)
+
+        def record_price(context, data):
+            context.record(price=data.current(context.sid(1), 'price'))
+
+        algo = self.make_algo(initialize=initialize, handle_data=handle_data)
+
+        bar_dts = []
+        get_transactions = algo.blotter.get_transactions
+
+        def counting_get_transactions(bar_data):
+            bar_dts.append(bar_data.current_dt)
+            return get_transactions(bar_data)
+
+        algo.blotter.get_transactions = counting_get_transactions
+
+        perf = algo.run()
+        columns = ['portfolio_value', 'ending_cash', 'positions', 'price']
+        return perf[columns], bar_dts
+
+    def test_fast_forward_matches_every_bar(self):
+        result, bar_dts = self.run_algo(handle_data=None)
+        expected, all_bar_dts = self.run_algo(
+            handle_data=lambda context, data: None,
+        )
+
+        assert_equal(result, expected)
+
+        minutes = self.trading_calendar.minutes_for_sessions_in_range(
+            self.sim_params.start_session,
+            self.sim_params.end_session,
+        )
+        self.assertEqual(all_bar_dts, list(minutes))
+
+        # Without handle_data, only the minutes where the scheduled functions
+        # run and the minute after each order is placed are simulated.
+        expected_bar_dts = []
+        for session in self.sim_params.sessions:
+            session_minutes = self.trading_calendar.minutes_for_session(
+                session,
+            )
+            expected_bar_dts.extend(session_minutes[[9, 10, -1]])
+        self.assertEqual(bar_dts, expected_bar_dts)
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from lru import LRU
 from pandas import Timestamp, Timedelta
 
 from zipline.utils.cache import CachedObject, Expired, ExpiringCache
@@ -65,3 +66,81 @@ class ExpiringCacheTestCase(TestCase):
         with self.assertRaises(KeyError) as e:
             self.assertEqual(cache.get('baz', expiry_3))
         self.assertEqual(e.exception.args, ('baz',))
+
+    def test_max_bytes(self):
+        expiry = Timestamp('2014')
+        before = expiry - Timedelta('1 minute')
+
+        evicted = []
+        cache = ExpiringCache(
+            cleanup=evicted.append,
+            max_bytes=10,
+            sizeof=len,
+        )
+
+        cache.set('foo', 'aaaa', expiry)
+        cache.set('bar', 'bbbb', expiry)
+        self.assertEqual(cache.nbytes, 8)
+
+        # Using 'foo' makes 'bar' the least recently used value.
+        self.assertEqual(cache.get('foo', before), 'aaaa')
+        cache.set('baz', 'cccc', expiry)
+
+        self.assertEqual(evicted, ['bbbb'])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.nbytes, 8)
+        with self.assertRaises(KeyError):
+            cache.get('bar', before)
+        self.assertEqual(cache.get('foo', before), 'aaaa')
+        self.assertEqual(cache.get('baz', before), 'cccc')
+
+        # A value larger than the budget is kept until the next set.
+        cache.set('qux', 'd' * 20, expiry)
+        self.assertEqual(evicted, ['bbbb', 'aaaa', 'cccc'])
+        self.assertEqual(cache.get('qux', before), 'd' * 20)
+        self.assertEqual(cache.nbytes, 20)
+
+        # Replacing a value is not an eviction.
+        cache.set('qux', 'e', expiry)
+        self.assertEqual(cache.evictions, 3)
+        self.assertEqual(cache.nbytes, 1)
+
+        self.assertEqual(cache.hits, 4)
+        self.assertEqual(cache.misses, 1)
+
+    def test_counters(self):
+        expiry = Timestamp('2014')
+        cache = ExpiringCache()
+        cache.set('foo', 1, expiry)
+
+        cache.get('foo', expiry)
+        after = expiry + Timedelta('1 minute')
+        for key, dt in ('foo', after), ('bar', expiry):
+            with self.assertRaises(KeyError):
+                cache.get(key, dt)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_lru_evictions(self):
+        expiry = Timestamp('2014')
+        cache = ExpiringCache(LRU(2))
+
+        cache.set('foo', 1, expiry)
+        cache.set('bar', 2, expiry)
+        # Replacing a value is not an eviction.
+        cache.set('bar', 3, expiry)
+        self.assertEqual(cache.evictions, 0)
+
+        cache.set('baz', 4, expiry)
+        self.assertEqual(cache.evictions, 1)
+        with self.assertRaises(KeyError):
+            cache.get('foo', expiry)
+        self.assertEqual(cache.get('baz', expiry), 4)
+
+    def test_max_bytes_requires_sizeof(self):
+        with self.assertRaises(ValueError):
+            ExpiringCache(max_bytes=10)
+        with self.assertRaises(ValueError):
+            ExpiringCache({}, max_bytes=10, sizeof=len)
@@ -337,7 +337,22 @@ def zipline_magic(line, cell=None):
     default=True,
     help='Print progress information to the terminal.'
 )
-def ingest(bundle, assets_version, show_progress):
+@click.option(
+    '-j',
+    '--jobs',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of processes to use to parse the data, for bundles'
+    ' which support parallel ingestion.',
+)
+@click.option(
+    '--incremental/--no-incremental',
+    default=False,
+    help='Append the sessions since the most recent ingestion instead of'
+    ' ingesting all of the history again.',
+)
+def ingest(bundle, assets_version, show_progress, jobs, incremental):
     """Ingest the data for the given bundle.
     """
     bundles_module.ingest(
@@ -346,6 +361,8 @@ def ingest(bundle, assets_version, show_progress):
         pd.Timestamp.utcnow(),
         assets_version,
         show_progress,
+        jobs=jobs,
+        incremental=incremental,
     )
 
 
@@ -29,7 +29,7 @@ from zipline.assets import (
 )
 from zipline.assets._assets cimport Asset, Future
 from zipline.assets.continuous_futures import ContinuousFuture
-from zipline.utils.pandas_utils import normalize_date
+from zipline.data.data_portal import OHLCVP_FIELDS
 from zipline.zipline_warnings import ZiplineDeprecationWarning
 
 
@@ -427,6 +427,98 @@ cdef class BarData:
 
                 return pd.DataFrame(data)
 
+    @check_parameters(('assets', 'fields'),
+                      ((Asset, ContinuousFuture) + string_types, string_types))
+    def current_values(self, assets, fields):
+        """
+        Returns the current value of the given assets for the given fields
+        at the current simulation time as NumPy arrays.
+
+        This gives the same values as ``current(assets, fields).values``
+        without building a pandas object.
+
+        Parameters
+        ----------
+        assets : Asset or iterable of Assets
+        fields : str or iterable[str].
+            Valid values are: "price",
+            "last_traded", "open", "high", "low", "close", "volume", or column
+            names in files read by ``fetch_csv``.
+
+        Returns
+        -------
+        current_values : np.ndarray
+            If a single field is passed in, a 1d array with the value of each
+            asset, aligned with ``assets``. If a list of fields is passed in,
+            a 2d array with a row for each asset and a column for each field.
+
+        Notes
+        -----
+        The "price", "open", "high", "low", "close" and "volume" fields are
+        read for all of the assets at once. Volumes are returned as integers
+        and the other fields as floats. Other fields are read one asset at a
+        time, like ``current`` does. When a list of fields is passed in, the
+        columns share a dtype, e.g. volumes are floats when they are read
+        with prices.
+
+        See Also
+        --------
+        current
+        """
+        if _is_iterable(assets):
+            assets = list(assets)
+        else:
+            assets = [assets]
+
+        dt = self._get_current_minute()
+        if self._adjust_minutes:
+            perspective_dt = self.simulation_dt_func()
+        else:
+            perspective_dt = None
+
+        if not _is_iterable(fields):
+            return self._current_values(assets, fields, dt, perspective_dt)
+
+        values = [
+            self._current_values(assets, field, dt, perspective_dt)
+            for field in fields
+        ]
+        if not values:
+            return np.empty((len(assets), 0))
+        return np.column_stack(values)
+
+    cdef _current_values(self, list assets, field, dt, perspective_dt):
+        data_portal = self.data_portal
+
+        if field in OHLCVP_FIELDS:
+            return data_portal.get_spot_values(
+                assets,
+                field,
+                dt,
+                self.data_frequency,
+                perspective_dt=perspective_dt,
+            )
+
+        if perspective_dt is None:
+            values = data_portal.get_spot_value(
+                assets,
+                field,
+                dt,
+                self.data_frequency,
+            )
+        else:
+            values = [
+                data_portal.get_adjusted_value(
+                    asset,
+                    field,
+                    dt,
+                    perspective_dt,
+                    self.data_frequency,
+                )
+                for asset in assets
+            ]
+        return np.array(values)
+
     @check_parameters(('continuous_future',),
                       (ContinuousFuture,))
     def current_chain(self, continuous_future):
@@ -481,13 +573,14 @@ cdef class BarData:
                 assets, dt, adjusted_dt, data_portal
             )
         else:
-            tradeable = [
-                self._can_trade_for_asset(
-                    asset, dt, adjusted_dt, data_portal
-                )
-                for asset in assets
-            ]
-            return pd.Series(data=tradeable, index=assets, dtype=bool)
+            assets = list(assets)
+            return pd.Series(
+                data=self._can_trade_for_assets(
+                    assets, dt, adjusted_dt, data_portal
+                ),
+                index=assets,
+                dtype=bool,
+            )
 
     cdef bool _can_trade_for_asset(self, asset, dt, adjusted_dt, data_portal):
         cdef object session_label
@@ -524,6 +617,96 @@ cdef class BarData:
             )
         )
 
+    cdef _can_trade_for_assets(self, list assets, dt, adjusted_dt,
+                               data_portal):
+        """
+        ``_can_trade_for_asset`` for many assets at once.
+
+        Returns
+        -------
+        tradeable : np.ndarray[bool]
+            Whether each asset can be traded, aligned with ``assets``.
+        """
+        cdef object session_label
+        cdef object dt_to_use_for_exchange_check
+        cdef dict exchange_is_open
+
+        if not assets:
+            return np.zeros(0, dtype=bool)
+
+        tradeable = ~np.asarray(
+            self._is_restricted(assets, adjusted_dt),
+            dtype=bool,
+        )
+
+        session_label = self._trading_calendar.minute_to_session_label(dt)
+        tradeable &= self._is_alive_for_session(assets, session_label)
+
+        auto_close_dates = pd.DatetimeIndex([
+            asset.auto_close_date for asset in assets
+        ])
+        tradeable &= ~(
+            auto_close_dates.notnull() &
+            (session_label.value > auto_close_dates.asi8)
+        )
+
+        if not self._daily_mode:
+            # Find the next market minute for this calendar, and check if
+            # the exchange of each asset is open at that minute. Each
+            # exchange only needs to be checked once.
+            if self._trading_calendar.is_open_on_minute(dt):
+                dt_to_use_for_exchange_check = dt
+            else:
+                dt_to_use_for_exchange_check = \
+                    self._trading_calendar.next_open(dt)
+
+            exchange_is_open = {}
+            for ix in np.flatnonzero(tradeable):
+                asset = assets[ix]
+                try:
+                    is_open = exchange_is_open[asset.exchange]
+                except KeyError:
+                    is_open = exchange_is_open[asset.exchange] = \
+                        asset.is_exchange_open(dt_to_use_for_exchange_check)
+                tradeable[ix] = is_open
+
+        # is there a last price?
+        ixs = np.flatnonzero(tradeable)
+        if len(ixs):
+            tradeable[ixs] = ~np.isnan(
+                data_portal.get_spot_values(
+                    [assets[ix] for ix in ixs],
+                    "price",
+                    adjusted_dt,
+                    self.data_frequency,
+                )
+            )
+
+        return tradeable
+
+    cdef _is_alive_for_session(self, list assets, session_label):
+        """
+        ``Asset.is_alive_for_session`` for many assets at once.
+
+        Returns
+        -------
+        is_alive : np.ndarray[bool]
+            Whether each asset is alive for ``session_label``, aligned with
+            ``assets``.
+        """
+        start_dates = np.array(
+            [asset.start_date.value for asset in assets],
+            dtype=np.int64,
+        )
+        end_dates = np.array(
+            [asset.end_date.value for asset in assets],
+            dtype=np.int64,
+        )
+        return (
+            (start_dates <= session_label.value) &
+            (session_label.value <= end_dates)
+        )
+
     @check_parameters(('assets',), (Asset,))
     def is_stale(self, assets):
         """
@@ -557,15 +740,17 @@ cdef class BarData:
                 assets, dt, adjusted_dt, data_portal
             )
         else:
-            return pd.Series(data={
-                asset: self._is_stale_for_asset(
-                    asset, dt, adjusted_dt, data_portal
-                )
-                for asset in assets
-            })
+            assets = list(assets)
+            return pd.Series(
+                data=self._is_stale_for_assets(
+                    assets, dt, adjusted_dt, data_portal
+                ),
+                index=assets,
+                dtype=bool,
+            )
 
     cdef bool _is_stale_for_asset(self, asset, dt, adjusted_dt, data_portal):
-        session_label = normalize_date(dt) # FIXME
+        session_label = self._trading_calendar.minute_to_session_label(dt)
 
         if not asset.is_alive_for_session(session_label):
             return False
@@ -586,6 +771,48 @@ cdef class BarData:
 
             return not (last_traded_dt is pd.NaT)
 
+    cdef _is_stale_for_assets(self, list assets, dt, adjusted_dt,
+                              data_portal):
+        """
+        ``_is_stale_for_asset`` for many assets at once.
+
+        Returns
+        -------
+        is_stale : np.ndarray[bool]
+            Whether each asset is stale, aligned with ``assets``.
+        """
+        session_label = self._trading_calendar.minute_to_session_label(dt)
+        is_stale = self._is_alive_for_session(assets, session_label)
+
+        # Assets which traded in the current bar are not stale.
+        ixs = np.flatnonzero(is_stale)
+        if len(ixs):
+            is_stale[ixs] = ~(
+                data_portal.get_spot_values(
+                    [assets[ix] for ix in ixs],
+                    "volume",
+                    adjusted_dt,
+                    self.data_frequency,
+                ) > 0
+            )
+
+        # We need to distinguish between if the other assets have ever
+        # traded (stale = True) or have never traded (stale = False).
+        ixs = np.flatnonzero(is_stale)
+        if len(ixs):
+            last_traded_dts = data_portal.get_spot_value(
+                [assets[ix] for ix in ixs],
+                "last_traded",
+                adjusted_dt,
+                self.data_frequency,
+            )
+            is_stale[ixs] = [
+                last_traded_dt is not pd.NaT
+                for last_traded_dt in last_traded_dts
+            ]
+
+        return is_stale
+
     @check_parameters(('assets', 'fields', 'bar_count',
                        'frequency'),
                       ((Asset, ContinuousFuture) + string_types, string_types,
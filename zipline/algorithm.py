@@ -26,6 +26,7 @@ from itertools import chain, repeat
 
 from six import (
     exec_,
+    get_unbound_function,
     iteritems,
     itervalues,
     string_types,
@@ -82,6 +83,7 @@ from zipline.finance.asset_restrictions import (
 )
 from zipline.assets import Asset, Equity, Future
 from zipline.gens.tradesimulation import AlgorithmSimulator
+from zipline.finance.ledger import PositionTracker
 from zipline.finance.metrics import MetricsTracker, load as load_metrics_set
 from zipline.pipeline import Pipeline
 from zipline.pipeline.engine import (
@@ -205,6 +207,11 @@ class TradingAlgorithm(object):
         default: 'zipline'
     adjustment_reader : AdjustmentReader
         The interface to the adjustments.
+    position_tracker_class : type, optional
+        The type of position tracker used by the ledger. Pass
+        :class:`~zipline.finance.ledger.ArrayPositionTracker` to store the
+        positions in arrays, which is faster for large portfolios.
+        default: :class:`~zipline.finance.ledger.PositionTracker`
     """
 
     def __init__(self,
@@ -231,6 +238,7 @@ class TradingAlgorithm(object):
                  capital_changes=None,
                  get_pipeline_loader=None,
                  create_event_context=None,
+                 position_tracker_class=None,
                  **initialize_kwargs):
         # List of trading controls to be used to validate orders.
         self.trading_controls = []
@@ -292,6 +300,9 @@ class TradingAlgorithm(object):
             )
 
         self.metrics_tracker = None
+        self._position_tracker_class = (
+            position_tracker_class or PositionTracker
+        )
         self._last_sync_time = pd.NaT
         self._metrics_set = metrics_set
         if self._metrics_set is None:
@@ -360,7 +371,7 @@ class TradingAlgorithm(object):
             exec_(code, self.namespace)
 
             self._initialize = self.namespace.get('initialize', noop)
-            self._handle_data = self.namespace.get('handle_data', noop)
+            self._handle_data = self.namespace.get('handle_data')
             self._before_trading_start = self.namespace.get(
                 'before_trading_start',
             )
@@ -373,9 +384,20 @@ class TradingAlgorithm(object):
             self._before_trading_start = before_trading_start
             self._analyze = analyze
 
+        # If there is no handle_data, the event never triggers so that the
+        # simulation may skip the bars where nothing else happens.
+        has_handle_data = (
+            self._handle_data is not None or
+            get_unbound_function(type(self).handle_data) is not
+            get_unbound_function(TradingAlgorithm.handle_data)
+        )
         self.event_manager.add_event(
             zipline.utils.events.Event(
-                zipline.utils.events.Always(),
+                (
+                    zipline.utils.events.Always()
+                    if has_handle_data else
+                    zipline.utils.events.Never()
+                ),
                 # We pass handle_data.__func__ to get the unbound method.
                 # We will explicitly pass the algorithm to bind it again.
                 self.handle_data.__func__,
@@ -557,6 +579,7 @@ class TradingAlgorithm(object):
             data_frequency=self.sim_params.data_frequency,
             asset_finder=self.asset_finder,
             metrics=self._metrics_set,
+            position_tracker_class=self._position_tracker_class,
         )
 
     def _create_generator(self, sim_params):
@@ -574,11 +597,16 @@ class TradingAlgorithm(object):
 
         benchmark_source = self._create_benchmark_source()
 
+        clock = self._create_clock()
+        # Work out when the scheduled functions trigger up front instead of
+        # checking every rule at every bar.
+        self.event_manager.compile(clock.all_minutes())
+
         self.trading_client = AlgorithmSimulator(
             self,
             sim_params,
             self.data_portal,
-            self._create_clock(),
+            clock,
             benchmark_source,
             self.restrictions,
             universe_func=self._calculate_universe
@@ -1864,6 +1892,181 @@ class TradingAlgorithm(object):
         target_amount = self._calculate_order_percent_amount(asset, target)
         return self._calculate_order_target_amount(asset, target_amount)
 
+    @api_method
+    @disallowed_in_before_trading_start(OrderInBeforeTradingStart())
+    @expect_types(weights=pd.Series)
+    def order_target_portfolio(self, weights):
+        """Place market orders to adjust the positions in many assets to
+        target percents of the current portfolio value.
+
+        Parameters
+        ----------
+        weights : pd.Series[Asset -> float]
+            Map from asset to the desired percentage of the portfolio value to
+            allocate to that asset. This is specified as a decimal, for
+            example: 0.50 means 50%.
+
+        Returns
+        -------
+        order_ids : list[str]
+            The unique identifiers of the orders placed. No order is placed
+            for the assets whose positions are already on target.
+
+        Notes
+        -----
+        This places the same orders as calling ``order_target_percent`` for
+        each asset in ``weights``, but the amounts are computed and the
+        trading controls are checked for all of the assets at once, and the
+        orders are passed to the blotter as one batch. Positions in assets
+        which are not in ``weights`` are left unchanged.
+
+        The trading controls are checked before any order is placed, so if
+        one of the orders violates a control, none of them are placed.
+
+        Like ``order_target_percent``, this does not take into account any
+        open orders.
+
+        See Also
+        --------
+        :func:`zipline.api.order_target_percent`
+        :func:`zipline.api.batch_market_order`
+        """
+        if not self.initialized:
+            raise OrderDuringInitialize(
+                msg="order() can only be called from within handle_data()"
+            )
+
+        can_order = np.array(
+            [self._can_order_asset(asset) for asset in weights.index],
+            dtype=bool,
+        )
+        assets = list(weights.index[can_order])
+        if not assets:
+            return []
+
+        targets = weights.values[can_order].astype(float)
+        if np.isnan(targets).any():
+            raise ValueError("Can't order a target weight of NaN.")
+
+        amounts, current_amounts, prices = \
+            self._calculate_order_target_percent_amounts(assets, targets)
+
+        # Don't bother validating or placing orders for 0 shares.
+        nonzero = np.flatnonzero(amounts)
+        assets = [assets[ix] for ix in nonzero]
+        amounts = amounts[nonzero]
+        current_amounts = current_amounts[nonzero]
+        prices = prices[nonzero]
+
+        portfolio = self.portfolio
+        dt = self.get_datetime()
+        current_data = self.trading_client.current_data
+        for control in self.trading_controls:
+            control.validate_many(assets,
+                                  amounts,
+                                  portfolio,
+                                  dt,
+                                  current_data,
+                                  current_amounts,
+                                  prices)
+
+        style = MarketOrder()
+        return self.blotter.batch_order([
+            (asset, amount, style)
+            for asset, amount in zip(assets, amounts.tolist())
+        ])
+
+    def _calculate_order_target_percent_amounts(self, assets, targets):
+        """
+        ``_calculate_order_target_percent_amount`` for many assets at once,
+        with the amounts rounded like ``round_order``.
+
+        Returns
+        -------
+        amounts : np.ndarray[int64]
+            The amount of each asset to order.
+        current_amounts : np.ndarray[int64]
+            The amount of each asset currently held.
+        prices : np.ndarray[float64]
+            The current price of each asset.
+        """
+        # Make sure the assets exist, and that there is a last price for
+        # them. See ``_calculate_order_value_amount``.
+        normalized_date = normalize_date(self.datetime)
+
+        start_dates = pd.DatetimeIndex([asset.start_date for asset in assets])
+        not_started = np.flatnonzero(normalized_date < start_dates)
+        if len(not_started):
+            asset = assets[not_started[0]]
+            raise CannotOrderDelistedAsset(
+                msg="Cannot order {0}, as it started trading on"
+                    " {1}.".format(asset.symbol, asset.start_date)
+            )
+
+        end_dates = pd.DatetimeIndex([asset.end_date for asset in assets])
+        stopped = np.flatnonzero(normalized_date > end_dates)
+        if len(stopped):
+            asset = assets[stopped[0]]
+            raise CannotOrderDelistedAsset(
+                msg="Cannot order {0}, as it stopped trading on"
+                    " {1}.".format(asset.symbol, asset.end_date)
+            )
+
+        prices = self.trading_client.current_data.current_values(
+            assets,
+            "price",
+        )
+        no_price = np.flatnonzero(np.isnan(prices))
+        if len(no_price):
+            asset = assets[no_price[0]]
+            raise CannotOrderDelistedAsset(
+                msg="Cannot order {0} on {1} as there is no last "
+                    "price for the security.".format(asset.symbol,
+                                                     self.datetime)
+            )
+
+        value_multipliers = np.array(
+            [asset.price_multiplier for asset in assets],
+            dtype=float,
+        )
+        zero_prices = np.isclose(prices, 0, rtol=10e-7, atol=10e-7)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            target_amounts = (
+                self.portfolio.portfolio_value *
+                targets /
+                (prices * value_multipliers)
+            )
+        for ix in np.flatnonzero(zero_prices):
+            if self.logger:
+                self.logger.debug(
+                    "Price of 0 for {psid}; can't infer value".format(
+                        psid=assets[ix],
+                    )
+                )
+        # Don't infer an amount from a price of 0.
+        target_amounts[zero_prices] = 0
+
+        positions = self.portfolio.positions
+        current_amounts = np.array(
+            [
+                positions[asset].amount if asset in positions else 0
+                for asset in assets
+            ],
+            dtype=np.int64,
+        )
+
+        # Vectorized ``round_order``: round to the nearest integer within
+        # .0001 of the amount, otherwise truncate towards zero.
+        amounts = target_amounts - current_amounts
+        rounded = np.round(amounts)
+        amounts = np.where(
+            np.abs(amounts - rounded) <= 1e-4,
+            rounded,
+            amounts,
+        ).astype(np.int64)
+
+        return amounts, current_amounts, prices
+
     @api_method
     @expect_types(share_counts=pd.Series)
     @expect_dtypes(share_counts=int64_dtype)
@@ -418,6 +418,43 @@ def order_target_percent(asset, target, limit_price=None, stop_price=None, style
     :func:`zipline.api.order_target_value`
     """
 
+def order_target_portfolio(weights):
+    """Place market orders to adjust the positions in many assets to
+    target percents of the current portfolio value.
+
+    Parameters
+    ----------
+    weights : pd.Series[Asset -> float]
+        Map from asset to the desired percentage of the portfolio value to
+        allocate to that asset. This is specified as a decimal, for
+        example: 0.50 means 50%.
+
+    Returns
+    -------
+    order_ids : list[str]
+        The unique identifiers of the orders placed. No order is placed
+        for the assets whose positions are already on target.
+
+    Notes
+    -----
+    This places the same orders as calling ``order_target_percent`` for
+    each asset in ``weights``, but the amounts are computed and the
+    trading controls are checked for all of the assets at once, and the
+    orders are passed to the blotter as one batch. Positions in assets
+    which are not in ``weights`` are left unchanged.
+
+    The trading controls are checked before any order is placed, so if
+    one of the orders violates a control, none of them are placed.
+
+    Like ``order_target_percent``, this does not take into account any
+    open orders.
+
+    See Also
+    --------
+    :func:`zipline.api.order_target_percent`
+    :func:`zipline.api.batch_market_order`
+    """
+
 def order_target_value(asset, target, limit_price=None, stop_price=None, style=None):
     """Place an order to adjust a position to a target value. If
     the position doesn't already exist, this is equivalent to placing a new
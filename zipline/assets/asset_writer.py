@@ -36,6 +36,7 @@ from zipline.assets.asset_db_schema import (
     version_info,
 )
 
+from zipline.utils.numpy_utils import iNaT
 from zipline.utils.preprocess import preprocess
 from zipline.utils.range import from_tuple, intersecting_ranges
 from zipline.utils.sqlite_utils import coerce_string_to_eng
@@ -289,6 +290,99 @@ def _split_symbol_mappings(df, exchanges):
     )
 
 
+def _merge_lifetimes(new, existing):
+    """Extend the lifetimes of assets with the rows already written for them.
+
+    Parameters
+    ----------
+    new : pd.DataFrame
+        The assets being written, indexed by sid, with the dates as
+        nanoseconds since the epoch.
+    existing : pd.DataFrame
+        The rows already in the database for some of the same sids, with a
+        ``sid`` column.
+
+    Returns
+    -------
+    merged : pd.DataFrame
+        ``new`` with the earliest ``start_date`` and ``first_traded`` and the
+        latest ``end_date`` and ``auto_close_date`` of the new and existing
+        rows of each sid.
+    """
+    existing = existing.set_index('sid')
+    sids = new.index.intersection(existing.index)
+    if not len(sids):
+        return new
+
+    merged = new.copy()
+    for column, latest in (('start_date', False),
+                           ('first_traded', False),
+                           ('end_date', True),
+                           ('auto_close_date', True)):
+        new_dates = merged.loc[sids, column].values.astype(np.int64)
+        old_dates = (
+            existing.loc[sids, column].fillna(iNaT).values.astype(np.int64)
+        )
+        if latest:
+            dates = np.maximum(new_dates, old_dates)
+        else:
+            # missing dates are stored as NaT, which is the smallest int64
+            dates = np.where(
+                new_dates == iNaT,
+                old_dates,
+                np.where(
+                    old_dates == iNaT,
+                    new_dates,
+                    np.minimum(new_dates, old_dates),
+                ),
+            )
+        merged.loc[sids, column] = dates
+    return merged
+
+
+def _merge_ranges(new, existing, key_columns, value_columns):
+    """Extend the date ranges of mappings with the rows already written for
+    them.
+
+    Parameters
+    ----------
+    new : pd.DataFrame
+        The mappings being written.
+    existing : pd.DataFrame
+        The mappings already in the database for the same sids.
+    key_columns : list[str]
+        The columns which identify a series of mappings, e.g. the sid.
+    value_columns : list[str]
+        The columns mapped to over the ``start_date`` to ``end_date`` range,
+        e.g. the symbol.
+
+    Returns
+    -------
+    merged : pd.DataFrame
+        The mappings of ``new`` and ``existing``, where consecutive ranges of
+        a series with the same values are merged into one range.
+    """
+    columns = key_columns + value_columns + ['start_date', 'end_date']
+    rows = pd.concat(
+        [existing[columns], new[columns]],
+        ignore_index=True,
+    ).sort_values(key_columns + ['start_date', 'end_date'], kind='mergesort')
+
+    merged = []
+    previous = None
+    for row in rows.itertuples(index=False):
+        row = row._asdict()
+        if (previous is not None and
+                all(row[c] == previous[c] for c in key_columns) and
+                all(row[c] == previous[c] for c in value_columns)):
+            previous['end_date'] = max(previous['end_date'], row['end_date'])
+            continue
+        previous = row
+        merged.append(row)
+
+    return pd.DataFrame(merged, columns=columns)
+
+
 def _dt_to_epoch_ns(dt_series):
     """Convert a timeseries into an Int64Index of nanoseconds since the epoch.
 
@@ -372,12 +466,20 @@ class AssetDBWriter(object):
     ----------
     engine : Engine or str
         An SQLAlchemy engine or path to a SQL database.
+    upsert : bool, optional
+        If True, rows already in the database for the exchanges, root symbols
+        and sids being written are replaced instead of raising an integrity
+        error. This is used to add new assets to a copy of the assets db of a
+        previous ingestion. The lifetimes of rewritten sids are extended to
+        cover both the existing and the new dates, and their symbol and
+        supplementary mappings are merged with the existing ones.
     """
     DEFAULT_CHUNK_SIZE = SQLITE_MAX_VARIABLE_NUMBER
 
     @preprocess(engine=coerce_string_to_eng(require_exists=False))
-    def __init__(self, engine):
+    def __init__(self, engine, upsert=False):
         self.engine = engine
+        self._upsert = upsert
 
     def write(self,
               equities=None,
@@ -508,6 +610,10 @@ class AssetDBWriter(object):
                     else pd.DataFrame()
                 ),
             )
+            if self._upsert:
+                data = self._merge_existing(data, conn, chunk_size)
+                self._delete_existing(data, conn, chunk_size)
+
             # Write the data to SQL.
             self._write_df_to_table(
                 exchanges_table,
@@ -542,6 +648,112 @@ class AssetDBWriter(object):
                 mapping_data=data.equities_mappings,
             )
 
+    def _read_existing(self, table, sids, txn, chunk_size):
+        """Read the rows of ``table`` for ``sids``.
+        """
+        sids = pd.unique(np.asarray(sids)).tolist()
+        rows = []
+        for start in range(0, len(sids), chunk_size):
+            rows.extend(txn.execute(
+                table.select().where(
+                    table.c.sid.in_(sids[start:start + chunk_size]),
+                ),
+            ).fetchall())
+        # Read the rows as objects so that the dates are not converted to
+        # floats when some of them are null.
+        return pd.DataFrame(
+            [dict(row) for row in rows],
+            columns=[column.name for column in table.columns],
+            dtype=object,
+        )
+
+    def _merge_existing(self, data, txn, chunk_size):
+        """Merge ``data`` with the rows already written for the same assets.
+
+        An incremental ingestion only sees the new sessions, so the assets it
+        writes start at the first new session. The lifetimes and symbol and
+        supplementary mappings of the assets are extended instead of being
+        replaced, so that their history is kept.
+        """
+        equities = _merge_lifetimes(
+            data.equities,
+            self._read_existing(
+                equities_table,
+                data.equities.index,
+                txn,
+                chunk_size,
+            ),
+        )
+        futures = _merge_lifetimes(
+            data.futures,
+            self._read_existing(
+                futures_contracts_table,
+                data.futures.index,
+                txn,
+                chunk_size,
+            ),
+        )
+
+        mappings = data.equities_mappings.rename_axis('sid').reset_index()
+        mappings = _merge_ranges(
+            mappings,
+            self._read_existing(
+                equity_symbol_mappings,
+                mappings['sid'],
+                txn,
+                chunk_size,
+            ),
+            ['sid'],
+            sorted(symbol_columns),
+        ).set_index('sid')
+
+        supplementary_mappings = data.equity_supplementary_mappings
+        if 'sid' in supplementary_mappings.columns:
+            supplementary_mappings = _merge_ranges(
+                supplementary_mappings,
+                self._read_existing(
+                    equity_supplementary_mappings_table,
+                    supplementary_mappings['sid'],
+                    txn,
+                    chunk_size,
+                ),
+                ['sid', 'field'],
+                ['value'],
+            )
+
+        return data._replace(
+            equities=equities,
+            equities_mappings=mappings,
+            futures=futures,
+            equity_supplementary_mappings=supplementary_mappings,
+        )
+
+    def _delete_existing(self, data, txn, chunk_size):
+        """Delete the rows which will be replaced by ``data``.
+        """
+        supplementary_sids = (
+            data.equity_supplementary_mappings['sid']
+            if 'sid' in data.equity_supplementary_mappings.columns else
+            ()
+        )
+        for column, keys in (
+                (exchanges_table.c.exchange, data.exchanges.index),
+                (futures_root_symbols.c.root_symbol, data.root_symbols.index),
+                (futures_contracts_table.c.sid, data.futures.index),
+                (equities_table.c.sid, data.equities.index),
+                (equity_symbol_mappings.c.sid, data.equities.index),
+                (equity_supplementary_mappings_table.c.sid,
+                 supplementary_sids),
+                (asset_router.c.sid, data.futures.index),
+                (asset_router.c.sid, data.equities.index)):
+            keys = pd.unique(np.asarray(keys)).tolist()
+            for start in range(0, len(keys), chunk_size):
+                txn.execute(
+                    column.table.delete().where(
+                        column.in_(keys[start:start + chunk_size]),
+                    ),
+                )
+
     def _write_df_to_table(
         self,
         tbl,
@@ -17,6 +17,7 @@ import array
 import binascii
 from collections import deque, namedtuple
 from functools import partial
+from itertools import compress
 from numbers import Integral
 from operator import itemgetter, attrgetter
 import struct
@@ -29,13 +30,11 @@ from six import with_metaclass, string_types, viewkeys, iteritems
 import sqlalchemy as sa
 from toolz import (
     compose,
-    concat,
     concatv,
     curry,
     groupby,
-    merge,
-    partition_all,
     sliding_window,
+    unique,
     valmap,
 )
 from toolz.curried import operator as op
@@ -66,7 +65,6 @@ from .asset_writer import (
     split_delimited_symbol,
     asset_db_table_names,
     symbol_columns,
-    SQLITE_MAX_VARIABLE_NUMBER,
 )
 from .asset_db_schema import (
     ASSET_DB_VERSION
@@ -76,7 +74,7 @@ from zipline.utils.functional import invert
 from zipline.utils.memoize import lazyval
 from zipline.utils.numpy_utils import as_column
 from zipline.utils.preprocess import preprocess
-from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_eng
+from zipline.utils.sqlite_utils import coerce_string_to_eng
 
 log = Logger('assets.py')
 
@@ -189,6 +187,99 @@ def build_grouped_ownership_map(table,
     }
 
 
+class OwnershipIndex(object):
+    """Sorted interval arrays over an ownership map, used to find the owners
+    of many keys on a date at once.
+
+    Parameters
+    ----------
+    ownership_map : dict[any -> list[OwnershipPeriod]]
+        The ownership map to index.
+
+    Notes
+    -----
+    The periods are stored sorted by key and then by start date. Start dates
+    are replaced by their rank among all of the start dates, so that a
+    (key, date) pair can be encoded as a single integer and every query can
+    be answered with one ``searchsorted``.
+    """
+    def __init__(self, ownership_map):
+        self._key_ixs = key_ixs = {}
+        self._ambiguous = ambiguous = np.zeros(len(ownership_map), dtype=bool)
+
+        key_col, start_col, end_col, sid_col = [], [], [], []
+        for key_ix, (key, owners) in enumerate(iteritems(ownership_map)):
+            key_ixs[key] = key_ix
+            owners = sorted(owners)
+            for start, end, sid, _ in owners:
+                key_col.append(key_ix)
+                start_col.append(start.value)
+                end_col.append(end.value)
+                sid_col.append(sid)
+
+            # Keys held by more than one owner at the same time, which can
+            # happen when the map spans many countries, can't be resolved
+            # from the arrays alone.
+            ambiguous[key_ix] = any(
+                b.start < a.end for a, b in zip(owners, owners[1:])
+            )
+
+        self._key_col = np.array(key_col, dtype='i8')
+        starts = np.array(start_col, dtype='i8')
+        self._end_col = np.array(end_col, dtype='i8')
+        self._sid_col = np.array(sid_col, dtype='i8')
+
+        self._unique_starts = np.unique(starts)
+        self._stride = len(self._unique_starts) + 1
+        self._encoded = (
+            self._key_col * self._stride +
+            self._unique_starts.searchsorted(starts, side='right')
+        )
+
+    def lookup(self, keys, as_of_date):
+        """Find the owner of each of ``keys`` on ``as_of_date``.
+
+        Parameters
+        ----------
+        keys : list
+            The keys to look up.
+        as_of_date : pd.Timestamp
+            The date to find the owners on.
+
+        Returns
+        -------
+        sids : np.array[int64]
+            The sid of the single owner of each key on ``as_of_date``, or -1
+            when the key has no owner on that date, is not in the map, or may
+            have more than one owner.
+        """
+        key_ixs = np.array(
+            [self._key_ixs.get(key, -1) for key in keys],
+            dtype='i8',
+        )
+        sids = np.full(len(key_ixs), -1, dtype='i8')
+        known = key_ixs != -1
+        known[known] = ~self._ambiguous[key_ixs[known]]
+        if not known.any():
+            return sids
+
+        dt = pd.Timestamp(as_of_date).value
+        query = (
+            key_ixs[known] * self._stride +
+            self._unique_starts.searchsorted(dt, side='right')
+        )
+        # The last period of the key which started on or before ``dt``.
+        locs = self._encoded.searchsorted(query, side='right') - 1
+        clipped = np.maximum(locs, 0)
+        owned = (
+            (locs >= 0) &
+            (self._key_col[clipped] == key_ixs[known]) &
+            (dt < self._end_col[clipped])
+        )
+        sids[np.flatnonzero(known)[owned]] = self._sid_col[clipped[owned]]
+        return sids
+
+
 @curry
 def _filter_kwargs(names, dict_):
     """Filter out kwargs from a dictionary.
@@ -213,6 +304,30 @@ _filter_future_kwargs = _filter_kwargs(Future._kwargnames)
 _filter_equity_kwargs = _filter_kwargs(Equity._kwargnames)
 
 
+def _locate_sids(table_sids, sids):
+    """Find the location of each of ``sids`` in a sorted array of sids.
+
+    Parameters
+    ----------
+    table_sids : np.array[int64]
+        The sorted sids to search.
+    sids : np.array[int64]
+        The sids to look up.
+
+    Returns
+    -------
+    locs : np.array[intp]
+        The location of each sid in ``table_sids``. Only meaningful where
+        ``found`` is True.
+    found : np.array[bool]
+        Whether each sid is in ``table_sids``.
+    """
+    locs = table_sids.searchsorted(sids)
+    found = locs < len(table_sids)
+    found[found] = table_sids[locs[found]] == sids[found]
+    return locs, found
+
+
 def _convert_asset_timestamp_fields(dict_):
     """
     Takes in a dict of Asset init args and converts dates to pd.Timestamps
@@ -313,7 +428,20 @@ class AssetFinder(object):
         # retrieve_asset will populate the cache on first retrieval.
         self._asset_cache = {}
         self._asset_type_cache = {}
-        self._caches = (self._asset_cache, self._asset_type_cache)
+
+        # In memory copies of the asset metadata tables, loaded in one read
+        # on first use. See `_asset_table`.
+        self._asset_tables = {}
+
+        # OwnershipIndex objects over the ownership maps, used to resolve
+        # many symbols or supplementary field values at once.
+        self._ownership_indices = {}
+        self._caches = (
+            self._asset_cache,
+            self._asset_type_cache,
+            self._asset_tables,
+            self._ownership_indices,
+        )
 
         self._future_chain_predicates = future_chain_predicates \
             if future_chain_predicates is not None else {}
@@ -424,6 +552,72 @@ class AssetFinder(object):
             value_from_row=lambda row: row.value,
         )
 
+    def _ownership_index(self, key, ownership_map):
+        """
+        Get the cached ``OwnershipIndex`` of an ownership map.
+
+        Parameters
+        ----------
+        key : hashable
+            The name of the ownership map.
+        ownership_map : dict[any -> list[OwnershipPeriod]]
+            The ownership map to index if it has not been indexed yet.
+        """
+        try:
+            return self._ownership_indices[key]
+        except KeyError:
+            pass
+        index = self._ownership_indices[key] = OwnershipIndex(ownership_map)
+        return index
+
+    def _asset_table(self, name):
+        """
+        Load all the rows of an asset metadata table into memory.
+
+        Assets are only constructed from these rows when they are requested,
+        but finding the rows of many assets no longer takes a query per
+        chunk of sids.
+
+        Parameters
+        ----------
+        name : {'asset_router', 'equities', 'futures_contracts', 'symbols'}
+            The table to load. 'symbols' is the most recent symbol of each
+            equity.
+
+        Returns
+        -------
+        sids : np.array[int64]
+            The sid of each row, sorted.
+        columns : dict[str -> np.array[object]]
+            The values of each column of the table, aligned with ``sids``.
+        """
+        try:
+            return self._asset_tables[name]
+        except KeyError:
+            pass
+
+        if name == 'symbols':
+            query = self._select_most_recent_symbols()
+        else:
+            query = sa.select([getattr(self, name)])
+        result = self.engine.execute(query)
+        names = result.keys()
+        rows = result.fetchall()
+
+        columns = {}
+        for i, column_name in enumerate(names):
+            column = columns[column_name] = np.empty(len(rows), dtype=object)
+            column[:] = [row[i] for row in rows]
+
+        sids = columns['sid'].astype('i8')
+        order = np.argsort(sids, kind='mergesort')
+        table = self._asset_tables[name] = (
+            sids[order],
+            {column_name: column[order]
+             for column_name, column in iteritems(columns)},
+        )
+        return table
+
     def lookup_asset_types(self, sids):
         """
         Retrieve asset types for a list of sids.
@@ -449,18 +643,16 @@ class AssetFinder(object):
         if not missing:
             return found
 
-        router_cols = self.asset_router.c
-
-        for assets in group_into_chunks(missing):
-            query = sa.select((router_cols.sid, router_cols.asset_type)).where(
-                self.asset_router.c.sid.in_(map(int, assets))
-            )
-            for sid, type_ in query.execute().fetchall():
-                missing.remove(sid)
-                found[sid] = self._asset_type_cache[sid] = type_
-
-            for sid in missing:
-                found[sid] = self._asset_type_cache[sid] = None
+        missing = list(missing)
+        router_sids, router_columns = self._asset_table('asset_router')
+        locs, located = _locate_sids(
+            router_sids,
+            np.array([int(sid) for sid in missing], dtype='i8'),
+        )
+        types = router_columns['asset_type']
+        for sid, loc, is_located in zip(missing, locs, located):
+            type_ = types[loc] if is_located else None
+            found[sid] = self._asset_type_cache[sid] = type_
 
         return found
 
@@ -619,15 +811,8 @@ class AssetFinder(object):
     def _select_asset_by_symbol(asset_tbl, symbol):
         return sa.select([asset_tbl]).where(asset_tbl.c.symbol == symbol)
 
-    def _select_most_recent_symbols_chunk(self, sid_group):
-        """Retrieve the most recent symbol for a set of sids.
-
-        Parameters
-        ----------
-        sid_group : iterable[int]
-            The sids to lookup. The length of this sequence must be less than
-            or equal to SQLITE_MAX_VARIABLE_NUMBER because the sids will be
-            passed in as sql bind params.
+    def _select_most_recent_symbols(self):
+        """Retrieve the most recent symbol of every equity.
 
         Returns
         -------
@@ -650,57 +835,37 @@ class AssetFinder(object):
                 op.getitem(symbol_cols),
                 symbol_columns,
             )),
-        ).where(
-            symbol_cols.sid.in_(map(int, sid_group)),
         ).order_by(
             symbol_cols.end_date.asc(),
         )
         return sa.select(inner.c).group_by(inner.c.sid)
 
-    def _lookup_most_recent_symbols(self, sids):
-        symbols = {
-            row.sid: {c: row[c] for c in symbol_columns}
-            for row in concat(
-                self.engine.execute(
-                    self._select_most_recent_symbols_chunk(sid_group),
-                ).fetchall()
-                for sid_group in partition_all(
-                    SQLITE_MAX_VARIABLE_NUMBER,
-                    sids
-                ),
-            )
-        }
-
-        if len(symbols) != len(sids):
-            raise EquitiesNotFound(
-                sids=set(sids) - set(symbols),
-                plural=True,
-            )
-        return symbols
-
     def _retrieve_asset_dicts(self, sids, asset_tbl, querying_equities):
         if not sids:
             return
 
+        sids = np.array([int(sid) for sid in sids], dtype='i8')
         if querying_equities:
-            def mkdict(row,
-                       exchanges=self.exchange_info,
-                       symbols=self._lookup_most_recent_symbols(sids)):
-                d = dict(row)
-                d['exchange_info'] = exchanges[d.pop('exchange')]
-                return merge(d, symbols[row['sid']])
-        else:
-            def mkdict(row, exchanges=self.exchange_info):
-                d = dict(row)
-                d['exchange_info'] = exchanges[d.pop('exchange')]
-                return d
-
-        for assets in group_into_chunks(sids):
-            # Load misses from the db.
-            query = self._select_assets_by_sid(asset_tbl, assets)
+            symbol_sids, symbols = self._asset_table('symbols')
+            symbol_locs, has_symbol = _locate_sids(symbol_sids, sids)
+            if not has_symbol.all():
+                raise EquitiesNotFound(
+                    sids=set(sids[~has_symbol].tolist()),
+                    plural=True,
+                )
 
-            for row in query.execute().fetchall():
-                yield _convert_asset_timestamp_fields(mkdict(row))
+        table_sids, columns = self._asset_table(asset_tbl.name)
+        locs, located = _locate_sids(table_sids, sids)
+        exchanges = self.exchange_info
+        for i in np.flatnonzero(located):
+            loc = locs[i]
+            d = {name: column[loc] for name, column in iteritems(columns)}
+            d['exchange_info'] = exchanges[d.pop('exchange')]
+            if querying_equities:
+                symbol_loc = symbol_locs[i]
+                for c in symbol_columns:
+                    d[c] = symbols[c][symbol_loc]
+            yield _convert_asset_timestamp_fields(d)
 
     def _retrieve_assets(self, sids, asset_tbl, asset_type):
         """
@@ -1015,6 +1180,59 @@ class AssetFinder(object):
             as_of_date,
         )
 
+    def _lookup_owned_symbols(self,
+                              symbols,
+                              as_of_date,
+                              fuzzy=False,
+                              country_code=None):
+        """
+        Resolve the symbols which were held by exactly one equity on
+        ``as_of_date`` with a single pass over an ``OwnershipIndex``.
+
+        Parameters
+        ----------
+        symbols : iterable
+            The symbols to resolve. Anything which is not a string is skipped.
+        as_of_date : pd.Timestamp
+            The date to resolve the symbols on.
+        fuzzy : bool, optional
+            Should fuzzy symbol matching be used?
+        country_code : str or None, optional
+            The country to limit searches to.
+
+        Returns
+        -------
+        equities : dict[str -> Equity]
+            The equity of each symbol that could be resolved this way. The
+            remaining symbols have to go through ``lookup_symbol``, which
+            resolves or rejects them.
+        """
+        if fuzzy:
+            mapping = self._choose_fuzzy_symbol_ownership_map(country_code)
+        else:
+            mapping = self._choose_symbol_ownership_map(country_code)
+        if mapping is None:
+            return {}
+
+        symbols = [
+            symbol for symbol in unique(symbols)
+            if isinstance(symbol, string_types)
+        ]
+        keys = list(map(split_delimited_symbol, symbols))
+        if fuzzy:
+            keys = [
+                company_symbol + share_class_symbol
+                for company_symbol, share_class_symbol in keys
+            ]
+
+        index = self._ownership_index(('symbol', fuzzy, country_code), mapping)
+        sids = index.lookup(keys, as_of_date)
+        owned = sids != -1
+        return dict(zip(
+            compress(symbols, owned),
+            self.retrieve_all(sids[owned].tolist()),
+        ))
+
     def lookup_symbols(self,
                        symbols,
                        as_of_date,
@@ -1027,7 +1245,9 @@ class AssetFinder(object):
 
             [finder.lookup_symbol(s, as_of, fuzzy) for s in symbols]
 
-        but potentially faster because repeated lookups are memoized.
+        but potentially faster because repeated lookups are memoized, and
+        when ``as_of_date`` is given the unambiguous symbols are resolved
+        together.
 
         Parameters
         ----------
@@ -1060,7 +1280,15 @@ class AssetFinder(object):
         if mapping is None:
             raise SymbolNotFound(symbol=symbols[0])
 
-        memo = {}
+        if as_of_date:
+            memo = self._lookup_owned_symbols(
+                symbols,
+                as_of_date,
+                fuzzy,
+                country_code,
+            )
+        else:
+            memo = {}
         out = []
         append_output = out.append
         for sym in symbols:
@@ -1139,6 +1367,61 @@ class AssetFinder(object):
         # no equity held the value on the given asof date
         raise ValueNotFoundForField(field=field_name, value=value)
 
+    def lookup_by_supplementary_fields(self, field_name, values, as_of_date):
+        """Lookup a list of equities by the value of a supplementary field.
+
+        Equivalent to::
+
+            [finder.lookup_by_supplementary_field(field_name, v, as_of_date)
+             for v in values]
+
+        but repeated lookups are memoized, and when ``as_of_date`` is given
+        the values held by a single equity are resolved together.
+
+        Parameters
+        ----------
+        field_name : str
+            The name of the supplementary field.
+        values : iterable
+            The values of the field to resolve.
+        as_of_date : pd.Timestamp or None
+            Forwarded to ``lookup_by_supplementary_field``.
+
+        Returns
+        -------
+        equities : list[Equity]
+        """
+        values = list(values)
+        memo = {}
+        if as_of_date and values:
+            unique_values = list(unique(values))
+            index = self._ownership_index(
+                ('supplementary',),
+                self.equity_supplementary_map,
+            )
+            sids = index.lookup(
+                [(field_name, value) for value in unique_values],
+                as_of_date,
+            )
+            owned = sids != -1
+            memo.update(zip(
+                compress(unique_values, owned),
+                self.retrieve_all(sids[owned].tolist()),
+            ))
+
+        out = []
+        for value in values:
+            try:
+                equity = memo[value]
+            except KeyError:
+                equity = memo[value] = self.lookup_by_supplementary_field(
+                    field_name,
+                    value,
+                    as_of_date,
+                )
+            out.append(equity)
+        return out
+
     def get_supplementary_field(
         self,
         sid,
@@ -1444,12 +1727,22 @@ class AssetFinder(object):
         if isinstance(first_identifier, Integral):
             return index
 
+        # Resolve the symbols with a single owner on ``as_of_date`` at once,
+        # then look up everything else one at a time.
+        if as_of_date:
+            owned = self._lookup_owned_symbols(index, as_of_date)
+        else:
+            owned = {}
+
         # Look up all Assets for mapping
         matches = []
         missing = []
         for identifier in index:
-            self._lookup_generic_scalar(identifier, as_of_date,
-                                        matches, missing)
+            if isinstance(identifier, string_types) and identifier in owned:
+                matches.append(owned[identifier])
+            else:
+                self._lookup_generic_scalar(identifier, as_of_date,
+                                            matches, missing)
 
         if missing:
             raise ValueError("Missing assets for identifiers: %s" % missing)
@@ -1491,14 +1784,29 @@ class AssetFinder(object):
         end = lifetimes.end
         start[np.isnan(start)] = 0  # convert missing starts to 0
         end[np.isnan(end)] = np.iinfo(int).max  # convert missing end to INTMAX
-        # Cast the results back down to int.
-        return lifetimes.astype([
+        # Cast the results back down to int, sorted by sid so that the
+        # lifetimes of a subset of sids can be found with a binary search.
+        lifetimes = lifetimes.astype([
             ('sid', 'i8'),
             ('start', 'i8'),
             ('end', 'i8'),
         ])
+        return lifetimes[np.argsort(lifetimes.sid, kind='mergesort')]
 
-    def lifetimes(self, dates, include_start_date, country_codes):
+    def _lifetimes_of(self, lifetimes, sids):
+        """
+        Select the start and end of each of ``sids`` from a recarray returned
+        by ``_compute_asset_lifetimes``. Sids which are not in ``lifetimes``
+        start after and end before every date.
+        """
+        locs, found = _locate_sids(lifetimes.sid, sids)
+        starts = np.full(len(sids), np.iinfo('i8').max, dtype='i8')
+        ends = np.full(len(sids), np.iinfo('i8').min, dtype='i8')
+        starts[found] = lifetimes.start[locs[found]]
+        ends[found] = lifetimes.end[locs[found]]
+        return starts, ends
+
+    def lifetimes(self, dates, include_start_date, country_codes, sids=None):
         """
         Compute a DataFrame representing asset lifetimes for the specified date
         range.
@@ -1517,6 +1825,10 @@ class AssetFinder(object):
             day.
         country_codes : iterable[str]
             The country codes to get lifetimes for.
+        sids : iterable[int], optional
+            The sids to get lifetimes for. Sids which are not traded in
+            ``country_codes`` never exist. By default, the lifetimes of every
+            asset traded in ``country_codes`` are computed.
 
         Returns
         -------
@@ -1545,14 +1857,34 @@ class AssetFinder(object):
                 self._compute_asset_lifetimes(country_codes)
             )
 
-        raw_dates = as_column(dates.asi8)
-        if include_start_date:
-            mask = lifetimes.start <= raw_dates
+        if sids is None:
+            sids = lifetimes.sid
+            starts = lifetimes.start
+            ends = lifetimes.end
         else:
-            mask = lifetimes.start < raw_dates
-        mask &= (raw_dates <= lifetimes.end)
+            sids = np.asarray(sids, dtype='i8')
+            starts, ends = self._lifetimes_of(lifetimes, sids)
+
+        raw_dates = dates.asi8
+        mask = np.zeros((len(raw_dates), len(sids)), dtype=bool)
+        if len(raw_dates):
+            # Only fill in the columns of assets which existed at some point
+            # in ``dates``; the rest of the matrix stays False.
+            if include_start_date:
+                alive = starts <= raw_dates[-1]
+            else:
+                alive = starts < raw_dates[-1]
+            alive &= raw_dates[0] <= ends
+
+            raw_dates = as_column(raw_dates)
+            if include_start_date:
+                alive_mask = starts[alive] <= raw_dates
+            else:
+                alive_mask = starts[alive] < raw_dates
+            alive_mask &= (raw_dates <= ends[alive])
+            mask[:, alive] = alive_mask
 
-        return pd.DataFrame(mask, index=dates, columns=lifetimes.sid)
+        return pd.DataFrame(mask, index=dates, columns=sids)
 
 
 class AssetConvertible(with_metaclass(ABCMeta)):
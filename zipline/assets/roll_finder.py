@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod
+from lru import LRU
 from six import with_metaclass
 
 # Number of days over which to compute rolls when finding the current contract
@@ -158,16 +159,46 @@ class VolumeRollFinder(RollFinder):
     """
     The CalendarRollFinder calculates contract rolls based on when
     volume activity transfers from one contract to another.
+
+    Parameters
+    ----------
+    trading_calendar : TradingCalendar
+        The calendar of the futures.
+    asset_finder : AssetFinder
+        The asset finder used to look up the contracts.
+    session_reader : SessionBarReader
+        The reader of the contracts' daily volumes.
+    active_contract_cache_size : int, optional
+        The number of active contract lookups to keep in memory.
     """
     GRACE_DAYS = 7
     THRESHOLD = 0.10
 
-    def __init__(self, trading_calendar, asset_finder, session_reader):
+    def __init__(self,
+                 trading_calendar,
+                 asset_finder,
+                 session_reader,
+                 active_contract_cache_size=10000):
         self.trading_calendar = trading_calendar
         self.asset_finder = asset_finder
         self.session_reader = session_reader
+        # The active contract of the most recently seen (front, back, dt)
+        # triples. The answer only depends on volumes before ``dt``, so it
+        # can be reused by every later roll search which crosses ``dt``.
+        self._active_contracts = LRU(active_contract_cache_size)
 
     def _active_contract(self, oc, front, back, dt):
+        key = front, back, dt
+        try:
+            return self._active_contracts[key]
+        except KeyError:
+            pass
+        active = self._active_contracts[key] = self._compute_active_contract(
+            oc, front, back, dt,
+        )
+        return active
+
+    def _compute_active_contract(self, oc, front, back, dt):
         """
         Return the active contract based on the previous trading day's volume.
 
@@ -0,0 +1,154 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+from numpy import float64, int64
+
+ADJUSTMENT_INDEX_DTYPE = np.dtype([
+    ('sid', int64),
+    ('effective_date', int64),
+    ('ratio', float64),
+])
+
+_ADJUSTMENT_INDEX_QUERY_TEMPLATE = """
+SELECT sid, effective_date, ratio FROM {0}
+"""
+
+
+def _empty_query_result():
+    return (
+        np.array([], dtype=int64),
+        np.array([], dtype=int64),
+        np.array([], dtype=float64),
+    )
+
+
+class AdjustmentIndex(object):
+    """An in memory index of the ratio adjustments of many assets.
+
+    The adjustments are stored as flat arrays sorted by sid and then by
+    effective date, along with the offset of the first adjustment of each
+    sid, so the adjustments of any asset in a date range are found with two
+    binary searches.
+
+    Parameters
+    ----------
+    sids : np.array[int64]
+        The sid of each adjustment.
+    effective_dates : np.array[int64]
+        The effective date of each adjustment, as seconds since the epoch.
+    ratios : np.array[float64]
+        The ratio of each adjustment.
+    """
+    def __init__(self, sids, effective_dates, ratios):
+        sids = np.asarray(sids, dtype=int64)
+        effective_dates = np.asarray(effective_dates, dtype=int64)
+        ratios = np.asarray(ratios, dtype=float64)
+
+        # lexsort is stable, so adjustments for the same sid and date keep
+        # the order in which they were given.
+        order = np.lexsort((effective_dates, sids))
+        self.sids = sids[order]
+        self.effective_dates = effective_dates[order]
+        self.ratios = ratios[order]
+
+        self._unique_sids, first = np.unique(self.sids, return_index=True)
+        self._offsets = np.append(first, len(self.sids)).astype(int64)
+
+    @classmethod
+    def from_sqlite(cls, conn, tablename):
+        """Load all of the adjustments in a table written by
+        ``SQLiteAdjustmentWriter``.
+
+        Parameters
+        ----------
+        conn : sqlite3.Connection
+            The connection to the adjustments db.
+        tablename : {'splits', 'mergers', 'dividends'}
+            The table to load.
+
+        Returns
+        -------
+        index : AdjustmentIndex
+            The index of the adjustments in the table.
+        """
+        rows = conn.execute(
+            _ADJUSTMENT_INDEX_QUERY_TEMPLATE.format(tablename),
+        ).fetchall()
+        table = np.array(rows, dtype=ADJUSTMENT_INDEX_DTYPE)
+        return cls(table['sid'], table['effective_date'], table['ratio'])
+
+    def __len__(self):
+        return len(self.sids)
+
+    def query(self, sids, start_date, end_date):
+        """Find the adjustments for ``sids`` effective between ``start_date``
+        and ``end_date``, inclusive.
+
+        Parameters
+        ----------
+        sids : iterable[int]
+            The sids to look up.
+        start_date : int
+            The first effective date to include, as seconds since the epoch.
+        end_date : int
+            The last effective date to include, as seconds since the epoch.
+
+        Returns
+        -------
+        sid_ixs : np.array[int64]
+            The location in ``sids`` of the asset of each adjustment.
+        effective_dates : np.array[int64]
+            The effective date of each adjustment, as seconds since the epoch.
+        ratios : np.array[float64]
+            The ratio of each adjustment.
+
+        Notes
+        -----
+        The adjustments are ordered by location in ``sids`` and then by
+        effective date.
+        """
+        sids = np.asarray(sids, dtype=int64)
+        unique_sids = self._unique_sids
+        if not len(unique_sids) or not len(sids):
+            return _empty_query_result()
+
+        locs = unique_sids.searchsorted(sids)
+        found = (locs < len(unique_sids)) & (
+            unique_sids[np.minimum(locs, len(unique_sids) - 1)] == sids
+        )
+
+        sid_ixs = []
+        rows = []
+        offsets = self._offsets
+        effective_dates = self.effective_dates
+        for sid_ix in np.flatnonzero(found):
+            loc = locs[sid_ix]
+            block_start = offsets[loc]
+            block = effective_dates[block_start:offsets[loc + 1]]
+            first = block_start + block.searchsorted(start_date, side='left')
+            last = block_start + block.searchsorted(end_date, side='right')
+            if first < last:
+                sid_ixs.append(np.full(last - first, sid_ix, dtype=int64))
+                rows.append(np.arange(first, last))
+
+        if not rows:
+            return _empty_query_result()
+
+        rows = np.concatenate(rows)
+        return (
+            np.concatenate(sid_ixs),
+            effective_dates[rows],
+            self.ratios[rows],
+        )
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABCMeta, abstractmethod, abstractproperty
+
+from pandas import DatetimeIndex
 from six import with_metaclass
 
 
@@ -143,3 +145,31 @@ class BarReader(with_metaclass(ABCMeta, object)):
             dt as a vantage point.
         """
         pass
+
+    def get_last_traded_dts(self, assets, dt):
+        """
+        Get the latest minute on or before ``dt`` in which each of ``assets``
+        traded.
+
+        The default implementation calls ``get_last_traded_dt`` once per
+        asset; readers which can answer the question for many assets at once
+        should override this.
+
+        Parameters
+        ----------
+        assets : iterable[zipline.asset.Asset]
+            The assets for which to get the last traded minute.
+        dt : pd.Timestamp
+            The minute at which to start searching for the last traded minute.
+
+        Returns
+        -------
+        last_traded : pd.DatetimeIndex
+            The dt of the last trade for each asset, aligned with ``assets``.
+            Entries for assets with no trades on or before ``dt`` are
+            ``pd.NaT``.
+        """
+        return DatetimeIndex(
+            [self.get_last_traded_dt(asset, dt) for asset in assets],
+            tz='UTC',
+        )
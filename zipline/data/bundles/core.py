@@ -1,5 +1,6 @@
 from collections import namedtuple
 import errno
+from multiprocessing import Pool
 import os
 import shutil
 import warnings
@@ -11,17 +12,16 @@ from trading_calendars import get_calendar
 from toolz import curry, complement, take
 
 from ..us_equity_pricing import (
-    BcolzDailyBarReader,
     BcolzDailyBarWriter,
     SQLiteAdjustmentReader,
     SQLiteAdjustmentWriter,
 )
-from ..minute_bars import (
-    BcolzMinuteBarReader,
-    BcolzMinuteBarWriter,
-)
+from ..minute_bars import BcolzMinuteBarWriter
+from ..resample import MinuteResampleSessionBarReader
+from .storage import BcolzBundleStorage, BundleStorage
 from zipline.assets import AssetDBWriter, AssetFinder, ASSET_DB_VERSION
 from zipline.assets.asset_db_migrations import downgrade
+from zipline.extensions import load as load_extension
 from zipline.utils.cache import (
     dataframe_cache,
     working_dir,
@@ -30,6 +30,7 @@ from zipline.utils.cache import (
 from zipline.utils.compat import mappingproxy
 from zipline.utils.input_validation import ensure_timestamp, optionally
 import zipline.utils.paths as pth
+from zipline.utils.pool import SequentialPool
 from zipline.utils.preprocess import preprocess
 
 
@@ -40,16 +41,16 @@ def asset_db_path(bundle_name, timestr, environ=None, db_version=None):
     )
 
 
-def minute_equity_path(bundle_name, timestr, environ=None):
+def minute_equity_path(bundle_name, timestr, environ=None, storage=None):
     return pth.data_path(
-        minute_equity_relative(bundle_name, timestr, environ),
+        minute_equity_relative(bundle_name, timestr, environ, storage),
         environ=environ,
     )
 
 
-def daily_equity_path(bundle_name, timestr, environ=None):
+def daily_equity_path(bundle_name, timestr, environ=None, storage=None):
     return pth.data_path(
-        daily_equity_relative(bundle_name, timestr, environ),
+        daily_equity_relative(bundle_name, timestr, environ, storage),
         environ=environ,
     )
 
@@ -61,6 +62,13 @@ def adjustment_db_path(bundle_name, timestr, environ=None):
     )
 
 
+def resampled_daily_path(bundle_name, timestr, environ=None):
+    return pth.data_path(
+        resampled_daily_relative(bundle_name, timestr, environ),
+        environ=environ,
+    )
+
+
 def cache_path(bundle_name, environ=None):
     return pth.data_path(
         cache_relative(bundle_name, environ),
@@ -72,16 +80,24 @@ def adjustment_db_relative(bundle_name, timestr, environ=None):
     return bundle_name, timestr, 'adjustments.sqlite'
 
 
+def resampled_daily_relative(bundle_name, timestr, environ=None):
+    return bundle_name, timestr, 'resampled_daily'
+
+
 def cache_relative(bundle_name, timestr, environ=None):
     return bundle_name, '.cache'
 
 
-def daily_equity_relative(bundle_name, timestr, environ=None):
-    return bundle_name, timestr, 'daily_equities.bcolz'
+def daily_equity_relative(bundle_name, timestr, environ=None, storage=None):
+    if storage is None:
+        storage = BcolzBundleStorage
+    return bundle_name, timestr, storage.daily_bars_dirname
 
 
-def minute_equity_relative(bundle_name, timestr, environ=None):
-    return bundle_name, timestr, 'minute_equities.bcolz'
+def minute_equity_relative(bundle_name, timestr, environ=None, storage=None):
+    if storage is None:
+        storage = BcolzBundleStorage
+    return bundle_name, timestr, storage.minute_bars_dirname
 
 
 def asset_db_relative(bundle_name, timestr, environ=None, db_version=None):
@@ -123,6 +139,39 @@ def from_bundle_ingest_dirname(cs):
     return pd.Timestamp(cs.replace(';', ':'))
 
 
+def _clone_bcolz_tree(src, dest):
+    """Clone a directory of bcolz ctables so that the clone may be appended
+    to without changing ``src``.
+
+    The chunks of each carray are hard-linked, except for the last one which
+    bcolz rewrites in place when appending. Everything else, including the
+    metadata of each carray, is copied.
+    """
+    for dirpath, _, filenames in os.walk(src):
+        target = os.path.join(dest, os.path.relpath(dirpath, src))
+        pth.ensure_directory(target)
+
+        linked = set()
+        if os.path.basename(dirpath) == 'data':
+            chunks = sorted(
+                (f for f in filenames if f.startswith('__')),
+                key=lambda f: int(os.path.splitext(f)[0][2:]),
+            )
+            linked.update(chunks[:-1])
+
+        for filename in filenames:
+            source_path = os.path.join(dirpath, filename)
+            dest_path = os.path.join(target, filename)
+            if filename in linked:
+                try:
+                    os.link(source_path, dest_path)
+                    continue
+                except OSError:
+                    # Fall back to copying, for example across filesystems.
+                    pass
+            shutil.copy2(source_path, dest_path)
+
+
 def ingestions_for_bundle(bundle, environ=None):
     return sorted(
         (from_bundle_ingest_dirname(ing)
@@ -139,13 +188,16 @@ RegisteredBundle = namedtuple(
      'end_session',
      'minutes_per_day',
      'ingest',
-     'create_writers']
+     'create_writers',
+     'mmap_daily_bars',
+     'storage',
+     'parallel_ingest']
 )
 
 BundleData = namedtuple(
     'BundleData',
     'asset_finder equity_minute_bar_reader equity_daily_bar_reader '
-    'adjustment_reader',
+    'adjustment_reader resampled_daily_bar_reader',
 )
 
 BundleCore = namedtuple(
@@ -228,7 +280,10 @@ def _make_bundle_core():
                  start_session=None,
                  end_session=None,
                  minutes_per_day=390,
-                 create_writers=True):
+                 create_writers=True,
+                 mmap_daily_bars=False,
+                 storage='bcolz',
+                 parallel_ingest=False):
         """Register a data bundle ingest function.
 
         Parameters
@@ -243,9 +298,11 @@ def _make_bundle_core():
               asset_db_writer : AssetDBWriter
                   The asset db writer to write into.
               minute_bar_writer : BcolzMinuteBarWriter
-                  The minute bar writer to write into.
+                  The minute bar writer to write into. This is a
+                  ``ParquetMinuteBarWriter`` for parquet bundles.
               daily_bar_writer : BcolzDailyBarWriter
-                  The daily bar writer to write into.
+                  The daily bar writer to write into. This is a
+                  ``ParquetDailyBarWriter`` for parquet bundles.
               adjustment_writer : SQLiteAdjustmentWriter
                   The adjustment db writer to write into.
               calendar : trading_calendars.TradingCalendar
@@ -278,6 +335,22 @@ def _make_bundle_core():
             Should the ingest machinery create the writers for the ingest
             function. This can be disabled as an optimization for cases where
             they are not needed, like the ``quantopian-quandl`` bundle.
+        mmap_daily_bars : bool, optional
+            Should the daily bar writer also write uncompressed, memory
+            mappable copies of the daily bar columns. This trades disk space
+            for faster daily bar reads which share memory across processes.
+            This is only supported by the 'bcolz' storage.
+        storage : str, optional
+            The name of the ``BundleStorage`` used to store the pricing data.
+            The builtin options are 'bcolz' and 'parquet'; storing the bars as
+            parquet files, which requires ``pyarrow``, lets other tools read
+            them through Apache Arrow. Default is 'bcolz'.
+        parallel_ingest : bool, optional
+            Should the ingest function be passed a ``pool`` keyword argument.
+            This is a ``multiprocessing.Pool`` when ingesting with more than
+            one job, and a ``SequentialPool`` otherwise, which the ingest
+            function may use to parse the data for each asset in parallel,
+            for example with ``zipline.utils.pool.bounded_imap``.
 
         Notes
         -----
@@ -310,6 +383,9 @@ def _make_bundle_core():
             minutes_per_day=minutes_per_day,
             ingest=f,
             create_writers=create_writers,
+            mmap_daily_bars=mmap_daily_bars,
+            storage=storage,
+            parallel_ingest=parallel_ingest,
         )
         return f
 
@@ -339,7 +415,9 @@ def _make_bundle_core():
                environ=os.environ,
                timestamp=None,
                assets_versions=(),
-               show_progress=False):
+               show_progress=False,
+               jobs=1,
+               incremental=False):
         """Ingest data for a given bundle.
 
         Parameters
@@ -355,13 +433,31 @@ def _make_bundle_core():
             Versions of the assets db to which to downgrade.
         show_progress : bool, optional
             Tell the ingest function to display the progress where possible.
+        jobs : int, optional
+            The number of processes to use to parse the data for bundles
+            registered with ``parallel_ingest=True``. The data is always
+            written by the calling process.
+        incremental : bool, optional
+            Append to the most recent ingestion of the bundle instead of
+            rewriting all of its history. The ingest function is passed the
+            session after the end of the most recent ingestion as
+            ``start_session`` and should only write the data since then.
+            Minute bars are cloned from the most recent ingestion with hard
+            links and appended to, daily bars are merged with the previous
+            daily bars, and new assets and adjustments replace the rows for
+            the same assets and dates in copies of the previous databases.
+            Only the 'bcolz' storage supports incremental ingestion.
         """
         try:
             bundle = bundles[name]
         except KeyError:
             raise UnknownBundle(name)
 
+        if jobs < 1:
+            raise ValueError('jobs must be at least 1, got %r' % jobs)
+
         calendar = get_calendar(bundle.calendar_name)
+        storage = load_extension(BundleStorage, bundle.storage)
 
         start_session = bundle.start_session
         end_session = bundle.end_session
@@ -376,6 +472,36 @@ def _make_bundle_core():
             timestamp = pd.Timestamp.utcnow()
         timestamp = timestamp.tz_convert('utc').tz_localize(None)
 
+        if incremental:
+            if not bundle.create_writers:
+                raise ValueError('Need to ingest a bundle that creates '
+                                 'writers in order to ingest incrementally.')
+            if not isinstance(storage, BcolzBundleStorage):
+                raise ValueError(
+                    "incremental ingestion is only supported by the 'bcolz' "
+                    "bundle storage, got %r" % bundle.storage,
+                )
+
+            previous = most_recent_data(name, timestamp, environ=environ)
+            previous_daily_bars = storage.daily_bar_reader(
+                daily_equity_path(
+                    name, previous, environ=environ, storage=storage,
+                ),
+            )
+            previous_end = previous_daily_bars.sessions[-1]
+            if previous_end >= end_session:
+                raise ValueError(
+                    'the most recent ingestion of bundle %r already ends on'
+                    ' %s' % (name, previous_end.date()),
+                )
+
+            # The writers cover the full history, but the ingest function
+            # only needs to write the new sessions.
+            start_session = previous_daily_bars.sessions[0]
+            ingest_start_session = calendar.next_session_label(previous_end)
+        else:
+            ingest_start_session = start_session
+
         timestr = to_bundle_ingest_dirname(timestamp)
         cachepath = cache_path(name, environ=environ)
         pth.ensure_directory(pth.data_path([name, timestr], environ=environ))
@@ -384,48 +510,103 @@ def _make_bundle_core():
                 ExitStack() as stack:
             # we use `cleanup_on_failure=False` so that we don't purge the
             # cache directory if the load fails in the middle
+            ingest_kwargs = {}
+            if bundle.parallel_ingest:
+                if jobs > 1:
+                    # Start the workers before any of the writers open their
+                    # files so that the forked processes don't inherit them.
+                    pool = Pool(jobs)
+                    stack.callback(pool.join)
+                    stack.callback(pool.terminate)
+                else:
+                    pool = SequentialPool()
+                ingest_kwargs['pool'] = pool
+
             if bundle.create_writers:
+                # Create the working directory in the data root so that
+                # committing it, and cloning a previous ingestion into it,
+                # can hard-link the files instead of copying them.
                 wd = stack.enter_context(working_dir(
-                    pth.data_path([], environ=environ))
-                )
+                    pth.data_path([], environ=environ),
+                    prefix='.ingest-',
+                    dir=pth.data_path([], environ=environ),
+                ))
                 daily_bars_path = wd.ensure_dir(
                     *daily_equity_relative(
-                        name, timestr, environ=environ,
+                        name, timestr, environ=environ, storage=storage,
                     )
                 )
-                daily_bar_writer = BcolzDailyBarWriter(
-                    daily_bars_path,
-                    calendar,
-                    start_session,
-                    end_session,
-                )
+                if incremental:
+                    daily_bar_writer = BcolzDailyBarWriter(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        write_mmap=bundle.mmap_daily_bars,
+                        previous_bars=previous_daily_bars,
+                    )
+                else:
+                    daily_bar_writer = storage.daily_bar_writer(
+                        daily_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        write_mmap=bundle.mmap_daily_bars,
+                    )
                 # Do an empty write to ensure that the daily ctables exist
                 # when we create the SQLiteAdjustmentWriter below. The
                 # SQLiteAdjustmentWriter needs to open the daily ctables so
                 # that it can compute the adjustment ratios for the dividends.
 
                 daily_bar_writer.write(())
-                minute_bar_writer = BcolzMinuteBarWriter(
-                    wd.ensure_dir(*minute_equity_relative(
-                        name, timestr, environ=environ)
-                    ),
-                    calendar,
-                    start_session,
-                    end_session,
-                    minutes_per_day=bundle.minutes_per_day,
-                )
+                minute_bars_path = wd.getpath(*minute_equity_relative(
+                    name, timestr, environ=environ, storage=storage,
+                ))
                 assets_db_path = wd.getpath(*asset_db_relative(
                     name, timestr, environ=environ,
                 ))
-                asset_db_writer = AssetDBWriter(assets_db_path)
+                adjustments_db_path = wd.getpath(*adjustment_db_relative(
+                    name, timestr, environ=environ,
+                ))
+                if incremental:
+                    _clone_bcolz_tree(
+                        minute_equity_path(
+                            name, previous, environ=environ, storage=storage,
+                        ),
+                        minute_bars_path,
+                    )
+                    minute_bar_writer = BcolzMinuteBarWriter.open(
+                        minute_bars_path,
+                        end_session=end_session,
+                    )
+                    shutil.copy2(
+                        asset_db_path(name, previous, environ=environ),
+                        assets_db_path,
+                    )
+                    shutil.copy2(
+                        adjustment_db_path(name, previous, environ=environ),
+                        adjustments_db_path,
+                    )
+                else:
+                    pth.ensure_directory(minute_bars_path)
+                    minute_bar_writer = storage.minute_bar_writer(
+                        minute_bars_path,
+                        calendar,
+                        start_session,
+                        end_session,
+                        bundle.minutes_per_day,
+                    )
+                asset_db_writer = AssetDBWriter(
+                    assets_db_path,
+                    upsert=incremental,
+                )
 
                 adjustment_db_writer = stack.enter_context(
                     SQLiteAdjustmentWriter(
-                        wd.getpath(*adjustment_db_relative(
-                            name, timestr, environ=environ)),
-                        BcolzDailyBarReader(daily_bars_path),
+                        adjustments_db_path,
+                        storage.daily_bar_reader(daily_bars_path),
                         calendar.all_sessions,
-                        overwrite=True,
+                        overwrite=not incremental,
                     )
                 )
             else:
@@ -444,11 +625,12 @@ def _make_bundle_core():
                 daily_bar_writer,
                 adjustment_db_writer,
                 calendar,
-                start_session,
+                ingest_start_session,
                 end_session,
                 cache,
                 show_progress,
                 pth.data_path([name, timestr], environ=environ),
+                **ingest_kwargs
             )
 
             for version in sorted(set(assets_versions), reverse=True):
@@ -514,24 +696,46 @@ def _make_bundle_core():
         Returns
         -------
         bundle_data : BundleData
-            The raw data readers for this bundle.
+            The raw data readers for this bundle. The
+            ``resampled_daily_bar_reader`` resamples the minute bars into
+            session bars, which are stored in the ingestion the first time
+            each asset is read.
         """
         if timestamp is None:
             timestamp = pd.Timestamp.utcnow()
         timestr = most_recent_data(name, timestamp, environ=environ)
+        bundle = bundles.get(name)
+        # The data of bundles which aren't registered in this process is read
+        # with the default storage.
+        storage = load_extension(
+            BundleStorage,
+            'bcolz' if bundle is None else bundle.storage,
+        )
+        minute_bar_reader = storage.minute_bar_reader(
+            minute_equity_path(
+                name, timestr, environ=environ, storage=storage,
+            ),
+        )
         return BundleData(
             asset_finder=AssetFinder(
                 asset_db_path(name, timestr, environ=environ),
             ),
-            equity_minute_bar_reader=BcolzMinuteBarReader(
-                minute_equity_path(name, timestr, environ=environ),
-            ),
-            equity_daily_bar_reader=BcolzDailyBarReader(
-                daily_equity_path(name, timestr, environ=environ),
+            equity_minute_bar_reader=minute_bar_reader,
+            equity_daily_bar_reader=storage.daily_bar_reader(
+                daily_equity_path(
+                    name, timestr, environ=environ, storage=storage,
+                ),
             ),
             adjustment_reader=SQLiteAdjustmentReader(
                 adjustment_db_path(name, timestr, environ=environ),
             ),
+            resampled_daily_bar_reader=MinuteResampleSessionBarReader(
+                minute_bar_reader.trading_calendar,
+                minute_bar_reader,
+                cache_path=resampled_daily_path(
+                    name, timestr, environ=environ,
+                ),
+            ),
         )
 
     @preprocess(
@@ -7,9 +7,11 @@ import sys
 from logbook import Logger, StreamHandler
 from numpy import empty
 from pandas import DataFrame, read_csv, Index, Timedelta, NaT
+from six.moves import zip
 from trading_calendars import register_calendar_alias
 
 from zipline.utils.cli import maybe_show_progress
+from zipline.utils.pool import SequentialPool, bounded_imap
 
 from . import core as bundles
 
@@ -50,7 +52,11 @@ def csvdir_equities(tframes=None, csvdir=None):
        from zipline.data.bundles import csvdir_equities, register
        register('custom-csvdir-bundle',
                 csvdir_equities(["daily", "minute"],
-                '/full/path/to/the/csvdir/directory'))
+                '/full/path/to/the/csvdir/directory'),
+                parallel_ingest=True)
+
+    Registering with ``parallel_ingest=True`` lets
+    ``zipline ingest --jobs N`` parse the csv files in ``N`` processes.
     """
 
     return CSVDIRBundle(tframes, csvdir).ingest
@@ -77,7 +83,8 @@ class CSVDIRBundle:
                end_session,
                cache,
                show_progress,
-               output_dir):
+               output_dir,
+               pool=None):
 
         csvdir_bundle(environ,
                       asset_db_writer,
@@ -91,10 +98,11 @@ class CSVDIRBundle:
                       show_progress,
                       output_dir,
                       self.tframes,
-                      self.csvdir)
+                      self.csvdir,
+                      pool)
 
 
-@bundles.register("csvdir")
+@bundles.register("csvdir", parallel_ingest=True)
 def csvdir_bundle(environ,
                   asset_db_writer,
                   minute_bar_writer,
@@ -107,7 +115,8 @@ def csvdir_bundle(environ,
                   show_progress,
                   output_dir,
                   tframes=None,
-                  csvdir=None):
+                  csvdir=None,
+                  pool=None):
     """
     Build a zipline data bundle from the directory with csv files.
     """
@@ -152,7 +161,7 @@ def csvdir_bundle(environ,
             writer = daily_bar_writer
 
         writer.write(_pricing_iter(ddir, symbols, metadata,
-                     divs_splits, show_progress),
+                     divs_splits, show_progress, pool),
                      show_progress=show_progress)
 
         # Hardcode the exchange to "CSVDIR" for all assets and (elsewhere)
@@ -168,24 +177,43 @@ def csvdir_bundle(environ,
                                 dividends=divs_splits['divs'])
 
 
-def _pricing_iter(csvdir, symbols, metadata, divs_splits, show_progress):
+def _pricing_path(csvdir, files, symbol):
+    try:
+        fname = [fname for fname in files
+                 if '%s.csv' % symbol in fname][0]
+    except IndexError:
+        raise ValueError("%s.csv file is not in %s" % (symbol, csvdir))
+
+    return os.path.join(csvdir, fname)
+
+
+def _read_pricing(path):
+    # This runs in the ingest pool's worker processes, so it must be a
+    # module-scope function.
+    return read_csv(path,
+                    parse_dates=[0],
+                    infer_datetime_format=True,
+                    index_col=0).sort_index()
+
+
+def _pricing_iter(csvdir, symbols, metadata, divs_splits, show_progress,
+                  pool=None):
+    if pool is None:
+        pool = SequentialPool()
+
     with maybe_show_progress(symbols, show_progress,
                              label='Loading custom pricing data: ') as it:
         files = os.listdir(csvdir)
-        for sid, symbol in enumerate(it):
+        # Parse the files in the pool while the writer drains the parsed
+        # frames in sid order.
+        frames = bounded_imap(
+            pool,
+            _read_pricing,
+            (_pricing_path(csvdir, files, symbol) for symbol in symbols),
+        )
+        for sid, (symbol, dfr) in enumerate(zip(it, frames)):
             logger.debug('%s: sid %s' % (symbol, sid))
 
-            try:
-                fname = [fname for fname in files
-                         if '%s.csv' % symbol in fname][0]
-            except IndexError:
-                raise ValueError("%s.csv file is not in %s" % (symbol, csvdir))
-
-            dfr = read_csv(os.path.join(csvdir, fname),
-                           parse_dates=[0],
-                           infer_datetime_format=True,
-                           index_col=0).sort_index()
-
             start_date = dfr.index[0]
             end_date = dfr.index[-1]
 
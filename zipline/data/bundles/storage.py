@@ -0,0 +1,184 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from abc import ABCMeta, abstractmethod, abstractproperty
+
+from six import with_metaclass
+
+from zipline.extensions import extensible, register
+from ..minute_bars import BcolzMinuteBarReader, BcolzMinuteBarWriter
+from ..parquet_bars import (
+    ParquetDailyBarReader,
+    ParquetDailyBarWriter,
+    ParquetMinuteBarReader,
+    ParquetMinuteBarWriter,
+)
+from ..us_equity_pricing import BcolzDailyBarReader, BcolzDailyBarWriter
+
+
+@extensible
+class BundleStorage(with_metaclass(ABCMeta)):
+    """The on-disk format used for the pricing data of an ingested bundle.
+
+    Storage backends are registered with
+    ``zipline.extensions.register(BundleStorage, name)`` and selected per
+    bundle with the ``storage`` argument to
+    :func:`zipline.data.bundles.register`. Assets and adjustments are always
+    stored in sqlite.
+    """
+
+    @abstractproperty
+    def daily_bars_dirname(self):
+        """The name of the directory, inside of an ingestion, holding the
+        daily bars.
+        """
+        raise NotImplementedError('daily_bars_dirname')
+
+    @abstractproperty
+    def minute_bars_dirname(self):
+        """The name of the directory, inside of an ingestion, holding the
+        minute bars.
+        """
+        raise NotImplementedError('minute_bars_dirname')
+
+    @abstractmethod
+    def daily_bar_writer(self,
+                         path,
+                         calendar,
+                         start_session,
+                         end_session,
+                         write_mmap=False):
+        """Create a writer for the daily bars stored at ``path``.
+        """
+        raise NotImplementedError('daily_bar_writer')
+
+    @abstractmethod
+    def minute_bar_writer(self,
+                          path,
+                          calendar,
+                          start_session,
+                          end_session,
+                          minutes_per_day):
+        """Create a writer for the minute bars stored at ``path``.
+        """
+        raise NotImplementedError('minute_bar_writer')
+
+    @abstractmethod
+    def daily_bar_reader(self, path):
+        """Create a reader for the daily bars stored at ``path``.
+
+        Notes
+        -----
+        The reader must not read any data until it is first used, because
+        ingest creates the adjustment writer's reader before the daily bars
+        have been written.
+        """
+        raise NotImplementedError('daily_bar_reader')
+
+    @abstractmethod
+    def minute_bar_reader(self, path):
+        """Create a reader for the minute bars stored at ``path``.
+        """
+        raise NotImplementedError('minute_bar_reader')
+
+
+@register(BundleStorage, 'bcolz')
+class BcolzBundleStorage(BundleStorage):
+    """Store bundle pricing data in bcolz ctables.
+    """
+    daily_bars_dirname = 'daily_equities.bcolz'
+    minute_bars_dirname = 'minute_equities.bcolz'
+
+    def daily_bar_writer(self,
+                         path,
+                         calendar,
+                         start_session,
+                         end_session,
+                         write_mmap=False):
+        return BcolzDailyBarWriter(
+            path,
+            calendar,
+            start_session,
+            end_session,
+            write_mmap=write_mmap,
+        )
+
+    def minute_bar_writer(self,
+                          path,
+                          calendar,
+                          start_session,
+                          end_session,
+                          minutes_per_day):
+        return BcolzMinuteBarWriter(
+            path,
+            calendar,
+            start_session,
+            end_session,
+            minutes_per_day=minutes_per_day,
+        )
+
+    def daily_bar_reader(self, path):
+        return BcolzDailyBarReader(path)
+
+    def minute_bar_reader(self, path):
+        return BcolzMinuteBarReader(path)
+
+
+@register(BundleStorage, 'parquet')
+class ParquetBundleStorage(BundleStorage):
+    """Store bundle pricing data in Apache Parquet files.
+
+    Parquet files can be read zero-copy through Apache Arrow by tools outside
+    of zipline. This requires ``pyarrow``.
+    """
+    daily_bars_dirname = 'daily_equities.parquet'
+    minute_bars_dirname = 'minute_equities.parquet'
+
+    def daily_bar_writer(self,
+                         path,
+                         calendar,
+                         start_session,
+                         end_session,
+                         write_mmap=False):
+        if write_mmap:
+            raise ValueError(
+                'memory mapped daily bars are only supported by the bcolz '
+                'bundle storage',
+            )
+        return ParquetDailyBarWriter(
+            path,
+            calendar,
+            start_session,
+            end_session,
+        )
+
+    def minute_bar_writer(self,
+                          path,
+                          calendar,
+                          start_session,
+                          end_session,
+                          minutes_per_day):
+        return ParquetMinuteBarWriter(
+            path,
+            calendar,
+            start_session,
+            end_session,
+            minutes_per_day=minutes_per_day,
+        )
+
+    def daily_bar_reader(self, path):
+        return ParquetDailyBarReader(path)
+
+    def minute_bar_reader(self, path):
+        return ParquetMinuteBarReader(path)
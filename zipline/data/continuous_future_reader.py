@@ -1,8 +1,148 @@
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
+from six import iteritems
+
 from zipline.data.session_bars import SessionBarReader
 
 
+def _rolls_by_asset(roll_finders, assets, start, end):
+    """Find the rolls of each of ``assets`` between ``start`` and ``end``,
+    computing the rolls of each distinct contract chain only once.
+    """
+    rolls_by_chain = {}
+    rolls_by_asset = {}
+    for asset in assets:
+        key = asset.roll_style, asset.root_symbol, asset.offset
+        try:
+            rolls = rolls_by_chain[key]
+        except KeyError:
+            rf = roll_finders[asset.roll_style]
+            rolls = rolls_by_chain[key] = rf.get_rolls(
+                asset.root_symbol,
+                start,
+                end,
+                asset.offset,
+            )
+        rolls_by_asset[asset] = rolls
+    return rolls_by_asset
+
+
+def _contract_groups(contract_ixs, num_contracts):
+    """Group the contracts which are active over the same span of rows.
+
+    Parameters
+    ----------
+    contract_ixs : np.array[intp]
+        The index of the active contract of each continuous future (columns)
+        at each dt (rows).
+    num_contracts : int
+        The number of contracts.
+
+    Returns
+    -------
+    groups : list[(int, int, np.array[intp])]
+        The first row, the last row and the indices of the contracts of each
+        group, ordered by first row.
+    """
+    rows = np.broadcast_to(
+        np.arange(len(contract_ixs))[:, np.newaxis],
+        contract_ixs.shape,
+    ).ravel()
+    first_rows = np.full(num_contracts, len(contract_ixs), dtype=np.intp)
+    last_rows = np.full(num_contracts, -1, dtype=np.intp)
+    np.minimum.at(first_rows, contract_ixs.ravel(), rows)
+    np.maximum.at(last_rows, contract_ixs.ravel(), rows)
+
+    groups = OrderedDict()
+    for contract in first_rows.argsort(kind='mergesort'):
+        span = first_rows[contract], last_rows[contract]
+        groups.setdefault(span, []).append(contract)
+    return [
+        (first_row, last_row, np.array(members, dtype=np.intp))
+        for (first_row, last_row), members in iteritems(groups)
+    ]
+
+
+def _stitch(bar_reader, columns, dts, contract_sids, dtypes):
+    """Build the arrays of continuous futures out of the arrays of their
+    contracts.
+
+    Parameters
+    ----------
+    bar_reader : SessionBarReader or MinuteBarReader
+        The reader of the contracts' bars.
+    columns : list of str
+        The columns to load, 'sid' is the sid of the active contract.
+    dts : pd.DatetimeIndex
+        The sessions or minutes in the range to load.
+    contract_sids : np.array[int64]
+        The sid of the active contract of each continuous future (columns) at
+        each dt (rows) in ``dts``.
+    dtypes : dict[str -> np.dtype]
+        The dtype of each output column.
+
+    Returns
+    -------
+    arrays : list[np.ndarray]
+        An array per column, with the same shape as ``contract_sids``.
+
+    Notes
+    -----
+    Each contract is only read over the span of rows in which it is active,
+    with one read for all of the contracts which share a span, and the rows
+    of each continuous future are then gathered from the columns of its
+    contracts.
+    """
+    unique_sids, contract_ixs = np.unique(contract_sids, return_inverse=True)
+    contract_ixs = contract_ixs.reshape(contract_sids.shape)
+
+    bar_columns = [column for column in columns if column != 'sid']
+    arrays = {}
+    if bar_columns and len(unique_sids):
+        for column in bar_columns:
+            arrays[column] = np.empty(contract_sids.shape)
+
+        groups = _contract_groups(contract_ixs, len(unique_sids))
+
+        # The group of each contract, and its position among the contracts
+        # of that group.
+        contract_groups = np.empty(len(unique_sids), dtype=np.intp)
+        group_positions = np.empty(len(unique_sids), dtype=np.intp)
+        for i, (_, _, members) in enumerate(groups):
+            contract_groups[members] = i
+            group_positions[members] = np.arange(len(members))
+
+        for i, (first_row, last_row, members) in enumerate(groups):
+            group_arrays = bar_reader.load_raw_arrays(
+                bar_columns,
+                dts[first_row],
+                dts[last_row],
+                [int(sid) for sid in unique_sids[members]],
+            )
+
+            group_ixs = contract_ixs[first_row:last_row + 1]
+            rows, cols = np.nonzero(contract_groups[group_ixs] == i)
+            positions = group_positions[group_ixs[rows, cols]]
+            for column, values in zip(bar_columns, group_arrays):
+                arrays[column][rows + first_row, cols] = values[
+                    rows,
+                    positions,
+                ]
+
+    results = []
+    for column in columns:
+        if column == 'sid':
+            result = contract_sids
+        elif column in arrays:
+            result = arrays[column]
+        else:
+            result = np.empty(contract_sids.shape)
+        results.append(result.astype(dtypes[column], copy=False))
+    return results
+
+
 class ContinuousFutureSessionBarReader(SessionBarReader):
 
     def __init__(self, bar_reader, roll_finders):
@@ -29,71 +169,39 @@ class ContinuousFutureSessionBarReader(SessionBarReader):
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
-        rolls_by_asset = {}
-        for asset in assets:
-            rf = self._roll_finders[asset.roll_style]
-            rolls_by_asset[asset] = rf.get_rolls(
-                asset.root_symbol,
-                start_date,
-                end_date,
-                asset.offset
-            )
-
-        num_sessions = len(
-            self.trading_calendar.sessions_in_range(start_date, end_date)
+        rolls_by_asset = _rolls_by_asset(
+            self._roll_finders,
+            assets,
+            start_date,
+            end_date,
         )
-        shape = num_sessions, len(assets)
-
-        results = []
 
         tc = self._bar_reader.trading_calendar
         sessions = tc.sessions_in_range(start_date, end_date)
 
-        # Get partitions
-        partitions_by_asset = {}
-        for asset in assets:
-            partitions = []
-            partitions_by_asset[asset] = partitions
-
-            rolls = rolls_by_asset[asset]
-            start = start_date
-
-            for roll in rolls:
-                sid, roll_date = roll
-                start_loc = sessions.get_loc(start)
-
+        # The sid of the active contract of each asset on each session.
+        contract_sids = np.empty((len(sessions), len(assets)), dtype=np.int64)
+        for i, asset in enumerate(assets):
+            start_loc = 0
+            for sid, roll_date in rolls_by_asset[asset]:
                 if roll_date is not None:
-                    end = roll_date - sessions.freq
-                    end_loc = sessions.get_loc(end)
+                    end_loc = sessions.get_loc(roll_date - sessions.freq) + 1
                 else:
-                    end = end_date
-                    end_loc = len(sessions) - 1
-
-                partitions.append((sid, start, end, start_loc, end_loc))
-
-                if roll_date is not None:
-                    start = sessions[end_loc + 1]
-
-        for column in columns:
-            if column != 'volume' and column != 'sid':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.int64)
-
-            for i, asset in enumerate(assets):
-                partitions = partitions_by_asset[asset]
-
-                for sid, start, end, start_loc, end_loc in partitions:
-                    if column != 'sid':
-                        result = self._bar_reader.load_raw_arrays(
-                            [column], start, end, [sid])[0][:, 0]
-                    else:
-                        result = int(sid)
-                    out[start_loc:end_loc + 1, i] = result
-
-            results.append(out)
-
-        return results
+                    end_loc = len(sessions)
+                contract_sids[start_loc:end_loc, i] = sid
+                start_loc = end_loc
+
+        return _stitch(
+            self._bar_reader,
+            columns,
+            sessions,
+            contract_sids,
+            {
+                column: np.int64 if column in ('volume', 'sid')
+                else np.float64
+                for column in columns
+            },
+        )
 
     @property
     def last_available_dt(self):
@@ -221,65 +329,41 @@ class ContinuousFutureMinuteBarReader(SessionBarReader):
             (minutes in range, sids) with a dtype of float64, containing the
             values for the respective field over start and end dt range.
         """
-        rolls_by_asset = {}
-
         tc = self.trading_calendar
-        start_session = tc.minute_to_session_label(start_date)
-        end_session = tc.minute_to_session_label(end_date)
-
-        for asset in assets:
-            rf = self._roll_finders[asset.roll_style]
-            rolls_by_asset[asset] = rf.get_rolls(
-                asset.root_symbol,
-                start_session,
-                end_session, asset.offset)
+        rolls_by_asset = _rolls_by_asset(
+            self._roll_finders,
+            assets,
+            tc.minute_to_session_label(start_date),
+            tc.minute_to_session_label(end_date),
+        )
 
         sessions = tc.sessions_in_range(start_date, end_date)
-
         minutes = tc.minutes_in_range(start_date, end_date)
-        num_minutes = len(minutes)
-        shape = num_minutes, len(assets)
-
-        results = []
-
-        # Get partitions
-        partitions_by_asset = {}
-        for asset in assets:
-            partitions = []
-            partitions_by_asset[asset] = partitions
-            rolls = rolls_by_asset[asset]
-            start = start_date
-            for roll in rolls:
-                sid, roll_date = roll
-                start_loc = minutes.searchsorted(start)
+
+        # The sid of the active contract of each asset on each minute.
+        contract_sids = np.empty((len(minutes), len(assets)), dtype=np.int64)
+        for i, asset in enumerate(assets):
+            start_loc = 0
+            for sid, roll_date in rolls_by_asset[asset]:
                 if roll_date is not None:
                     _, end = tc.open_and_close_for_session(
                         roll_date - sessions.freq)
-                    end_loc = minutes.searchsorted(end)
+                    end_loc = minutes.searchsorted(end) + 1
                 else:
-                    end = end_date
-                    end_loc = len(minutes) - 1
-                partitions.append((sid, start, end, start_loc, end_loc))
-                if roll[-1] is not None:
-                    start, _ = tc.open_and_close_for_session(
-                        tc.minute_to_session_label(minutes[end_loc + 1]))
-
-        for column in columns:
-            if column != 'volume':
-                out = np.full(shape, np.nan)
-            else:
-                out = np.zeros(shape, dtype=np.uint32)
-            for i, asset in enumerate(assets):
-                partitions = partitions_by_asset[asset]
-                for sid, start, end, start_loc, end_loc in partitions:
-                    if column != 'sid':
-                        result = self._bar_reader.load_raw_arrays(
-                            [column], start, end, [sid])[0][:, 0]
-                    else:
-                        result = int(sid)
-                    out[start_loc:end_loc + 1, i] = result
-            results.append(out)
-        return results
+                    end_loc = len(minutes)
+                contract_sids[start_loc:end_loc, i] = sid
+                start_loc = end_loc
+
+        return _stitch(
+            self._bar_reader,
+            columns,
+            minutes,
+            contract_sids,
+            {
+                column: np.uint32 if column == 'volume' else np.float64
+                for column in columns
+            },
+        )
 
     @property
     def last_available_dt(self):
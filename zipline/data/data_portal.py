@@ -137,6 +137,11 @@ class DataPortal(object):
         The last session to make available in session-level data.
     last_available_minute : pd.Timestamp, optional
         The last minute to make available in minute-level data.
+    history_window_cache_bytes : int, optional
+        The approximate maximum number of bytes of adjusted history windows
+        to keep cached for each field and frequency. The windows of the least
+        recently requested assets are evicted first. If not provided, the
+        number of cached windows is bounded instead.
     """
     def __init__(self,
                  asset_finder,
@@ -150,7 +155,8 @@ class DataPortal(object):
                  last_available_session=None,
                  last_available_minute=None,
                  minute_history_prefetch_length=_DEF_M_HIST_PREFETCH,
-                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH):
+                 daily_history_prefetch_length=_DEF_D_HIST_PREFETCH,
+                 history_window_cache_bytes=None):
 
         self.trading_calendar = trading_calendar
 
@@ -271,6 +277,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=daily_history_prefetch_length,
+            window_cache_bytes=history_window_cache_bytes,
         )
         self._minute_history_loader = MinuteHistoryLoader(
             self.trading_calendar,
@@ -279,6 +286,7 @@ class DataPortal(object):
             self.asset_finder,
             self._roll_finders,
             prefetch_length=minute_history_prefetch_length,
+            window_cache_bytes=history_window_cache_bytes,
         )
 
         self._first_trading_day = first_trading_day
@@ -406,6 +414,30 @@ class DataPortal(object):
         return self._get_pricing_reader(data_frequency).get_last_traded_dt(
             asset, dt)
 
+    def get_last_traded_dts(self, assets, dt, data_frequency):
+        """
+        Given assets and dt, returns the last traded dt of each asset from the
+        viewpoint of the given dt.
+
+        Parameters
+        ----------
+        assets : iterable[Asset]
+            The assets whose last traded dts are desired.
+        dt : pd.Timestamp
+            The dt from which to look back.
+        data_frequency : str
+            The frequency of the data to query; i.e. whether the data is
+            'daily' or 'minute' bars.
+
+        Returns
+        -------
+        last_traded : pd.DatetimeIndex
+            The last traded dt of each asset, aligned with ``assets``, with
+            ``pd.NaT`` for assets which have not traded on or before ``dt``.
+        """
+        return self._get_pricing_reader(data_frequency).get_last_traded_dts(
+            assets, dt)
+
     @staticmethod
     def _is_extra_source(asset, field, map):
         """
@@ -524,6 +556,16 @@ class DataPortal(object):
                 data_frequency,
             )
         else:
+            if field == 'last_traded':
+                assets = list(assets)
+                if all(isinstance(asset, (Asset, ContinuousFuture))
+                       for asset in assets):
+                    return list(self.get_last_traded_dts(
+                        assets,
+                        dt if data_frequency == 'minute' else session_label,
+                        data_frequency,
+                    ))
+
             get_single_asset_value = self._get_single_asset_value
             return [
                 get_single_asset_value(
@@ -572,6 +614,170 @@ class DataPortal(object):
             data_frequency,
         )
 
+    def get_spot_values(self,
+                        assets,
+                        field,
+                        dt,
+                        data_frequency,
+                        perspective_dt=None):
+        """Get a pricing field of many assets at once.
+
+        Parameters
+        ----------
+        assets : sequence[Asset, ContinuousFuture or str]
+            The assets whose values are desired.
+        field : {'open', 'high', 'low', 'close', 'volume', 'price'}
+            The desired field of the assets.
+        dt : pd.Timestamp
+            The timestamp for the desired values.
+        data_frequency : {'daily', 'minute'}
+            The frequency of the data to query.
+        perspective_dt : pd.Timestamp, optional
+            If provided, the values are adjusted for the splits, mergers and
+            dividends between ``dt`` and ``perspective_dt``, like
+            :meth:`get_adjusted_value`.
+
+        Returns
+        -------
+        values : np.ndarray[float64 or int64]
+            The value of each asset, aligned with ``assets``. These are the
+            same values as :meth:`get_spot_value` for each asset. Volumes are
+            int64, with 0 for missing volumes, and the other fields are
+            float64.
+
+        Notes
+        -----
+        The values of the assets which are alive at ``dt`` are read from the
+        pricing reader in one call, unless ``dt`` is a minute outside of the
+        market hours, e.g. in ``before_trading_start``. Only the prices which
+        need to be forward filled, and the values of continuous futures and
+        of symbols from ``fetch_csv``, are read one asset at a time.
+        """
+        if field not in OHLCVP_FIELDS:
+            raise KeyError("Invalid column: " + str(field))
+
+        session_label = self.trading_calendar.minute_to_session_label(dt)
+        values = np.full(len(assets), 0.0 if field == 'volume' else nan)
+
+        # The assets which may have a value, see ``_get_single_asset_value``,
+        # and the ones which are read one at a time.
+        alive = []
+        single = []
+        for ix, asset in enumerate(assets):
+            if not isinstance(asset, Asset):
+                single.append(ix)
+            elif asset.start_date <= dt and session_label <= asset.end_date:
+                alive.append(ix)
+
+        reader = self._get_pricing_reader(data_frequency)
+        if data_frequency == 'daily':
+            read_dt = session_label
+        else:
+            read_dt = dt
+            if not reader.trading_calendar.is_open_on_minute(dt):
+                # The readers of assets on other calendars are reindexed to
+                # the market minutes, e.g. futures before the open, so those
+                # values are read one asset at a time.
+                single.extend(alive)
+                alive = []
+
+        if alive:
+            alive = np.array(alive)
+            try:
+                values[alive] = reader.load_raw_arrays(
+                    ['close' if field == 'price' else field],
+                    read_dt,
+                    read_dt,
+                    [assets[ix].sid for ix in alive],
+                )[0][0]
+            except (NoDataOnDate, KeyError, ValueError, IndexError):
+                # The readers raise different errors for dates outside of
+                # their data. Reading the assets one at a time handles those
+                # dates.
+                single.extend(alive)
+            else:
+                if field == 'price':
+                    single.extend(alive[np.isnan(values[alive])])
+
+        get_single_asset_value = self._get_single_asset_value
+        for ix in single:
+            asset = assets[ix]
+            if perspective_dt is not None and not isinstance(asset, Asset):
+                # fetcher values are read as of ``perspective_dt``
+                values[ix] = self.get_adjusted_value(
+                    asset,
+                    field,
+                    dt,
+                    perspective_dt,
+                    data_frequency,
+                )
+            else:
+                values[ix] = get_single_asset_value(
+                    session_label,
+                    asset,
+                    field,
+                    dt,
+                    data_frequency,
+                )
+
+        if perspective_dt is not None:
+            equities = [
+                ix for ix, asset in enumerate(assets)
+                if isinstance(asset, Equity)
+            ]
+            if equities:
+                values[equities] *= self.get_adjustments(
+                    [assets[ix] for ix in equities],
+                    field,
+                    dt,
+                    perspective_dt,
+                )
+
+        if field == 'volume':
+            # Adjusted volumes are rounded to whole shares.
+            values[np.isnan(values)] = 0
+            return np.around(values).astype(np.int64)
+        return values
+
+    def get_spot_prices(self,
+                        assets,
+                        dt,
+                        data_frequency,
+                        perspective_dt=None):
+        """Get the 'price' field of many assets at once.
+
+        Parameters
+        ----------
+        assets : sequence[Asset]
+            The assets whose prices are desired.
+        dt : pd.Timestamp
+            The timestamp for the desired prices.
+        data_frequency : {'daily', 'minute'}
+            The frequency of the data to query.
+        perspective_dt : pd.Timestamp, optional
+            If provided, the prices of equities are adjusted for the splits,
+            mergers and dividends between ``dt`` and ``perspective_dt``, like
+            :meth:`get_adjusted_value`.
+
+        Returns
+        -------
+        prices : np.ndarray[float64]
+            The price of each asset, aligned with ``assets``. These are the
+            same values as :meth:`get_scalar_asset_spot_value` for each asset
+            with ``field='price'``.
+
+        See Also
+        --------
+        get_spot_values
+        """
+        return self.get_spot_values(
+            assets,
+            'price',
+            dt,
+            data_frequency,
+            perspective_dt=perspective_dt,
+        )
+
     def get_adjustments(self, assets, field, dt, perspective_dt):
         """
         Returns a list of adjustments between the dt and perspective_dt for the
@@ -995,13 +1201,14 @@ class DataPortal(object):
                 # could yield a value from later today.
                 history_start -= self.trading_calendar.day
 
+            assets_to_fill = df.columns[assets_with_leading_nan]
+            last_traded_dts = self.get_last_traded_dts(
+                assets_to_fill,
+                history_start,
+                ffill_data_frequency,
+            )
             initial_values = []
-            for asset in df.columns[assets_with_leading_nan]:
-                last_traded = self.get_last_traded_dt(
-                    asset,
-                    history_start,
-                    ffill_data_frequency,
-                )
+            for asset, last_traded in zip(assets_to_fill, last_traded_dts):
                 if isnull(last_traded):
                     initial_values.append(nan)
                 else:
@@ -1420,6 +1627,22 @@ class DataPortal(object):
             return None
         return self.asset_finder.retrieve_asset(contract_sid)
 
+    def history_cache_stats(self):
+        """
+        The counters of the history window caches.
+
+        Returns
+        -------
+        stats : dict[str -> dict[str -> int]]
+            For each of ``'daily'`` and ``'minute'`` history, the number of
+            ``'hits'``, ``'misses'`` and ``'evictions'`` of the window caches.
+            See :meth:`zipline.data.history_loader.HistoryLoader.cache_stats`.
+        """
+        return {
+            'daily': self._history_loader.cache_stats(),
+            'minute': self._minute_history_loader.cache_stats(),
+        }
+
     @property
     def adjustment_reader(self):
         return self._adjustment_reader
@@ -20,9 +20,11 @@ from numpy import (
     int64,
     zeros
 )
+from pandas import DatetimeIndex
 from six import iteritems, with_metaclass
 
 from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import iNaT
 
 
 class AssetDispatchBarReader(with_metaclass(ABCMeta)):
@@ -100,6 +102,21 @@ class AssetDispatchBarReader(with_metaclass(ABCMeta)):
         r = self._readers[type(asset)]
         return r.get_last_traded_dt(asset, dt)
 
+    def get_last_traded_dts(self, assets, dt):
+        assets = list(assets)
+        asset_groups = {}
+        out_pos = {}
+        for i, asset in enumerate(assets):
+            t = type(asset)
+            asset_groups.setdefault(t, []).append(asset)
+            out_pos.setdefault(t, []).append(i)
+
+        out = full(len(assets), iNaT, dtype=int64)
+        for t, group in iteritems(asset_groups):
+            last_traded = self._readers[t].get_last_traded_dts(group, dt)
+            out[out_pos[t]] = last_traded.asi8
+        return DatetimeIndex(out, tz='UTC')
+
     def load_raw_arrays(self, fields, start_dt, end_dt, sids):
         asset_types = self._asset_types
         sid_groups = {t: [] for t in asset_types}
@@ -18,12 +18,12 @@ from abc import (
     abstractproperty,
 )
 
-from numpy import concatenate
+from numpy import empty
 from lru import LRU
-from pandas import isnull
+from pandas import DatetimeIndex, isnull
 from toolz import sliding_window
 
-from six import with_metaclass
+from six import iteritems, itervalues, with_metaclass
 
 from zipline.assets import Equity, Future
 from zipline.assets.continuous_futures import ContinuousFuture
@@ -39,6 +39,8 @@ from zipline.utils.pandas_utils import find_in_sorted_index, normalize_date
 # Default number of decimal places used for rounding asset prices.
 DEFAULT_ASSET_PRICE_DECIMALS = 3
 
+NANOS_IN_SECOND = 1000000000
+
 
 class HistoryCompatibleUSEquityAdjustmentReader(object):
 
@@ -46,23 +48,6 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         self._adjustments_reader = adjustment_reader
 
     def load_adjustments(self, columns, dts, assets):
-        """
-        Returns
-        -------
-        adjustments : list[dict[int -> Adjustment]]
-            A list, where each element corresponds to the `columns`, of
-            mappings from index to adjustment objects to apply at that index.
-        """
-        out = [None] * len(columns)
-        for i, column in enumerate(columns):
-            adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
-            out[i] = adjs
-        return out
-
-    def _get_adjustments_in_range(self, asset, dts, field):
         """
         Get the Float64Multiply objects to pass to an AdjustedArrayWindow.
 
@@ -76,79 +61,68 @@ class HistoryCompatibleUSEquityAdjustmentReader(object):
         - the end of the multiply object is the location before the calendar
           location of the adjustment action, making all days before the event
           adjusted.
+        - the column of the multiply object is the location of the asset in
+          ``assets``.
 
         Parameters
         ----------
-        asset : Asset
-            The assets for which to get adjustments.
+        columns : list[str]
+            OHLCV fields for which to get the adjustments.
         dts : iterable of datetime64-like
             The dts for which adjustment data is needed.
-        field : str
-            OHLCV field for which to get the adjustments.
+        assets : list[Asset]
+            The assets for which to get adjustments.
 
         Returns
         -------
-        out : dict[loc -> Float64Multiply]
-            The adjustments as a dict of loc -> Float64Multiply
+        adjustments : list[dict[int -> Adjustment]]
+            A list, where each element corresponds to the `columns`, of
+            mappings from index to adjustment objects to apply at that index.
         """
-        sid = int(asset)
-        start = normalize_date(dts[0])
-        end = normalize_date(dts[-1])
-        adjs = {}
-        if field != 'volume':
-            mergers = self._adjustments_reader.get_adjustments_for_sid(
-                'mergers', sid)
-            for m in mergers:
-                dt = m[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
-                    adj_loc = end_loc
-                    mult = Float64Multiply(0,
-                                           end_loc - 1,
-                                           0,
-                                           0,
-                                           m[1])
-                    try:
-                        adjs[adj_loc].append(mult)
-                    except KeyError:
-                        adjs[adj_loc] = [mult]
-            divs = self._adjustments_reader.get_adjustments_for_sid(
-                'dividends', sid)
-            for d in divs:
-                dt = d[0]
-                if start < dt <= end:
-                    end_loc = dts.searchsorted(dt)
+        sids = [int(asset) for asset in assets]
+        # Adjustments effective on the first dt are not applied, since there
+        # is no data before them in the window.
+        start = normalize_date(dts[0]).value // NANOS_IN_SECOND + 1
+        end = normalize_date(dts[-1]).value // NANOS_IN_SECOND
+        dts_ns = DatetimeIndex(dts).asi8
+
+        # Query each table once for all of the assets, and share the results
+        # between the columns.
+        found = {}
+        for table_name in 'mergers', 'dividends', 'splits':
+            index = self._adjustments_reader.get_adjustment_index(table_name)
+            asset_ixs, effective_dates, ratios = index.query(sids, start, end)
+            end_locs = dts_ns.searchsorted(effective_dates * NANOS_IN_SECOND)
+            found[table_name] = (
+                asset_ixs.tolist(),
+                end_locs.tolist(),
+                ratios.tolist(),
+            )
+
+        out = [None] * len(columns)
+        for i, column in enumerate(columns):
+            if column == 'volume':
+                table_names = ('splits',)
+            else:
+                table_names = ('mergers', 'dividends', 'splits')
+
+            adjs = {}
+            for table_name in table_names:
+                for asset_ix, end_loc, ratio in zip(*found[table_name]):
+                    if column == 'volume':
+                        ratio = 1.0 / ratio
                     adj_loc = end_loc
                     mult = Float64Multiply(0,
                                            end_loc - 1,
-                                           0,
-                                           0,
-                                           d[1])
+                                           asset_ix,
+                                           asset_ix,
+                                           ratio)
                     try:
                         adjs[adj_loc].append(mult)
                     except KeyError:
                         adjs[adj_loc] = [mult]
-        splits = self._adjustments_reader.get_adjustments_for_sid(
-            'splits', sid)
-        for s in splits:
-            dt = s[0]
-            if start < dt <= end:
-                if field == 'volume':
-                    ratio = 1.0 / s[1]
-                else:
-                    ratio = s[1]
-                end_loc = dts.searchsorted(dt)
-                adj_loc = end_loc
-                mult = Float64Multiply(0,
-                                       end_loc - 1,
-                                       0,
-                                       0,
-                                       ratio)
-                try:
-                    adjs[adj_loc].append(mult)
-                except KeyError:
-                    adjs[adj_loc] = [mult]
-        return adjs
+            out[i] = adjs
+        return out
 
 
 class ContinuousFutureAdjustmentReader(object):
@@ -180,9 +154,14 @@ class ContinuousFutureAdjustmentReader(object):
         out = [None] * len(columns)
         for i, column in enumerate(columns):
             adjs = {}
-            for asset in assets:
-                adjs.update(self._get_adjustments_in_range(
-                    asset, dts, column))
+            for asset_ix, asset in enumerate(assets):
+                asset_adjs = self._get_adjustments_in_range(
+                    asset, asset_ix, dts, column)
+                for adj_loc, loc_adjs in iteritems(asset_adjs):
+                    try:
+                        adjs[adj_loc].extend(loc_adjs)
+                    except KeyError:
+                        adjs[adj_loc] = loc_adjs
             out[i] = adjs
         return out
 
@@ -190,7 +169,8 @@ class ContinuousFutureAdjustmentReader(object):
                          adjustment_type,
                          front_close,
                          back_close,
-                         end_loc):
+                         end_loc,
+                         col):
         adj_base = back_close - front_close
         if adjustment_type == 'mul':
             adj_value = 1.0 + adj_base / front_close
@@ -200,11 +180,11 @@ class ContinuousFutureAdjustmentReader(object):
             adj_class = Float64Add
         return adj_class(0,
                          end_loc,
-                         0,
-                         0,
+                         col,
+                         col,
                          adj_value)
 
-    def _get_adjustments_in_range(self, cf, dts, field):
+    def _get_adjustments_in_range(self, cf, col, dts, field):
         if field == 'volume' or field == 'sid':
             return {}
         if cf.adjustment is None:
@@ -247,7 +227,8 @@ class ContinuousFutureAdjustmentReader(object):
             adj = self._make_adjustment(cf.adjustment,
                                         front_close,
                                         back_close,
-                                        end_loc)
+                                        end_loc,
+                                        col)
             try:
                 adjs[adj_loc].append(adj)
             except KeyError:
@@ -264,7 +245,7 @@ class SlidingWindow(object):
     ----------
     window : AdjustedArrayWindow
        Window of pricing data with prefetched values beyond the current
-       simulation dt.
+       simulation dt, with one column per asset in the window.
     cal_start : int
        Index in the overall calendar at which the window starts.
     """
@@ -276,6 +257,10 @@ class SlidingWindow(object):
         self.offset = offset
         self.most_recent_ix = self.cal_start + size
 
+        data = window.data
+        # The share of the window's memory used by each asset.
+        self.column_nbytes = data.nbytes // max(data.shape[1], 1)
+
     def get(self, end_ix):
         """
         Returns
@@ -293,6 +278,11 @@ class SlidingWindow(object):
         return self.current
 
 
+def _window_column_nbytes(value):
+    window, _ = value
+    return window.column_nbytes
+
+
 class HistoryLoader(with_metaclass(ABCMeta)):
     """
     Loader for sliding history windows, with support for adjustments.
@@ -305,6 +295,11 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         Reader for pricing bars.
     adjustment_reader : SQLiteAdjustmentReader
         Reader for adjustment data.
+    window_cache_bytes : int, optional
+        The approximate maximum number of bytes of window data to keep
+        cached for each field. When the limit is reached, the windows of the
+        least recently requested assets are evicted. If not provided, at most
+        ``sid_cache_size`` windows are cached for each field.
     """
     FIELDS = ('open', 'high', 'low', 'close', 'volume', 'sid')
 
@@ -312,7 +307,8 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                  asset_finder,
                  roll_finders=None,
                  sid_cache_size=1000,
-                 prefetch_length=0):
+                 prefetch_length=0,
+                 window_cache_bytes=None):
         self.trading_calendar = trading_calendar
         self._asset_finder = asset_finder
         self._reader = reader
@@ -328,10 +324,19 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                                                  reader,
                                                  roll_finders,
                                                  self._frequency)
-        self._window_blocks = {
-            field: ExpiringCache(LRU(sid_cache_size))
-            for field in self.FIELDS
-        }
+        if window_cache_bytes is None:
+            self._window_blocks = {
+                field: ExpiringCache(LRU(sid_cache_size))
+                for field in self.FIELDS
+            }
+        else:
+            self._window_blocks = {
+                field: ExpiringCache(
+                    max_bytes=window_cache_bytes,
+                    sizeof=_window_column_nbytes,
+                )
+                for field in self.FIELDS
+            }
         self._prefetch_length = prefetch_length
 
     @abstractproperty
@@ -361,6 +366,59 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     return number_of_decimal_places(contract.tick_size)
         return DEFAULT_ASSET_PRICE_DECIMALS
 
+    def _load_adjustments(self, field, dts, assets):
+        """
+        Load the adjustments to ``field`` for a block of ``assets``, with one
+        call to each adjustment reader.
+
+        Parameters
+        ----------
+        field : str
+            The OHLCV field for which to get the adjustments.
+        dts : iterable of datetime64-like
+            The dts for which adjustment data is needed.
+        assets : list[Asset]
+            The assets for which to get adjustments.
+
+        Returns
+        -------
+        adjustments : dict[int -> list[Adjustment]]
+            A mapping from index to the adjustments to apply at that index.
+            The column of each adjustment is the location of its asset in
+            ``assets``.
+        """
+        ixs_by_type = {}
+        for i, asset in enumerate(assets):
+            ixs_by_type.setdefault(type(asset), []).append(i)
+
+        out = {}
+        for asset_type, ixs in iteritems(ixs_by_type):
+            try:
+                adj_reader = self._adjustment_readers[asset_type]
+            except KeyError:
+                continue
+
+            adjs = adj_reader.load_adjustments(
+                [field], dts, [assets[i] for i in ixs])[0]
+
+            for adj_loc, loc_adjs in iteritems(adjs):
+                if len(ixs) != len(assets):
+                    # The reader only saw some of the assets, so move each
+                    # adjustment to the column of its asset in ``assets``.
+                    loc_adjs = [
+                        type(adj)(adj.first_row,
+                                  adj.last_row,
+                                  ixs[adj.first_col],
+                                  ixs[adj.last_col],
+                                  adj.value)
+                        for adj in loc_adjs
+                    ]
+                try:
+                    out[adj_loc].extend(loc_adjs)
+                except KeyError:
+                    out[adj_loc] = loc_adjs
+        return out
+
     def _ensure_sliding_windows(self, assets, dts, field,
                                 is_perspective_after):
         """
@@ -387,9 +445,17 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         Returns
         -------
-        out : list of Float64Window with sufficient data so that each asset's
-        window can provide `get` for the index corresponding with the last
-        value in `dts`
+        out : list of (SlidingWindow, int)
+            For each asset, a window with sufficient data to provide `get`
+            for the index corresponding with the last value in `dts`, and the
+            column of the asset in the window.
+
+        Notes
+        -----
+        The windows created at the same time for assets which are rounded to
+        the same number of decimal places share one block window over all of
+        their columns. Each asset is still cached and invalidated on its own,
+        so a window is only rebuilt for the assets which need it.
         """
         end = dts[-1]
         size = len(dts)
@@ -402,7 +468,7 @@ class HistoryLoader(with_metaclass(ABCMeta)):
 
         for asset in assets:
             try:
-                window = self._window_blocks[field].get(
+                window, col = self._window_blocks[field].get(
                     (asset, size, is_perspective_after), end)
             except KeyError:
                 needed_assets.append(asset)
@@ -413,7 +479,7 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                     # Grab new window instead of rewinding adjustments.
                     needed_assets.append(asset)
                 else:
-                    asset_windows[asset] = window
+                    asset_windows[asset] = window, col
 
         if needed_assets:
             offset = 0
@@ -427,7 +493,6 @@ class HistoryLoader(with_metaclass(ABCMeta)):
                 adj_dts = cal[start_ix:adj_end_ix + 1]
             else:
                 adj_dts = prefetch_dts
-            prefetch_len = len(prefetch_dts)
             array = self._array(prefetch_dts, needed_assets, field)
 
             if field == 'sid':
@@ -439,35 +504,56 @@ class HistoryLoader(with_metaclass(ABCMeta)):
             if field == 'volume':
                 array = array.astype(float64_dtype)
 
+            # The rounding is applied to a whole window, so the assets are
+            # grouped into one block per number of decimal places.
+            ixs_by_places = {}
             for i, asset in enumerate(needed_assets):
-                adj_reader = None
-                try:
-                    adj_reader = self._adjustment_readers[type(asset)]
-                except KeyError:
-                    adj_reader = None
-                if adj_reader is not None:
-                    adjs = adj_reader.load_adjustments(
-                        [field], adj_dts, [asset])[0]
+                places = self._decimal_places_for_asset(asset, dts[-1])
+                ixs_by_places.setdefault(places, []).append(i)
+
+            for places, ixs in iteritems(ixs_by_places):
+                if len(ixs) == len(needed_assets):
+                    block_assets = needed_assets
+                    block_array = array
                 else:
-                    adjs = {}
+                    block_assets = [needed_assets[i] for i in ixs]
+                    block_array = array[:, ixs]
+
                 window = window_type(
-                    array[:, i].reshape(prefetch_len, 1),
+                    block_array,
                     view_kwargs,
-                    adjs,
+                    self._load_adjustments(field, adj_dts, block_assets),
                     offset,
                     size,
                     int(is_perspective_after),
-                    self._decimal_places_for_asset(asset, dts[-1]),
+                    places,
                 )
                 sliding_window = SlidingWindow(window, size, start_ix, offset)
-                asset_windows[asset] = sliding_window
-                self._window_blocks[field].set(
-                    (asset, size, is_perspective_after),
-                    sliding_window,
-                    prefetch_end)
+                for col, asset in enumerate(block_assets):
+                    asset_windows[asset] = sliding_window, col
+                    self._window_blocks[field].set(
+                        (asset, size, is_perspective_after),
+                        (sliding_window, col),
+                        prefetch_end)
 
         return [asset_windows[asset] for asset in assets]
 
+    def cache_stats(self):
+        """
+        The counters of the sliding window caches, summed over all fields.
+
+        Returns
+        -------
+        stats : dict[str -> int]
+            The number of ``'hits'``, ``'misses'`` and ``'evictions'`` of the
+            window caches since this loader was created.
+        """
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        for cache in itervalues(self._window_blocks):
+            for counter in stats:
+                stats[counter] += getattr(cache, counter)
+        return stats
+
     def history(self, assets, dts, field, is_perspective_after):
         """
         A window of pricing data with adjustments applied assuming that the
@@ -543,16 +629,33 @@ class HistoryLoader(with_metaclass(ABCMeta)):
         -------
         out : np.ndarray with shape(len(days between start, end), len(assets))
         """
-        block = self._ensure_sliding_windows(assets,
-                                             dts,
-                                             field,
-                                             is_perspective_after)
+        windows = self._ensure_sliding_windows(assets,
+                                               dts,
+                                               field,
+                                               is_perspective_after)
         end_ix = self._calendar.searchsorted(dts[-1])
 
-        return concatenate(
-            [window.get(end_ix) for window in block],
-            axis=1,
-        )
+        # Seek each block window once, and copy out the columns of all of the
+        # requested assets in that block together.
+        locs_by_window = {}
+        for i, (window, col) in enumerate(windows):
+            try:
+                out_locs, cols = locs_by_window[window]
+            except KeyError:
+                out_locs, cols = locs_by_window[window] = [], []
+            out_locs.append(i)
+            cols.append(col)
+
+        out = None
+        for window, (out_locs, cols) in iteritems(locs_by_window):
+            values = window.get(end_ix)
+            if out is None:
+                out = empty((len(values), len(windows)), dtype=values.dtype)
+            out[:, out_locs] = values[:, cols]
+
+        if out is None:
+            return empty((len(dts), 0))
+        return out
 
 
 class DailyHistoryLoader(HistoryLoader):
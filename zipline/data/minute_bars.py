@@ -43,6 +43,7 @@ from zipline.data.us_equity_pricing import check_uint32_safe
 from zipline.utils.cli import maybe_show_progress
 from zipline.utils.compat import mappingproxy
 from zipline.utils.memoize import lazyval
+from zipline.utils.numpy_utils import iNaT
 
 
 logger = logbook.Logger('MinuteBars')
@@ -892,6 +893,16 @@ class BcolzMinuteBarReader(MinuteBarReader):
     rootdir : string
         The root directory containing the metadata and asset bcolz
         directories.
+    sid_cache_sizes : dict[str -> int], optional
+        A mapping from field name to the number of open carrays to keep for
+        that field.
+    last_traded_index : bool, optional
+        If True, the first last-traded lookup for a sid reads the sid's whole
+        volume column and builds an index of the last traded minute for every
+        session, so that subsequent lookups only need to scan the minutes of a
+        single session. This is worthwhile for long simulations over illiquid
+        assets, where scanning backwards through the volume column can
+        otherwise cover many sessions. Default is False.
 
     See Also
     --------
@@ -913,7 +924,10 @@ class BcolzMinuteBarReader(MinuteBarReader):
     # can do so by mutating DEFAULT_MINUTELY_SID_CACHE_SIZES.
     _default_proxy = mappingproxy(DEFAULT_MINUTELY_SID_CACHE_SIZES)
 
-    def __init__(self, rootdir, sid_cache_sizes=_default_proxy):
+    def __init__(self,
+                 rootdir,
+                 sid_cache_sizes=_default_proxy,
+                 last_traded_index=False):
 
         self._rootdir = rootdir
 
@@ -961,6 +975,14 @@ class BcolzMinuteBarReader(MinuteBarReader):
         # which is the minute epoch of that date.
         self._known_zero_volume_dict = {}
 
+        if last_traded_index:
+            # Maps sid -> array of the position of the last traded minute on
+            # or before the close of each session, or -1 if the sid has not
+            # traded yet.
+            self._last_traded_indices = LRU(sid_cache_sizes['volume'])
+        else:
+            self._last_traded_indices = None
+
     def _get_metadata(self):
         return BcolzMinuteBarMetadata.read(self._rootdir)
 
@@ -1154,11 +1176,112 @@ class BcolzMinuteBarReader(MinuteBarReader):
             return pd.NaT
         return self._pos_to_minute(minute_pos)
 
-    def _find_last_traded_position(self, asset, dt):
+    def get_last_traded_dts(self, assets, dt):
+        find_last_traded_position = self._find_last_traded_position
+        positions = np.array(
+            [find_last_traded_position(asset, dt) for asset in assets],
+            dtype=np.int64,
+        )
+        return self._pos_to_minutes(positions)
+
+    def _last_traded_index(self, sid):
+        """
+        Get the index of the last traded position on or before the close of
+        each session for ``sid``, building it if needed.
+
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+
+        Returns
+        -------
+        index : np.array[int64]
+            Array with an entry for each session written for ``sid``. Each
+            entry is the position of the last minute with non-zero volume on
+            or before that session's close, or -1 if there is no such minute.
+        """
+        try:
+            return self._last_traded_indices[sid]
+        except KeyError:
+            pass
+
+        volumes = self._open_minute_file('volume', sid)[:]
+        minutes_per_day = self._minutes_per_day
+        num_sessions = -(-len(volumes) // minutes_per_day)
+
+        padded = np.zeros(num_sessions * minutes_per_day, dtype=volumes.dtype)
+        padded[:len(volumes)] = volumes
+        traded = padded.reshape(num_sessions, minutes_per_day) != 0
+
+        # Ignore any minutes written between an early close and the next
+        # open; they are not market minutes.
+        session_lengths = (
+            self._market_close_values[:num_sessions] -
+            self._market_open_values[:num_sessions]
+        )
+        traded &= (
+            np.arange(minutes_per_day)[np.newaxis, :] <=
+            session_lengths[:, np.newaxis]
+        )
+
+        last_in_session = (
+            minutes_per_day - 1 - traded[:, ::-1].argmax(axis=1)
+        )
+        positions = np.where(
+            traded.any(axis=1),
+            np.arange(num_sessions) * minutes_per_day + last_in_session,
+            -1,
+        )
+        index = self._last_traded_indices[sid] = np.maximum.accumulate(
+            positions,
+        )
+        return index
+
+    def _find_last_traded_position_indexed(self, asset, dt_minute):
+        index = self._last_traded_index(asset.sid)
+        if not len(index):
+            return -1
+
+        minute_pos = find_position_of_minute(
+            self._market_open_values,
+            self._market_close_values,
+            dt_minute,
+            self._minutes_per_day,
+            True,
+        )
+        session_ix = minute_pos // self._minutes_per_day
+        if session_ix >= len(index):
+            return index[-1]
+
+        pos = index[session_ix]
+        if pos <= minute_pos:
+            return pos
+
+        # The last trade of the session is after ``dt``, so only the minutes
+        # of this session up to ``dt`` need to be scanned.
+        session_start = session_ix * self._minutes_per_day
         volumes = self._open_minute_file('volume', asset)
+        traded = np.flatnonzero(volumes[session_start:minute_pos + 1])
+        if len(traded):
+            return session_start + traded[-1]
+        return index[session_ix - 1] if session_ix > 0 else -1
+
+    def _find_last_traded_position(self, asset, dt):
         start_date_minute = asset.start_date.value / NANOS_IN_MINUTE
         dt_minute = dt.value / NANOS_IN_MINUTE
 
+        if self._last_traded_indices is not None:
+            if dt_minute < start_date_minute:
+                return -1
+            pos = self._find_last_traded_position_indexed(asset, dt_minute)
+            if pos == -1 or self._pos_to_minute_value(pos) < \
+                    start_date_minute:
+                return -1
+            return pos
+
+        volumes = self._open_minute_file('volume', asset)
+
         try:
             # if we know of a dt before which this asset has no volume,
             # don't look before that dt
@@ -1191,15 +1314,38 @@ class BcolzMinuteBarReader(MinuteBarReader):
 
         return pos
 
-    def _pos_to_minute(self, pos):
-        minute_epoch = minute_value(
+    def _pos_to_minute_value(self, pos):
+        return minute_value(
             self._market_open_values,
             pos,
             self._minutes_per_day
         )
 
+    def _pos_to_minute(self, pos):
+        minute_epoch = self._pos_to_minute_value(pos)
+
         return pd.Timestamp(minute_epoch, tz='UTC', unit="m")
 
+    def _pos_to_minutes(self, positions):
+        """
+        Vectorized version of ``_pos_to_minute``.
+
+        Parameters
+        ----------
+        positions : np.array[int64]
+            Minute positions. Positions of -1 are mapped to NaT.
+
+        Returns
+        -------
+        minutes : pd.DatetimeIndex
+            The minute represented by each position.
+        """
+        q, r = np.divmod(positions, self._minutes_per_day)
+        minute_epochs = self._market_open_values[q] + r
+        nanos = minute_epochs * NANOS_IN_MINUTE
+        nanos[positions == -1] = iNaT
+        return pd.DatetimeIndex(nanos, tz='UTC')
+
     def _find_position_of_minute(self, minute_dt):
         """
         Internal method that returns the position of the given minute in the
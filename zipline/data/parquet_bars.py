@@ -0,0 +1,1065 @@
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Readers and writers for OHLCV bars stored as Apache Parquet files.
+
+Parquet is a columnar format which can be read zero-copy through Apache Arrow
+by tools other than zipline. Each file is split into row groups which cover a
+contiguous range of sessions, and the min/max statistics that parquet keeps
+for the ``dt`` column of every row group are used to skip the row groups
+outside of a query's date range without reading them.
+"""
+import json
+import os
+
+from lru import LRU
+import numpy as np
+import pandas as pd
+from six import iteritems
+from toolz import keymap
+from trading_calendars import get_calendar
+
+from zipline.data.bar_reader import (
+    NoDataAfterDate,
+    NoDataBeforeDate,
+    NoDataForSid,
+    NoDataOnDate,
+)
+from zipline.data.minute_bars import MinuteBarReader
+from zipline.data.session_bars import SessionBarReader
+from zipline.data.us_equity_pricing import winsorise_uint32
+from zipline.utils.cli import maybe_show_progress
+from zipline.utils.input_validation import expect_element
+from zipline.utils.memoize import lazyval
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+OHLC = ('open', 'high', 'low', 'close')
+OHLCV = OHLC + ('volume',)
+
+# The number of sessions covered by each row group. A month of sessions keeps
+# row groups large enough to compress well while still letting short queries
+# skip most of the file.
+DEFAULT_ROW_GROUP_SESSIONS = 21
+
+DAILY_BARS_FILENAME = 'daily_bars.parquet'
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise ImportError(
+            'pyarrow is required to read or write parquet bars; install it '
+            'with: pip install zipline[arrow]'
+        )
+
+
+def _sid_path(rootdir, sid):
+    """
+    Format the path of the parquet file holding the minute bars for ``sid``,
+    limiting the number of files in any given subdirectory to 100.
+
+    e.g. 1 is formatted as <rootdir>/00/00/000001.parquet
+    """
+    padded_sid = format(sid, '06')
+    return os.path.join(
+        rootdir,
+        padded_sid[0:2],
+        padded_sid[2:4],
+        '{0}.parquet'.format(padded_sid),
+    )
+
+
+def _dt_values(index):
+    """Get the UTC epoch nanoseconds of a DatetimeIndex-like.
+    """
+    return pd.DatetimeIndex(index).values.astype('datetime64[ns]').view(
+        np.int64,
+    )
+
+
+def _row_group_dt_bounds(parquet_file):
+    """
+    Read the min and max ``dt`` of every row group of ``parquet_file`` from
+    the row group statistics.
+
+    Returns
+    -------
+    starts, ends : np.array[int64]
+        The first and last dt, as epoch nanoseconds, of each row group.
+    """
+    metadata = parquet_file.metadata
+    dt_column = parquet_file.schema.names.index('dt')
+    starts = np.empty(metadata.num_row_groups, dtype=np.int64)
+    ends = np.empty(metadata.num_row_groups, dtype=np.int64)
+    for i in range(metadata.num_row_groups):
+        statistics = metadata.row_group(i).column(dt_column).statistics
+        starts[i] = statistics.min
+        ends[i] = statistics.max
+    return starts, ends
+
+
+class ParquetBarMetadata(object):
+    """
+    Metadata stored alongside parquet bars.
+
+    Parameters
+    ----------
+    calendar : trading_calendars.TradingCalendar
+        The calendar on which the bars are based.
+    start_session : pd.Timestamp
+        The first session in the data set.
+    end_session : pd.Timestamp
+        The last session in the data set.
+    asset_sessions : dict[int -> (pd.Timestamp, pd.Timestamp)]
+        A mapping from sid to the first and last session with data for that
+        sid.
+    """
+    FORMAT_VERSION = 0
+
+    METADATA_FILENAME = 'metadata.json'
+
+    @classmethod
+    def metadata_path(cls, rootdir):
+        return os.path.join(rootdir, cls.METADATA_FILENAME)
+
+    @classmethod
+    def read(cls, rootdir):
+        with open(cls.metadata_path(rootdir)) as fp:
+            raw_data = json.load(fp)
+
+        return cls(
+            get_calendar(raw_data['calendar_name']),
+            pd.Timestamp(raw_data['start_session'], tz='UTC'),
+            pd.Timestamp(raw_data['end_session'], tz='UTC'),
+            {
+                sid: (
+                    pd.Timestamp(first, tz='UTC'),
+                    pd.Timestamp(last, tz='UTC'),
+                )
+                for sid, (first, last) in iteritems(
+                    keymap(int, raw_data['asset_sessions']),
+                )
+            },
+            version=raw_data['version'],
+        )
+
+    def __init__(self,
+                 calendar,
+                 start_session,
+                 end_session,
+                 asset_sessions,
+                 version=FORMAT_VERSION):
+        self.calendar = calendar
+        self.start_session = start_session
+        self.end_session = end_session
+        self.asset_sessions = asset_sessions
+        self.version = version
+
+    def write(self, rootdir):
+        metadata = {
+            'version': self.version,
+            'calendar_name': self.calendar.name,
+            'start_session': str(self.start_session.date()),
+            'end_session': str(self.end_session.date()),
+            'asset_sessions': {
+                str(sid): [str(first.date()), str(last.date())]
+                for sid, (first, last) in iteritems(self.asset_sessions)
+            },
+        }
+        with open(self.metadata_path(rootdir), 'w+') as fp:
+            json.dump(metadata, fp)
+
+
+class ParquetDailyBarWriter(object):
+    """
+    Class capable of writing daily OHLCV data to a parquet file.
+
+    All of the data is held in a single file, sorted by session and then by
+    sid, with one row group for every ``row_group_sessions`` sessions. The
+    sid column is dictionary encoded.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory into which to write the parquet file and its metadata.
+    calendar : trading_calendars.TradingCalendar
+        Calendar to use to compute asset calendar offsets.
+    start_session : pd.Timestamp
+        Midnight UTC session label.
+    end_session : pd.Timestamp
+        Midnight UTC session label.
+    row_group_sessions : int, optional
+        The number of sessions to store in each row group.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetDailyBarReader
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 row_group_sessions=DEFAULT_ROW_GROUP_SESSIONS):
+        _require_pyarrow()
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._row_group_sessions = row_group_sessions
+
+    @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
+    def write(self,
+              data,
+              assets=None,
+              show_progress=False,
+              invalid_data_behavior='warn'):
+        """
+        Parameters
+        ----------
+        data : iterable[tuple[int, pandas.DataFrame]]
+            The data chunks to write. Each chunk should be a tuple of sid
+            and the data for that asset, indexed by session.
+        assets : set[int], optional
+            The assets that should be in ``data``. If this is provided
+            we will check ``data`` against the assets and provide better
+            progress information.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        invalid_data_behavior : {'warn', 'raise', 'ignore'}, optional
+            What to do when a volume is encountered that is outside the range
+            of a uint32.
+        """
+        sessions = self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+        session_values = _dt_values(sessions)
+        known_assets = set(assets) if assets is not None else None
+
+        chunks = []
+        asset_sessions = {}
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label='Merging daily equity files:',
+            length=len(assets) if assets is not None else None,
+        )
+        with ctx as it:
+            for sid, df in it:
+                if known_assets is not None and sid not in known_assets:
+                    raise ValueError('unknown asset id %r' % sid)
+                if df.empty:
+                    continue
+
+                dts = _dt_values(df.index)
+                locs = session_values.searchsorted(dts)
+                invalid = (
+                    (locs == len(session_values)) |
+                    (session_values[np.minimum(
+                        locs,
+                        len(session_values) - 1,
+                    )] != dts)
+                )
+                if invalid.any():
+                    raise ValueError(
+                        'Got daily bars for sid={0} on non-sessions: '
+                        '{1}'.format(
+                            sid,
+                            pd.DatetimeIndex(dts[invalid], tz='UTC').tolist(),
+                        )
+                    )
+
+                df = winsorise_uint32(
+                    df.copy(),
+                    invalid_data_behavior,
+                    'volume',
+                )
+                chunks.append(pd.DataFrame({
+                    'dt': dts,
+                    'sid': np.full(len(dts), sid, dtype=np.int64),
+                    'open': df.open.values.astype(np.float64),
+                    'high': df.high.values.astype(np.float64),
+                    'low': df.low.values.astype(np.float64),
+                    'close': df.close.values.astype(np.float64),
+                    'volume': df.volume.values.astype(np.uint32),
+                }, columns=['dt', 'sid'] + list(OHLCV)))
+                asset_sessions[sid] = (
+                    sessions[locs.min()],
+                    sessions[locs.max()],
+                )
+
+        if chunks:
+            frame = pd.concat(chunks, ignore_index=True)
+        else:
+            frame = pd.DataFrame({
+                'dt': np.array([], dtype=np.int64),
+                'sid': np.array([], dtype=np.int64),
+                'open': np.array([], dtype=np.float64),
+                'high': np.array([], dtype=np.float64),
+                'low': np.array([], dtype=np.float64),
+                'close': np.array([], dtype=np.float64),
+                'volume': np.array([], dtype=np.uint32),
+            }, columns=['dt', 'sid'] + list(OHLCV))
+
+        order = np.lexsort((frame.sid.values, frame.dt.values))
+        frame = frame.iloc[order].reset_index(drop=True)
+
+        if not os.path.exists(self._rootdir):
+            os.makedirs(self._rootdir)
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        writer = pq.ParquetWriter(
+            os.path.join(self._rootdir, DAILY_BARS_FILENAME),
+            table.schema,
+            use_dictionary=True,
+        )
+        try:
+            # Write one row group per ``row_group_sessions`` sessions.
+            splits = np.unique(np.concatenate([
+                frame.dt.values.searchsorted(
+                    session_values[::self._row_group_sessions],
+                ),
+                [len(frame)],
+            ]))
+            for start_row, end_row in zip(splits[:-1], splits[1:]):
+                writer.write_table(
+                    pa.Table.from_pandas(
+                        frame.iloc[start_row:end_row],
+                        preserve_index=False,
+                    ),
+                    row_group_size=end_row - start_row,
+                )
+        finally:
+            writer.close()
+
+        ParquetBarMetadata(
+            self._calendar,
+            self._start_session,
+            self._end_session,
+            asset_sessions,
+        ).write(self._rootdir)
+
+
+class ParquetDailyBarReader(SessionBarReader):
+    """
+    Reader for daily bars written by ParquetDailyBarWriter.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the parquet file and its metadata.
+    row_group_cache_size : int, optional
+        The number of decoded row groups to keep in memory for spot value
+        lookups.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetDailyBarWriter
+    """
+    def __init__(self, rootdir, row_group_cache_size=8):
+        _require_pyarrow()
+        self._rootdir = rootdir
+        self._row_groups = LRU(row_group_cache_size)
+
+    @lazyval
+    def _metadata(self):
+        return ParquetBarMetadata.read(self._rootdir)
+
+    @lazyval
+    def _parquet_file(self):
+        return pq.ParquetFile(os.path.join(self._rootdir, DAILY_BARS_FILENAME))
+
+    @lazyval
+    def _row_group_bounds(self):
+        return _row_group_dt_bounds(self._parquet_file)
+
+    @lazyval
+    def trading_calendar(self):
+        return self._metadata.calendar
+
+    @lazyval
+    def sessions(self):
+        return self.trading_calendar.sessions_in_range(
+            self._metadata.start_session,
+            self._metadata.end_session,
+        )
+
+    @property
+    def last_available_dt(self):
+        return self.sessions[-1]
+
+    @lazyval
+    def first_trading_day(self):
+        asset_sessions = self._metadata.asset_sessions
+        if not asset_sessions:
+            return None
+        return min(first for first, _ in asset_sessions.values())
+
+    def _row_groups_in_range(self, start, end):
+        starts, ends = self._row_group_bounds
+        return np.flatnonzero((starts <= end) & (ends >= start))
+
+    def _read_row_group(self, i):
+        try:
+            return self._row_groups[i]
+        except KeyError:
+            frame = self._parquet_file.read_row_group(i).to_pandas()
+            arrays = self._row_groups[i] = {
+                column: frame[column].values for column in frame.columns
+            }
+            return arrays
+
+    def load_raw_arrays(self, columns, start_date, end_date, assets):
+        start_idx = self.sessions.get_loc(start_date)
+        end_idx = self.sessions.get_loc(end_date)
+        session_values = _dt_values(self.sessions[start_idx:end_idx + 1])
+        shape = len(session_values), len(assets)
+
+        results = []
+        for column in columns:
+            if column != 'volume':
+                results.append(np.full(shape, np.nan))
+            else:
+                results.append(np.zeros(shape, dtype=np.uint32))
+
+        sids = np.asarray(assets, dtype=np.int64)
+        if not len(sids):
+            return results
+        sorter = sids.argsort()
+        sorted_sids = sids[sorter]
+
+        row_groups = self._row_groups_in_range(
+            session_values[0],
+            session_values[-1],
+        )
+        for i in row_groups:
+            frame = self._parquet_file.read_row_group(
+                i,
+                columns=['dt', 'sid'] + list(columns),
+            ).to_pandas()
+            dts = frame.dt.values
+            row_sids = frame.sid.values.astype(np.int64)
+
+            sid_locs = np.minimum(
+                sorted_sids.searchsorted(row_sids),
+                len(sorted_sids) - 1,
+            )
+            wanted = (
+                (sorted_sids[sid_locs] == row_sids) &
+                (dts >= session_values[0]) &
+                (dts <= session_values[-1])
+            )
+            day_ix = session_values.searchsorted(dts[wanted])
+            asset_ix = sorter[sid_locs[wanted]]
+
+            for column, out in zip(columns, results):
+                values = frame[column].values[wanted]
+                if column == 'volume':
+                    out[day_ix, asset_ix] = values
+                else:
+                    # Prices of zero are missing data.
+                    out[day_ix, asset_ix] = np.where(
+                        values == 0,
+                        np.nan,
+                        values,
+                    )
+
+        return results
+
+    def _sid_row(self, sid, day):
+        """
+        Find the row group and row holding the bar for ``sid`` on ``day``.
+
+        Returns
+        -------
+        arrays, row : dict[str -> np.array], int or None
+            The decoded row group and the row in it, or None if the sid has no
+            bar on day.
+        """
+        try:
+            self.sessions.get_loc(day)
+        except KeyError:
+            raise NoDataOnDate(
+                "day={0} is outside of calendar={1}".format(day, self.sessions)
+            )
+
+        try:
+            first, last = self._metadata.asset_sessions[int(sid)]
+        except KeyError:
+            raise NoDataForSid('No daily data for sid {}.'.format(sid))
+        if day < first:
+            raise NoDataBeforeDate(
+                "No data on or before day={0} for sid={1}".format(day, sid)
+            )
+        if day > last:
+            raise NoDataAfterDate(
+                "No data on or after day={0} for sid={1}".format(day, sid)
+            )
+
+        day_value = day.value
+        row_groups = self._row_groups_in_range(day_value, day_value)
+        if not len(row_groups):
+            return None, None
+        arrays = self._read_row_group(row_groups[0])
+
+        dts = arrays['dt']
+        start, stop = dts.searchsorted([day_value, day_value + 1])
+        sids = arrays['sid'][start:stop]
+        row = start + sids.searchsorted(int(sid))
+        if row >= stop or arrays['sid'][row] != int(sid):
+            return None, None
+        return arrays, row
+
+    def get_value(self, sid, dt, field):
+        """
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        dt : pd.Timestamp
+            Midnight of the day for which data is requested.
+        field : string
+            The price field. e.g. ('open', 'high', 'low', 'close', 'volume')
+
+        Returns
+        -------
+        float
+            The spot price for field of the given sid on the given day, or nan
+            if there is no price. 0 is returned for missing volumes.
+
+        Raises
+        ------
+        NoDataOnDate
+            If the given day and sid is before or after the date range of the
+            equity.
+        """
+        arrays, row = self._sid_row(sid, dt)
+        if arrays is None:
+            return 0 if field == 'volume' else np.nan
+
+        value = arrays[field][row]
+        if field != 'volume' and value == 0:
+            return np.nan
+        return value
+
+    def get_last_traded_dt(self, asset, day):
+        try:
+            first, last = self._metadata.asset_sessions[int(asset)]
+        except KeyError:
+            return pd.NaT
+
+        sessions = self.sessions
+        search_ix = sessions.searchsorted(min(day, last), side='right') - 1
+        first_ix = sessions.get_loc(first)
+        while search_ix >= first_ix:
+            if self.get_value(asset, sessions[search_ix], 'volume') != 0:
+                return sessions[search_ix]
+            search_ix -= 1
+        return pd.NaT
+
+
+class ParquetMinuteBarWriter(object):
+    """
+    Class capable of writing minute OHLCV data to parquet files.
+
+    Each sid is written to its own file, with one row group for every
+    ``row_group_sessions`` sessions of data, so that readers can skip the row
+    groups outside of a query by looking at the row group statistics.
+
+    The file for a sid is kept open while data is written for it, and each
+    row group is appended once it is complete. The files and the metadata are
+    finished by ``close``, which ``write`` calls once all of its data has been
+    written.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory into which to write the parquet files and metadata.
+    calendar : trading_calendars.TradingCalendar
+        The trading calendar on which to base the minute bars.
+    start_session : pd.Timestamp
+        The first trading session in the data set.
+    end_session : pd.Timestamp
+        The last trading session in the data set.
+    minutes_per_day : int
+        The number of minutes per each period. Accepted for compatibility
+        with ``BcolzMinuteBarWriter``; only the minutes of each session are
+        stored.
+    row_group_sessions : int, optional
+        The number of sessions to store in each row group.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetMinuteBarReader
+    """
+    def __init__(self,
+                 rootdir,
+                 calendar,
+                 start_session,
+                 end_session,
+                 minutes_per_day,
+                 row_group_sessions=DEFAULT_ROW_GROUP_SESSIONS):
+        _require_pyarrow()
+        self._rootdir = rootdir
+        self._calendar = calendar
+        self._start_session = start_session
+        self._end_session = end_session
+        self._minutes_per_day = minutes_per_day
+        self._row_group_sessions = row_group_sessions
+        self._asset_sessions = {}
+        # The open writer, the buffered rows of the row group currently being
+        # filled, and the last written dt for the sids being written.
+        self._sid_writers = {}
+        self._pending_frames = {}
+        self._last_dts = {}
+        if not os.path.exists(rootdir):
+            os.makedirs(rootdir)
+        elif os.path.exists(ParquetBarMetadata.metadata_path(rootdir)):
+            self._asset_sessions = ParquetBarMetadata.read(
+                rootdir,
+            ).asset_sessions
+        self._write_metadata()
+
+    def _write_metadata(self):
+        ParquetBarMetadata(
+            self._calendar,
+            self._start_session,
+            self._end_session,
+            self._asset_sessions,
+        ).write(self._rootdir)
+
+    @lazyval
+    def _row_group_boundaries(self):
+        sessions = self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        )
+        # The row group boundaries are the opens of every
+        # ``row_group_sessions``th session.
+        return _dt_values(
+            self._calendar.schedule.market_open.loc[sessions].iloc[
+                ::self._row_group_sessions
+            ],
+        )
+
+    def sidpath(self, sid):
+        """
+        Parameters
+        ----------
+        sid : int
+            Asset identifier.
+
+        Returns
+        -------
+        out : string
+            Full path to the parquet file for the given sid.
+        """
+        return _sid_path(self._rootdir, sid)
+
+    def write(self, data, show_progress=False, invalid_data_behavior='warn'):
+        """Write a stream of minute data.
+
+        Parameters
+        ----------
+        data : iterable[(int, pd.DataFrame)]
+            The data to write. Each element should be a tuple of sid, data
+            where data has the following format:
+              columns : ('open', 'high', 'low', 'close', 'volume')
+                  open : float64
+                  high : float64
+                  low  : float64
+                  close : float64
+                  volume : float64|int64
+              index : DatetimeIndex of market minutes.
+            A given sid may appear more than once in ``data``; however,
+            the dates must be strictly increasing.
+        show_progress : bool, optional
+            Whether or not to show a progress bar while writing.
+        """
+        ctx = maybe_show_progress(
+            data,
+            show_progress=show_progress,
+            item_show_func=lambda e: e if e is None else str(e[0]),
+            label="Merging minute equity files:",
+        )
+        write_sid = self.write_sid
+        with ctx as it:
+            for e in it:
+                write_sid(*e, invalid_data_behavior=invalid_data_behavior)
+        self.close()
+
+    def write_sid(self, sid, df, invalid_data_behavior='warn'):
+        """
+        Write the OHLCV data for the given sid, appending to any data already
+        written for the sid.
+
+        The data is not guaranteed to be readable until ``close`` is called.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifer for the data being written.
+        df : pd.DataFrame
+            DataFrame of market data with the following characteristics.
+            columns : ('open', 'high', 'low', 'close', 'volume')
+                open : float64
+                high : float64
+                low  : float64
+                close : float64
+                volume : float64|int64
+            index : DatetimeIndex of market minutes.
+        """
+        if df.empty:
+            return
+
+        df = winsorise_uint32(df.copy(), invalid_data_behavior, 'volume')
+        frame = pd.DataFrame({
+            'dt': _dt_values(df.index),
+            'open': df.open.values.astype(np.float64),
+            'high': df.high.values.astype(np.float64),
+            'low': df.low.values.astype(np.float64),
+            'close': df.close.values.astype(np.float64),
+            'volume': df.volume.values.astype(np.uint32),
+        }, columns=['dt'] + list(OHLCV))
+
+        sid = int(sid)
+        if sid not in self._pending_frames:
+            path = self.sidpath(sid)
+            if os.path.exists(path):
+                # The file was finished by an earlier ``close``; parquet files
+                # cannot be appended to, so its rows are written again along
+                # with the new data.
+                existing = pq.read_table(path).to_pandas()
+                self._pending_frames[sid] = [existing]
+                if len(existing):
+                    self._last_dts[sid] = existing.dt.values[-1]
+            else:
+                dirname = os.path.dirname(path)
+                if not os.path.exists(dirname):
+                    os.makedirs(dirname)
+                self._pending_frames[sid] = []
+
+        last_dt = self._last_dts.get(sid)
+        if last_dt is not None and frame.dt.values[0] <= last_dt:
+            raise ValueError(
+                'Data for sid={0} already includes {1}'.format(
+                    sid,
+                    pd.Timestamp(frame.dt.values[0], tz='UTC'),
+                )
+            )
+        self._last_dts[sid] = frame.dt.values[-1]
+        self._pending_frames[sid].append(frame)
+        self._flush_sid(sid, final=False)
+
+        cal = self._calendar
+        last = cal.minute_to_session_label(
+            pd.Timestamp(frame.dt.values[-1], tz='UTC'),
+        )
+        try:
+            first, _ = self._asset_sessions[sid]
+        except KeyError:
+            first = cal.minute_to_session_label(
+                pd.Timestamp(frame.dt.values[0], tz='UTC'),
+            )
+        self._asset_sessions[sid] = first, last
+
+    def _flush_sid(self, sid, final):
+        """
+        Append the complete row groups buffered for ``sid`` to its file.
+
+        Parameters
+        ----------
+        sid : int
+            The asset identifier.
+        final : bool
+            Whether to also write the last, possibly incomplete, row group.
+        """
+        frames = self._pending_frames[sid]
+        if not frames:
+            return
+        if len(frames) == 1:
+            frame = frames[0]
+        else:
+            frame = pd.concat(frames, ignore_index=True)
+
+        groups = self._row_group_boundaries.searchsorted(
+            frame.dt.values,
+            side='right',
+        )
+        if final:
+            stop = len(frame)
+        else:
+            # Keep the rows of the last row group until it is complete.
+            stop = groups.searchsorted(groups[-1])
+
+        splits = np.concatenate([
+            [0],
+            np.flatnonzero(np.diff(groups[:stop])) + 1,
+            [stop],
+        ])
+        for start, end in zip(splits[:-1], splits[1:]):
+            if start == end:
+                continue
+            table = pa.Table.from_pandas(
+                frame.iloc[start:end],
+                preserve_index=False,
+            )
+            try:
+                writer = self._sid_writers[sid]
+            except KeyError:
+                writer = self._sid_writers[sid] = pq.ParquetWriter(
+                    self.sidpath(sid),
+                    table.schema,
+                )
+            writer.write_table(table, row_group_size=end - start)
+
+        if stop < len(frame):
+            self._pending_frames[sid] = [frame.iloc[stop:]]
+        else:
+            self._pending_frames[sid] = []
+
+    def close(self):
+        """
+        Write any buffered rows, finish the files of the sids written since
+        the last call, and write the metadata.
+        """
+        try:
+            for sid in list(self._pending_frames):
+                self._flush_sid(sid, final=True)
+        finally:
+            for writer in self._sid_writers.values():
+                writer.close()
+            self._sid_writers.clear()
+            self._pending_frames.clear()
+            self._last_dts.clear()
+        self._write_metadata()
+
+
+class ParquetMinuteBarReader(MinuteBarReader):
+    """
+    Reader for minute bars written by ParquetMinuteBarWriter.
+
+    Parameters
+    ----------
+    rootdir : str
+        The directory containing the parquet files and their metadata.
+    sid_cache_size : int, optional
+        The number of sids for which to keep the open parquet file and row
+        group statistics.
+    row_group_cache_size : int, optional
+        The number of decoded row groups to keep in memory for spot value
+        lookups.
+
+    See Also
+    --------
+    zipline.data.parquet_bars.ParquetMinuteBarWriter
+    """
+    def __init__(self, rootdir, sid_cache_size=3000, row_group_cache_size=64):
+        _require_pyarrow()
+        self._rootdir = rootdir
+        self._files = LRU(sid_cache_size)
+        self._row_groups = LRU(row_group_cache_size)
+
+    @lazyval
+    def _metadata(self):
+        return ParquetBarMetadata.read(self._rootdir)
+
+    @lazyval
+    def calendar(self):
+        return self._metadata.calendar
+
+    @property
+    def trading_calendar(self):
+        return self.calendar
+
+    @lazyval
+    def last_available_dt(self):
+        _, close = self.calendar.open_and_close_for_session(
+            self._metadata.end_session,
+        )
+        return close
+
+    @property
+    def first_trading_day(self):
+        return self._metadata.start_session
+
+    def _open_file(self, sid):
+        """
+        Get the open parquet file and the dt bounds of its row groups for the
+        given sid.
+        """
+        sid = int(sid)
+        try:
+            return self._files[sid]
+        except KeyError:
+            path = _sid_path(self._rootdir, sid)
+            if not os.path.exists(path):
+                raise NoDataForSid('No minute data for sid {}.'.format(sid))
+            parquet_file = pq.ParquetFile(path)
+            entry = self._files[sid] = (
+                parquet_file,
+                _row_group_dt_bounds(parquet_file),
+            )
+            return entry
+
+    def _read_row_group(self, sid, i):
+        key = int(sid), i
+        try:
+            return self._row_groups[key]
+        except KeyError:
+            parquet_file, _ = self._open_file(sid)
+            frame = parquet_file.read_row_group(i).to_pandas()
+            arrays = self._row_groups[key] = {
+                column: frame[column].values for column in frame.columns
+            }
+            return arrays
+
+    def get_value(self, sid, dt, field):
+        """
+        Retrieve the pricing info for the given sid, dt, and field.
+
+        Returns
+        -------
+        out : float|int
+            The market data for the given sid, dt, and field coordinates.
+            nan is returned for missing prices, and 0 for missing volumes.
+
+        Raises
+        ------
+        NoDataOnDate
+            If ``dt`` is not a market minute.
+        """
+        if not self.calendar.is_open_on_minute(dt):
+            raise NoDataOnDate()
+
+        parquet_file, (starts, ends) = self._open_file(sid)
+        dt_value = dt.value
+        row_groups = np.flatnonzero((starts <= dt_value) & (ends >= dt_value))
+        if len(row_groups):
+            arrays = self._read_row_group(sid, row_groups[0])
+            dts = arrays['dt']
+            row = dts.searchsorted(dt_value)
+            if row < len(dts) and dts[row] == dt_value:
+                value = arrays[field][row]
+                if value != 0:
+                    return value
+
+        return 0 if field == 'volume' else np.nan
+
+    def get_last_traded_dt(self, asset, dt):
+        try:
+            parquet_file, (starts, ends) = self._open_file(asset)
+        except NoDataForSid:
+            return pd.NaT
+
+        dt_value = dt.value
+        start_value = asset.start_date.value
+        for i in np.flatnonzero(starts <= dt_value)[::-1]:
+            if ends[i] < start_value:
+                break
+            arrays = self._read_row_group(asset, i)
+            dts = arrays['dt']
+            stop = dts.searchsorted(dt_value, side='right')
+            traded = np.flatnonzero(arrays['volume'][:stop])
+            if len(traded) and dts[traded[-1]] >= start_value:
+                return pd.Timestamp(dts[traded[-1]], tz='UTC')
+        return pd.NaT
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        """
+        Parameters
+        ----------
+        fields : list of str
+           'open', 'high', 'low', 'close', or 'volume'
+        start_dt: Timestamp
+           Beginning of the window range.
+        end_dt: Timestamp
+           End of the window range.
+        sids : list of int
+           The asset identifiers in the window.
+
+        Returns
+        -------
+        list of np.ndarray
+            A list with an entry per field of ndarrays with shape
+            (minutes in range, sids) with a dtype of float64, containing the
+            values for the respective field over start and end dt range.
+        """
+        minute_values = _dt_values(
+            self.calendar.minutes_in_range(start_dt, end_dt),
+        )
+        shape = len(minute_values), len(sids)
+
+        results = []
+        for field in fields:
+            if field != 'volume':
+                results.append(np.full(shape, np.nan))
+            else:
+                results.append(np.zeros(shape, dtype=np.uint32))
+
+        if not len(minute_values):
+            return results
+
+        start_value = minute_values[0]
+        end_value = minute_values[-1]
+        for asset_ix, sid in enumerate(sids):
+            try:
+                parquet_file, (starts, ends) = self._open_file(sid)
+            except NoDataForSid:
+                continue
+
+            for i in np.flatnonzero(
+                    (starts <= end_value) & (ends >= start_value)):
+                frame = parquet_file.read_row_group(
+                    i,
+                    columns=['dt'] + list(fields),
+                ).to_pandas()
+                dts = frame.dt.values
+                locs = np.minimum(
+                    minute_values.searchsorted(dts),
+                    len(minute_values) - 1,
+                )
+                # Drop any rows outside of the query or which are not market
+                # minutes.
+                wanted = minute_values[locs] == dts
+                locs = locs[wanted]
+
+                for field, out in zip(fields, results):
+                    values = frame[field].values[wanted]
+                    if field == 'volume':
+                        out[locs, asset_ix] = values
+                    else:
+                        out[locs, asset_ix] = np.where(
+                            values == 0,
+                            np.nan,
+                            values,
+                        )
+
+        return results
+
+
+__all__ = [
+    'ParquetBarMetadata',
+    'ParquetDailyBarReader',
+    'ParquetDailyBarWriter',
+    'ParquetMinuteBarReader',
+    'ParquetMinuteBarWriter',
+]
@@ -13,6 +13,11 @@
 # limitations under the License.
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
+import errno
+import json
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
 
 import numpy as np
 import pandas as pd
@@ -28,7 +33,9 @@ from zipline.data._resample import (
 from zipline.data.bar_reader import NoDataOnDate
 from zipline.data.minute_bars import MinuteBarReader
 from zipline.data.session_bars import SessionBarReader
+from zipline.data.us_equity_pricing import OHLCV
 from zipline.utils.memoize import lazyval
+from zipline.utils.paths import ensure_directory
 
 _MINUTE_TO_SESSION_OHCLV_HOW = OrderedDict((
     ('open', 'first'),
@@ -100,6 +107,158 @@ def minute_to_session(column, close_locs, data, out):
     return out
 
 
+def _first_valid(window):
+    """
+    The first non-nan value in each column of ``window``, or nan.
+    """
+    first = (~np.isnan(window)).argmax(axis=0)
+    return window[first, np.arange(window.shape[1])]
+
+
+def _last_valid(window):
+    """
+    The last non-nan value in each column of ``window``, or nan.
+    """
+    return _first_valid(window[::-1])
+
+
+def _aggregate_open(values, window):
+    # Once the first non-nan open is seen, it remains the open of the day.
+    return np.where(np.isnan(values), _first_valid(window), values)
+
+
+def _aggregate_high(values, window):
+    return np.fmax(values, np.fmax.reduce(window, axis=0))
+
+
+def _aggregate_low(values, window):
+    return np.fmin(values, np.fmin.reduce(window, axis=0))
+
+
+def _aggregate_close(values, window):
+    last = _last_valid(window)
+    return np.where(np.isnan(last), values, last)
+
+
+def _aggregate_volume(values, window):
+    return values + window.sum(axis=0, dtype=np.int64)
+
+
+_AGGREGATIONS = {
+    'open': _aggregate_open,
+    'high': _aggregate_high,
+    'low': _aggregate_low,
+    'close': _aggregate_close,
+    'volume': _aggregate_volume,
+}
+
+
+class _SessionAggregates(object):
+    """
+    The aggregated value of one field for each asset seen so far in a
+    session.
+
+    The state is held in arrays, indexed by the position at which each asset
+    was first seen in the session.
+
+    Parameters
+    ----------
+    field : str
+        The field being aggregated.
+    market_open : pd.Timestamp
+        The open of the session.
+    one_min : int
+        The length of one minute in nanoseconds.
+
+    Attributes
+    ----------
+    last_visited : np.array[int64]
+        The minute, as nanoseconds since the epoch, up to and including which
+        each asset has been aggregated. Assets which have not been aggregated
+        yet hold the minute before the market open.
+    values : np.array[float64 or int64]
+        The aggregated value of each asset as of ``last_visited``.
+    """
+    def __init__(self, field, market_open, one_min):
+        self.field = field
+        self.market_open = market_open
+        if field == 'volume':
+            self.missing_value = 0
+            self.dtype = np.int64
+        else:
+            self.missing_value = np.nan
+            self.dtype = np.float64
+        self._not_visited = market_open.value - one_min
+
+        self.assets = []
+        self._positions = {}
+        self.last_visited = np.array([], dtype=np.int64)
+        self.values = np.array([], dtype=self.dtype)
+
+        # The arguments and result of the last call to ``locs``, since the
+        # same assets are usually requested every minute.
+        self._last_assets = None
+        self._last_locs = None
+
+    def reset(self, locs):
+        """
+        Mark the assets at ``locs`` as not yet aggregated.
+        """
+        self.last_visited[locs] = self._not_visited
+        self.values[locs] = self.missing_value
+
+    def locs(self, assets, session):
+        """
+        Get the positions in the state of ``assets``, adding any assets which
+        have not been seen yet.
+
+        Returns
+        -------
+        out_ixs : np.array[intp]
+            The locations in ``assets`` of the assets which are alive in
+            ``session``.
+        locs : np.array[intp]
+            The positions in the state of those assets.
+        """
+        assets = tuple(assets)
+        if assets == self._last_assets:
+            return self._last_locs
+
+        positions = self._positions
+        out_ixs = []
+        locs = []
+        new_assets = []
+        for i, asset in enumerate(assets):
+            if not asset.is_alive_for_session(session):
+                continue
+            try:
+                loc = positions[asset]
+            except KeyError:
+                loc = positions[asset] = len(self.assets) + len(new_assets)
+                new_assets.append(asset)
+            out_ixs.append(i)
+            locs.append(loc)
+
+        if new_assets:
+            self.assets.extend(new_assets)
+            self.last_visited = np.append(
+                self.last_visited,
+                np.full(len(new_assets), self._not_visited, dtype=np.int64),
+            )
+            self.values = np.append(
+                self.values,
+                np.full(len(new_assets), self.missing_value, self.dtype),
+            )
+
+        result = (
+            np.array(out_ixs, dtype=np.intp),
+            np.array(locs, dtype=np.intp),
+        )
+        self._last_assets = assets
+        self._last_locs = result
+        return result
+
+
 class DailyHistoryAggregator(object):
     """
     Converts minute pricing data into a daily summary, to be used for the
@@ -119,23 +278,17 @@ class DailyHistoryAggregator(object):
         self._minute_reader = minute_reader
         self._trading_calendar = trading_calendar
 
-        # The caches are structured as (date, market_open, entries), where
-        # entries is a dict of asset -> (last_visited_dt, value)
+        # The caches are structured as (session, aggregates), where
+        # aggregates is a _SessionAggregates holding the last visited dt and
+        # the aggregated value of each asset seen in the session.
         #
-        # Whenever an aggregation method determines the current value,
-        # the entry for the respective asset should be overwritten with a new
-        # entry for the current dt.value (int) and aggregation value.
+        # Each call aggregates the minutes between the last visited dt of
+        # each requested asset and the requested dt, with one read from the
+        # minute reader for all of the assets, and then moves their last
+        # visited dt forward to the requested dt.
         #
         # When the requested dt's date is different from date the cache is
         # flushed, so that the cache entries do not grow unbounded.
-        #
-        # Example cache:
-        # cache = (date(2016, 3, 17),
-        #          pd.Timestamp('2016-03-17 13:31', tz='UTC'),
-        #          {
-        #              1: (1458221460000000000, np.nan),
-        #              2: (1458221460000000000, 42.0),
-        #         })
         self._caches = {
             'open': None,
             'high': None,
@@ -150,19 +303,62 @@ class DailyHistoryAggregator(object):
 
     def _prelude(self, dt, field):
         session = self._trading_calendar.minute_to_session_label(dt)
-        dt_value = dt.value
         cache = self._caches[field]
         if cache is None or cache[0] != session:
-            market_open = self._market_opens.loc[session]
-            cache = self._caches[field] = (session, market_open, {})
+            market_open = self._market_opens.loc[session].tz_localize('UTC')
+            cache = self._caches[field] = (
+                session,
+                _SessionAggregates(field, market_open, self._one_min),
+            )
+        return cache
 
-        _, market_open, entries = cache
-        market_open = market_open.tz_localize('UTC')
-        if dt != market_open:
-            prev_dt = dt_value - self._one_min
-        else:
-            prev_dt = None
-        return market_open, prev_dt, dt_value, entries
+    def _aggregate(self, field, assets, dt):
+        session, aggregates = self._prelude(dt, field)
+        dt_value = dt.value
+        one_min = self._one_min
+
+        out_ixs, locs = aggregates.locs(assets, session)
+
+        stale_locs = locs[aggregates.last_visited[locs] != dt_value]
+        if len(stale_locs):
+            # Assets may be requested more than once.
+            stale_locs = np.unique(stale_locs)
+
+            # Start over from the market open for assets which were last
+            # visited after dt.
+            last_visited = aggregates.last_visited[stale_locs]
+            rewound = stale_locs[last_visited > dt_value]
+            if len(rewound):
+                aggregates.reset(rewound)
+
+            starts = aggregates.last_visited[stale_locs] + one_min
+            window_start = starts.min()
+
+            window = self._minute_reader.load_raw_arrays(
+                [field],
+                pd.Timestamp(window_start, tz='UTC'),
+                dt,
+                [aggregates.assets[loc] for loc in stale_locs],
+            )[0]
+
+            # The minutes in a session are contiguous, so each row of the
+            # window is one minute after the previous row. Hide the minutes
+            # which were already aggregated for each asset.
+            first_rows = (starts - window_start) // one_min
+            seen = np.arange(len(window))[:, np.newaxis] < first_rows
+            if seen.any():
+                window = window.copy()
+                window[seen] = 0 if field == 'volume' else np.nan
+
+            aggregates.values[stale_locs] = _AGGREGATIONS[field](
+                aggregates.values[stale_locs],
+                window,
+            )
+            aggregates.last_visited[stale_locs] = dt_value
+
+        out = np.full(len(assets), aggregates.missing_value, aggregates.dtype)
+        out[out_ixs] = aggregates.values[locs]
+        return out
 
     def opens(self, assets, dt):
         """
@@ -177,64 +373,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'open')
-
-        opens = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                opens.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'open')
-                entries[asset] = (dt_value, val)
-                opens.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, first_open = entries[asset]
-                    if last_visited_dt == dt_value:
-                        opens.append(first_open)
-                        continue
-                    elif not pd.isnull(first_open):
-                        opens.append(first_open)
-                        entries[asset] = (dt_value, first_open)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['open'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        nonnan = window[~pd.isnull(window)]
-                        if len(nonnan):
-                            val = nonnan[0]
-                        else:
-                            val = np.nan
-                        entries[asset] = (dt_value, val)
-                        opens.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['open'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    nonnan = window[~pd.isnull(window)]
-                    if len(nonnan):
-                        val = nonnan[0]
-                    else:
-                        val = np.nan
-                    entries[asset] = (dt_value, val)
-                    opens.append(val)
-                    continue
-        return np.array(opens)
+        return self._aggregate('open', assets, dt)
 
     def highs(self, assets, dt):
         """
@@ -246,64 +385,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'high')
-
-        highs = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                highs.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'high')
-                entries[asset] = (dt_value, val)
-                highs.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_max = entries[asset]
-                    if last_visited_dt == dt_value:
-                        highs.append(last_max)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'high')
-                        if pd.isnull(curr_val):
-                            val = last_max
-                        elif pd.isnull(last_max):
-                            val = curr_val
-                        else:
-                            val = max(last_max, curr_val)
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['high'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmax(np.append(window, last_max))
-                        entries[asset] = (dt_value, val)
-                        highs.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['high'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmax(window)
-                    entries[asset] = (dt_value, val)
-                    highs.append(val)
-                    continue
-        return np.array(highs)
+        return self._aggregate('high', assets, dt)
 
     def lows(self, assets, dt):
         """
@@ -315,59 +397,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'low')
-
-        lows = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                lows.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'low')
-                entries[asset] = (dt_value, val)
-                lows.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_min = entries[asset]
-                    if last_visited_dt == dt_value:
-                        lows.append(last_min)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        curr_val = self._minute_reader.get_value(
-                            asset, dt, 'low')
-                        val = np.nanmin([last_min, curr_val])
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['low'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0].T
-                        val = np.nanmin(np.append(window, last_min))
-                        entries[asset] = (dt_value, val)
-                        lows.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['low'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0].T
-                    val = np.nanmin(window)
-                    entries[asset] = (dt_value, val)
-                    lows.append(val)
-                    continue
-        return np.array(lows)
+        return self._aggregate('low', assets, dt)
 
     def closes(self, assets, dt):
         """
@@ -381,69 +411,7 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=float64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'close')
-
-        closes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
-
-        def _get_filled_close(asset):
-            """
-            Returns the most recent non-nan close for the asset in this
-            session. If there has been no data in this session on or before the
-            `dt`, returns `nan`
-            """
-            window = self._minute_reader.load_raw_arrays(
-                ['close'],
-                market_open,
-                dt,
-                [asset],
-            )[0]
-            try:
-                return window[~np.isnan(window)][-1]
-            except IndexError:
-                return np.NaN
-
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                closes.append(np.NaN)
-                continue
-
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'close')
-                entries[asset] = (dt_value, val)
-                closes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_close = entries[asset]
-                    if last_visited_dt == dt_value:
-                        closes.append(last_close)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = last_close
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                    else:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'close')
-                        if pd.isnull(val):
-                            val = _get_filled_close(asset)
-                        entries[asset] = (dt_value, val)
-                        closes.append(val)
-                        continue
-                except KeyError:
-                    val = self._minute_reader.get_value(
-                        asset, dt, 'close')
-                    if pd.isnull(val):
-                        val = _get_filled_close(asset)
-                    entries[asset] = (dt_value, val)
-                    closes.append(val)
-                    continue
-        return np.array(closes)
+        return self._aggregate('close', assets, dt)
 
     def volumes(self, assets, dt):
         """
@@ -455,66 +423,265 @@ class DailyHistoryAggregator(object):
         -------
         np.array with dtype=int64, in order of assets parameter.
         """
-        market_open, prev_dt, dt_value, entries = self._prelude(dt, 'volume')
+        return self._aggregate('volume', assets, dt)
 
-        volumes = []
-        session_label = self._trading_calendar.minute_to_session_label(dt)
 
-        for asset in assets:
-            if not asset.is_alive_for_session(session_label):
-                volumes.append(0)
-                continue
+class _StoredSessionBars(object):
+    """
+    The resampled session bars stored in one version of the cache of a
+    MinuteResampleSessionBarReader.
 
-            if prev_dt is None:
-                val = self._minute_reader.get_value(asset, dt, 'volume')
-                entries[asset] = (dt_value, val)
-                volumes.append(val)
-                continue
-            else:
-                try:
-                    last_visited_dt, last_total = entries[asset]
-                    if last_visited_dt == dt_value:
-                        volumes.append(last_total)
-                        continue
-                    elif last_visited_dt == prev_dt:
-                        val = self._minute_reader.get_value(
-                            asset, dt, 'volume')
-                        val += last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                    else:
-                        after_last = pd.Timestamp(
-                            last_visited_dt + self._one_min, tz='UTC')
-                        window = self._minute_reader.load_raw_arrays(
-                            ['volume'],
-                            after_last,
-                            dt,
-                            [asset],
-                        )[0]
-                        val = np.nansum(window) + last_total
-                        entries[asset] = (dt_value, val)
-                        volumes.append(val)
-                        continue
-                except KeyError:
-                    window = self._minute_reader.load_raw_arrays(
-                        ['volume'],
-                        market_open,
-                        dt,
-                        [asset],
-                    )[0]
-                    val = np.nansum(window)
-                    entries[asset] = (dt_value, val)
-                    volumes.append(val)
-                    continue
-        return np.array(volumes)
+    Each column is stored as a ``<column>.npy`` array of shape
+    (sessions, sids), in the order of the sids in ``sids.npy``, and is read
+    through a memory map. The columns are mapped when the bars are opened,
+    so they can still be read once the version has been removed.
+
+    Parameters
+    ----------
+    path : str
+        The directory holding the arrays.
+    """
+    METADATA_FILENAME = 'metadata.json'
+    SIDS_FILENAME = 'sids.npy'
+
+    def __init__(self, path):
+        self.path = path
+        self.sids = np.load(os.path.join(path, self.SIDS_FILENAME))
+        self._positions = {sid: i for i, sid in enumerate(self.sids.tolist())}
+        self._columns = {
+            name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r')
+            for name in OHLCV
+        }
+
+    @classmethod
+    def open(cls, path, sessions):
+        """
+        Open the bars stored at ``path``, or return None if they are
+        incomplete or were resampled over a range other than ``sessions``.
+        """
+        try:
+            with open(os.path.join(path, cls.METADATA_FILENAME)) as f:
+                metadata = json.load(f)
+            start_session_ns = metadata['start_session_ns']
+            end_session_ns = metadata['end_session_ns']
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+
+        if (start_session_ns != sessions[0].value or
+                end_session_ns != sessions[-1].value):
+            return None
+        try:
+            return cls(path)
+        except (IOError, OSError):
+            # The version was removed while we were opening it.
+            return None
+
+    @classmethod
+    def write(cls, path, sessions, sids, columns):
+        """
+        Write the arrays in ``columns``, a dict from column name to an array
+        of shape (sessions, sids), to ``path``.
+        """
+        np.save(
+            os.path.join(path, cls.SIDS_FILENAME),
+            np.asarray(sids, dtype=np.int64),
+        )
+        for name, values in columns.items():
+            np.save(os.path.join(path, name + '.npy'), values)
+
+        # The metadata is written last, so that bars without it are treated
+        # as missing.
+        with open(os.path.join(path, cls.METADATA_FILENAME), 'w') as f:
+            json.dump(
+                {
+                    'start_session_ns': int(sessions[0].value),
+                    'end_session_ns': int(sessions[-1].value),
+                },
+                f,
+            )
+
+    def __contains__(self, sid):
+        return int(sid) in self._positions
+
+    def column(self, name):
+        return self._columns[name]
+
+    def locs(self, sids):
+        positions = self._positions
+        return np.array([positions[int(sid)] for sid in sids], dtype=np.intp)
 
 
 class MinuteResampleSessionBarReader(SessionBarReader):
+    """
+    A SessionBarReader which resamples the bars of a MinuteBarReader into
+    session bars.
+
+    Parameters
+    ----------
+    calendar : TradingCalendar
+        The calendar of the minute bars.
+    minute_bar_reader : MinuteBarReader
+        The reader of the minute bars to resample.
+    cache_path : str, optional
+        The directory in which to store the session bars of each asset once
+        they have been resampled. Reads of assets which are already stored,
+        including by other readers using the same path, are then served from
+        the stored bars instead of resampling the minute bars. The stored bars
+        are only valid for the minute bars they were resampled from, so this
+        should be specific to that data, for example
+        :func:`zipline.data.bundles.core.resampled_daily_path` for the minute
+        bars of a bundle ingestion. If not provided, the minute bars are
+        resampled on every read.
+
+    Notes
+    -----
+    Storing new assets writes a new version of the bars, in a numbered
+    subdirectory of ``cache_path``, along with the bars of the latest
+    version. The earlier versions are then removed. Readers which already
+    opened one of them keep reading it through their memory maps.
+    """
 
-    def __init__(self, calendar, minute_bar_reader):
+    def __init__(self, calendar, minute_bar_reader, cache_path=None):
         self._calendar = calendar
         self._minute_bar_reader = minute_bar_reader
+        self._cache_path = cache_path
+        self._stored_bars = None
+
+    def _versions(self):
+        """
+        The versions of the stored bars in the cache path, in ascending order.
+        """
+        try:
+            names = os.listdir(self._cache_path)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+            return []
+        return sorted(int(name) for name in names if name.isdigit())
+
+    def _open_cache(self):
+        """
+        Open the latest version of the stored bars, or return None if there
+        are none or they were resampled from a different range of sessions.
+        """
+        while True:
+            versions = self._versions()
+            if not versions:
+                return None
+            path = os.path.join(self._cache_path, str(versions[-1]))
+            bars = _StoredSessionBars.open(path, self.sessions)
+            if bars is not None or os.path.exists(path):
+                return bars
+            # Another reader removed the version after storing a newer one.
+
+    def _cached_bars(self, sids):
+        """
+        Get the stored session bars which include ``sids``, resampling and
+        storing any of ``sids`` which are not stored yet.
+        """
+        bars = self._stored_bars
+        if bars is None or not all(sid in bars for sid in sids):
+            # Another reader may have stored the sids since we last looked.
+            bars = self._open_cache()
+
+        if bars is None:
+            missing = OrderedDict((int(sid), sid) for sid in sids)
+        else:
+            missing = OrderedDict(
+                (int(sid), sid) for sid in sids if sid not in bars
+            )
+        if missing:
+            bars = self._store(list(missing.values()), bars)
+
+        self._stored_bars = bars
+        return bars
+
+    def _store(self, sids, previous_bars):
+        """
+        Resample the minute bars of ``sids`` and write them, along with the
+        bars in ``previous_bars``, as a new version in the cache path.
+        """
+        sessions = self.sessions
+        columns = list(OHLCV)
+
+        if previous_bars is None:
+            previous_sids = np.array([], dtype=np.int64)
+        else:
+            previous_sids = previous_bars.sids
+        all_sids = np.concatenate([
+            previous_sids,
+            np.array([int(sid) for sid in sids], dtype=np.int64),
+        ])
+
+        arrays = {}
+        for column in columns:
+            out = np.empty(
+                (len(sessions), len(all_sids)),
+                dtype=np.uint32 if column == 'volume' else np.float64,
+            )
+            if len(previous_sids):
+                out[:, :len(previous_sids)] = previous_bars.column(column)
+            arrays[column] = out
+
+        for i, sid in enumerate(sids, len(previous_sids)):
+            resampled = self._get_resampled(
+                columns,
+                sessions[0],
+                sessions[-1],
+                [sid],
+            )
+            for column, values in zip(columns, resampled):
+                arrays[column][:, i] = values[:, 0]
+
+        # Write the bars next to the versions and then move them into place,
+        # so that readers never see a partially written version.
+        ensure_directory(self._cache_path)
+        tmpdir = mkdtemp(prefix='.resample-', dir=self._cache_path)
+        try:
+            _StoredSessionBars.write(tmpdir, sessions, all_sids, arrays)
+
+            versions = self._versions()
+            version = versions[-1] + 1 if versions else 0
+            while True:
+                path = os.path.join(self._cache_path, str(version))
+                try:
+                    os.rename(tmpdir, path)
+                except OSError as e:
+                    # Another reader stored this version first.
+                    if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                        raise
+                    version += 1
+                else:
+                    break
+        except BaseException:
+            rmtree(tmpdir, ignore_errors=True)
+            raise
+
+        bars = _StoredSessionBars(path)
+        self._remove_versions_before(version)
+        return bars
+
+    def _remove_versions_before(self, version):
+        """
+        Remove the stored versions older than ``version``.
+        """
+        for superseded in self._versions():
+            if superseded >= version:
+                break
+            # Move the version out of the way before removing it, so that
+            # readers never open a partially removed version.
+            tmpdir = mkdtemp(prefix='.superseded-', dir=self._cache_path)
+            try:
+                os.rename(
+                    os.path.join(self._cache_path, str(superseded)),
+                    os.path.join(tmpdir, 'bars'),
+                )
+            except OSError as e:
+                # Another reader removed this version first.
+                if e.errno != errno.ENOENT:
+                    raise
+            finally:
+                rmtree(tmpdir, ignore_errors=True)
 
     def _get_resampled(self, columns, start_session, end_session, assets):
         range_open = self._calendar.session_open(start_session)
@@ -566,9 +733,24 @@ class MinuteResampleSessionBarReader(SessionBarReader):
         return self._calendar
 
     def load_raw_arrays(self, columns, start_dt, end_dt, sids):
+        if self._cache_path is not None:
+            bars = self._cached_bars(sids)
+            start_ix = self.sessions.get_loc(start_dt)
+            end_ix = self.sessions.get_loc(end_dt)
+            locs = bars.locs(sids)
+            return [
+                bars.column(column)[start_ix:end_ix + 1][:, locs]
+                for column in columns
+            ]
         return self._get_resampled(columns, start_dt, end_dt, sids)
 
     def get_value(self, sid, session, colname):
+        if self._cache_path is not None:
+            bars = self._cached_bars([sid])
+            return bars.column(colname)[
+                self.sessions.get_loc(session),
+                bars.locs([sid])[0],
+            ]
         # WARNING: This will need caching or other optimization if used in a
         # tight loop.
         # This was developed to complete interface, but has not been tuned
@@ -645,6 +827,9 @@ class ReindexBarReader(with_metaclass(ABCMeta)):
     def get_last_traded_dt(self, sid, dt):
         return self._reader.get_last_traded_dt(sid, dt)
 
+    def get_last_traded_dts(self, assets, dt):
+        return self._reader.get_last_traded_dts(assets, dt)
+
     @property
     def first_trading_day(self):
         return self._reader.first_trading_day
@@ -13,6 +13,7 @@
 # limitations under the License.
 from errno import ENOENT
 from functools import partial
+import os
 from os import remove
 import sqlite3
 import warnings
@@ -34,6 +35,7 @@ from numpy import (
     issubdtype,
     nan,
     uint32,
+    zeros,
 )
 from pandas import (
     DataFrame,
@@ -54,6 +56,7 @@ from toolz import compose
 from trading_calendars import get_calendar
 
 from zipline.data.session_bars import SessionBarReader
+from zipline.lib.adjustment import Float64Multiply
 from zipline.data.bar_reader import (
     NoDataAfterDate,
     NoDataBeforeDate,
@@ -65,16 +68,18 @@ from zipline.utils.input_validation import (
     preprocess,
 )
 from zipline.utils.numpy_utils import iNaT
+from zipline.utils.pandas_utils import timedelta_to_integral_seconds
 from zipline.utils.sqlite_utils import group_into_chunks, coerce_string_to_conn
 from zipline.utils.memoize import lazyval
 from zipline.utils.cli import maybe_show_progress
 from ._equities import _compute_row_slices, _read_bcolz_data
-from ._adjustments import load_adjustments_from_sqlite
+from .adjustment_index import AdjustmentIndex
 
 
 logger = logbook.Logger('UsEquityPricing')
 
 OHLC = frozenset(['open', 'high', 'low', 'close'])
+OHLCV = ('open', 'high', 'low', 'close', 'volume')
 US_EQUITY_PRICING_BCOLZ_COLUMNS = (
     'open', 'high', 'low', 'close', 'volume', 'day', 'id'
 )
@@ -85,6 +90,18 @@ SQLITE_ADJUSTMENT_COLUMN_DTYPES = {
 }
 SQLITE_ADJUSTMENT_TABLENAMES = frozenset(['splits', 'dividends', 'mergers'])
 
+EPOCH = Timestamp(0, tz='UTC')
+
+# Name of the directory, inside of a daily bar ctable's rootdir, which holds
+# the uncompressed copies of the OHLCV columns used for memory mapping.
+DAILY_BAR_MMAP_DIRNAME = '__mmap__'
+DAILY_BAR_MMAP_INDEX_DTYPE = np.dtype([
+    ('sid', int64),
+    ('first_row', int64),
+    ('last_row', int64),
+    ('calendar_offset', int64),
+])
+
 SQLITE_DIVIDEND_PAYOUT_COLUMN_DTYPES = {
     'sid': integer,
     'ex_date': integer,
@@ -177,6 +194,17 @@ class BcolzDailyBarWriter(object):
         Midnight UTC session label.
     end_session: pd.Timestamp
         Midnight UTC session label.
+    write_mmap : bool, optional
+        If True, also write uncompressed copies of the OHLCV columns, along
+        with an index of the row range of each asset, which
+        ``BcolzDailyBarReader`` will memory map instead of reading through
+        bcolz. Default is False.
+    previous_bars : BcolzDailyBarReader, optional
+        The bars of a previous ingestion to append to. The new bars for each
+        sid are written after the previous bars for that sid, replacing any
+        previous bars on the same sessions, and the previous bars for sids
+        without new data are copied over. Sessions between the previous and
+        the new bars of a sid are filled with zeros.
 
     See Also
     --------
@@ -190,8 +218,16 @@ class BcolzDailyBarWriter(object):
         'volume': float64,
     }
 
-    def __init__(self, filename, calendar, start_session, end_session):
+    def __init__(self,
+                 filename,
+                 calendar,
+                 start_session,
+                 end_session,
+                 write_mmap=False,
+                 previous_bars=None):
         self._filename = filename
+        self._write_mmap = write_mmap
+        self._previous_bars = previous_bars
 
         if start_session != end_session:
             if not calendar.is_session(start_session):
@@ -241,11 +277,17 @@ class BcolzDailyBarWriter(object):
         table : bcolz.ctable
             The newly-written table.
         """
+        data = (
+            (sid, self.to_ctable(df, invalid_data_behavior))
+            for sid, df in data
+        )
+        if self._previous_bars is not None:
+            data = self._append_to_previous_bars(data)
+            if assets is not None:
+                assets = set(assets).union(self._previous_bars._first_rows)
+
         ctx = maybe_show_progress(
-            (
-                (sid, self.to_ctable(df, invalid_data_behavior))
-                for sid, df in data
-            ),
+            data,
             show_progress=show_progress,
             item_show_func=self.progress_bar_item_show_func,
             label=self.progress_bar_message,
@@ -284,6 +326,67 @@ class BcolzDailyBarWriter(object):
             invalid_data_behavior=invalid_data_behavior,
         )
 
+    def _append_to_previous_bars(self, iterator):
+        """
+        Prepend the bars in ``self._previous_bars`` to the bars for each asset
+        in ``iterator``, then yield the previous bars for the assets which
+        were not in ``iterator``.
+
+        `iterator` should be an iterator yielding pairs of (asset, ctable).
+        """
+        reader = self._previous_bars
+        first_rows = reader._first_rows
+        last_rows = reader._last_rows
+        colnames = list(OHLCV) + ['day']
+
+        session_seconds = self._calendar.sessions_in_range(
+            self._start_session,
+            self._end_session,
+        ).asi8 // 10 ** 9
+
+        seen = set()
+        for asset_id, table in iterator:
+            seen.add(asset_id)
+            try:
+                first_row = first_rows[asset_id]
+            except KeyError:
+                yield asset_id, table
+                continue
+
+            previous = reader._table[first_row:last_rows[asset_id] + 1]
+            new_days = table['day'][:]
+            if len(new_days):
+                previous = previous[previous['day'] < new_days[0]]
+                if len(previous):
+                    gap = session_seconds[
+                        (session_seconds > previous['day'][-1]) &
+                        (session_seconds < new_days[0])
+                    ]
+                else:
+                    gap = session_seconds[:0]
+            else:
+                gap = session_seconds[:0]
+
+            yield asset_id, ctable(
+                columns=[
+                    np.concatenate([
+                        previous[colname],
+                        (
+                            gap if colname == 'day' else zeros(len(gap))
+                        ).astype(uint32),
+                        table[colname][:],
+                    ])
+                    for colname in colnames
+                ],
+                names=colnames,
+            )
+
+        for asset_id in sorted(first_rows):
+            if asset_id not in seen:
+                yield asset_id, reader._table[
+                    first_rows[asset_id]:last_rows[asset_id] + 1
+                ]
+
     def _write_internal(self, iterator, assets):
         """
         Internal implementation of write.
@@ -404,8 +507,46 @@ class BcolzDailyBarWriter(object):
         full_table.attrs['start_session_ns'] = self._start_session.value
         full_table.attrs['end_session_ns'] = self._end_session.value
         full_table.flush()
+
+        if self._write_mmap:
+            self._write_mmap_columns(
+                full_table,
+                first_row,
+                last_row,
+                calendar_offset,
+            )
         return full_table
 
+    def _write_mmap_columns(self,
+                            table,
+                            first_row,
+                            last_row,
+                            calendar_offset):
+        """
+        Write uncompressed ``.npy`` copies of the OHLCV columns of ``table``
+        and a sorted index of the row range of each asset.
+        """
+        mmap_dir = os.path.join(self._filename, DAILY_BAR_MMAP_DIRNAME)
+        if not os.path.exists(mmap_dir):
+            os.makedirs(mmap_dir)
+
+        for column_name in OHLCV:
+            np.save(
+                os.path.join(mmap_dir, column_name + '.npy'),
+                table[column_name][:],
+            )
+
+        index = np.empty(len(first_row), dtype=DAILY_BAR_MMAP_INDEX_DTYPE)
+        for i, asset_key in enumerate(first_row):
+            index[i] = (
+                int(asset_key),
+                first_row[asset_key],
+                last_row[asset_key],
+                calendar_offset[asset_key],
+            )
+        index.sort(order='sid')
+        np.save(os.path.join(mmap_dir, 'index.npy'), index)
+
     @expect_element(invalid_data_behavior={'warn', 'raise', 'ignore'})
     def to_ctable(self, raw_data, invalid_data_behavior):
         if isinstance(raw_data, ctable):
@@ -436,6 +577,13 @@ class BcolzDailyBarReader(SessionBarReader):
         all of the data for all assets into memory and then indexing into that
         array for each day and asset pair.  Used to tune performance of reads
         when using a small or large number of equities.
+    use_mmap : bool, optional
+        If True, and the table was written with ``write_mmap=True``, read
+        OHLCV data by memory mapping the uncompressed copies of the columns
+        instead of decompressing the bcolz carrays. Reads then only touch the
+        pages needed for the requested rows, and the pages are shared through
+        the OS page cache by every process reading the same table.
+        Default is True.
 
     Attributes
     ----------
@@ -492,7 +640,7 @@ class BcolzDailyBarReader(SessionBarReader):
     --------
     zipline.data.us_equity_pricing.BcolzDailyBarWriter
     """
-    def __init__(self, table, read_all_threshold=3000):
+    def __init__(self, table, read_all_threshold=3000, use_mmap=True):
         self._maybe_table_rootdir = table
         # Cache of fully read np.array for the carrays in the daily bar table.
         # raw_array does not use the same cache, but it could.
@@ -501,6 +649,7 @@ class BcolzDailyBarReader(SessionBarReader):
         self._spot_cols = {}
         self.PRICE_ADJUSTMENT_FACTOR = 0.001
         self._read_all_threshold = read_all_threshold
+        self._use_mmap = use_mmap
 
     @lazyval
     def _table(self):
@@ -509,6 +658,61 @@ class BcolzDailyBarReader(SessionBarReader):
             return maybe_table_rootdir
         return ctable(rootdir=maybe_table_rootdir, mode='r')
 
+    @lazyval
+    def _mmap_dir(self):
+        """
+        The directory holding the memory mappable copies of the columns, or
+        None if they were not written or ``use_mmap`` is False.
+        """
+        if not self._use_mmap:
+            return None
+        rootdir = self._table.rootdir
+        if rootdir is None:
+            return None
+        mmap_dir = os.path.join(rootdir, DAILY_BAR_MMAP_DIRNAME)
+        if not os.path.isdir(mmap_dir):
+            return None
+        return mmap_dir
+
+    @lazyval
+    def _mmap_index(self):
+        return np.load(os.path.join(self._mmap_dir, 'index.npy'))
+
+    def _mmap_column(self, colname):
+        try:
+            return self._spot_cols[colname]
+        except KeyError:
+            col = self._spot_cols[colname] = np.load(
+                os.path.join(self._mmap_dir, colname + '.npy'),
+                mmap_mode='r',
+            )
+            return col
+
+    def _mmap_index_locs(self, sids):
+        """
+        Get the locations of ``sids`` in the memory mapped index.
+
+        Raises
+        ------
+        KeyError
+            If any of the sids are not in the table.
+        """
+        sids = np.asarray(sids, dtype=int64)
+        index_sids = self._mmap_index['sid']
+        if not len(index_sids):
+            if len(sids):
+                raise KeyError(sids.tolist())
+            return np.array([], dtype=int64)
+
+        locs = index_sids.searchsorted(sids)
+        missing = (
+            (locs == len(index_sids)) |
+            (index_sids[np.minimum(locs, len(index_sids) - 1)] != sids)
+        )
+        if missing.any():
+            raise KeyError(sids[missing].tolist())
+        return locs
+
     @lazyval
     def sessions(self):
         if 'calendar' in self._table.attrs.attrs:
@@ -621,6 +825,13 @@ class BcolzDailyBarReader(SessionBarReader):
         # Assumes that the given dates are actually in calendar.
         start_idx = self.sessions.get_loc(start_date)
         end_idx = self.sessions.get_loc(end_date)
+        if self._mmap_dir is not None:
+            return self._load_raw_arrays_mmap(
+                columns,
+                start_idx,
+                end_idx,
+                assets,
+            )
         first_rows, last_rows, offsets = self._compute_slices(
             start_idx,
             end_idx,
@@ -637,6 +848,31 @@ class BcolzDailyBarReader(SessionBarReader):
             read_all,
         )
 
+    def _load_raw_arrays_mmap(self, columns, start_idx, end_idx, assets):
+        entries = self._mmap_index[self._mmap_index_locs(assets)]
+
+        # The row in the table of each (day, asset) pair in the query. The
+        # row is only valid on the days between the asset's first and last
+        # row.
+        days = np.arange(start_idx, end_idx + 1)[:, np.newaxis]
+        rows = entries['first_row'] + (days - entries['calendar_offset'])
+        valid = (
+            (days >= entries['calendar_offset']) &
+            (rows <= entries['last_row'])
+        )
+        valid_rows = rows[valid]
+
+        results = []
+        for column in columns:
+            outbuf = np.zeros(rows.shape, dtype=uint32)
+            outbuf[valid] = self._mmap_column(column)[valid_rows]
+            if column in OHLC:
+                where_nan = outbuf == 0
+                outbuf = outbuf.astype(float64) * self.PRICE_ADJUSTMENT_FACTOR
+                outbuf[where_nan] = nan
+            results.append(outbuf)
+        return results
+
     def _spot_col(self, colname):
         """
         Get the colname from daily_bar_table and read all of it into memory,
@@ -653,6 +889,8 @@ class BcolzDailyBarReader(SessionBarReader):
             Full read array of the carray in the daily_bar_table with the
             given colname.
         """
+        if self._mmap_dir is not None:
+            return self._mmap_column(colname)
         try:
             col = self._spot_cols[colname]
         except KeyError:
@@ -705,13 +943,22 @@ class BcolzDailyBarReader(SessionBarReader):
         except:
             raise NoDataOnDate("day={0} is outside of calendar={1}".format(
                 day, self.sessions))
-        offset = day_loc - self._calendar_offsets[sid]
+        if self._mmap_dir is not None:
+            entry = self._mmap_index[self._mmap_index_locs([sid])[0]]
+            first_row = entry['first_row']
+            last_row = entry['last_row']
+            calendar_offset = entry['calendar_offset']
+        else:
+            first_row = self._first_rows[sid]
+            last_row = self._last_rows[sid]
+            calendar_offset = self._calendar_offsets[sid]
+        offset = day_loc - calendar_offset
         if offset < 0:
             raise NoDataBeforeDate(
                 "No data on or before day={0} for sid={1}".format(
                     day, sid))
-        ix = self._first_rows[sid] + offset
-        if ix > self._last_rows[sid]:
+        ix = first_row + offset
+        if ix > last_row:
             raise NoDataAfterDate(
                 "No data on or after day={0} for sid={1}".format(
                     day, sid))
@@ -762,6 +1009,11 @@ class SQLiteAdjustmentWriter(object):
         If True and conn_or_path is a string, remove any existing files at the
         given path before connecting.
 
+    Notes
+    -----
+    When writing to a database which already has adjustments, any existing
+    rows with the same sid and date as a new row are replaced.
+
     See Also
     --------
     zipline.data.us_equity_pricing.SQLiteAdjustmentReader
@@ -788,6 +1040,11 @@ class SQLiteAdjustmentWriter(object):
 
         self._equity_daily_bar_reader = equity_daily_bar_reader
         self._calendar = calendar
+        self._existing_tables = frozenset(
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'",
+            )
+        )
 
     def _write(self, tablename, expected_dtypes, frame):
         if frame is None or frame.empty:
@@ -819,6 +1076,24 @@ class SQLiteAdjustmentWriter(object):
                         ),
                     )
 
+        if tablename in self._existing_tables and len(frame):
+            # Replace the rows for the same sids and dates which were already
+            # in the database, for example when appending to a copy of the
+            # adjustments from a previous ingestion.
+            date_column = (
+                'ex_date' if 'ex_date' in expected_dtypes else 'effective_date'
+            )
+            self.conn.executemany(
+                'DELETE FROM {0} WHERE sid = ? AND {1} = ?'.format(
+                    tablename,
+                    date_column,
+                ),
+                zip(
+                    frame['sid'].astype(int64).tolist(),
+                    frame[date_column].astype(int64).tolist(),
+                ),
+            )
+
         frame.to_sql(
             tablename,
             self.conn,
@@ -1084,43 +1359,43 @@ class SQLiteAdjustmentWriter(object):
         self.write_frame('mergers', mergers)
         self.write_dividend_data(dividends, stock_dividends)
         self.conn.execute(
-            "CREATE INDEX splits_sids "
+            "CREATE INDEX IF NOT EXISTS splits_sids "
             "ON splits(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX splits_effective_date "
+            "CREATE INDEX IF NOT EXISTS splits_effective_date "
             "ON splits(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_sids "
+            "CREATE INDEX IF NOT EXISTS mergers_sids "
             "ON mergers(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX mergers_effective_date "
+            "CREATE INDEX IF NOT EXISTS mergers_effective_date "
             "ON mergers(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_sid "
+            "CREATE INDEX IF NOT EXISTS dividends_sid "
             "ON dividends(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_effective_date "
+            "CREATE INDEX IF NOT EXISTS dividends_effective_date "
             "ON dividends(effective_date)"
         )
         self.conn.execute(
-            "CREATE INDEX dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS dividend_payouts_sid "
             "ON dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS dividends_payouts_ex_date "
             "ON dividend_payouts(ex_date)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividend_payouts_sid "
+            "CREATE INDEX IF NOT EXISTS stock_dividend_payouts_sid "
             "ON stock_dividend_payouts(sid)"
         )
         self.conn.execute(
-            "CREATE INDEX stock_dividends_payouts_ex_date "
+            "CREATE INDEX IF NOT EXISTS stock_dividends_payouts_ex_date "
             "ON stock_dividend_payouts(ex_date)"
         )
 
@@ -1156,6 +1431,14 @@ class SQLiteAdjustmentReader(object):
     conn : str or sqlite3.Connection
         Connection from which to load data.
 
+    Notes
+    -----
+    The splits, mergers, and dividends tables are each read into an
+    :class:`~zipline.data.adjustment_index.AdjustmentIndex` the first time
+    they are needed, and ``load_adjustments`` is answered from those indices
+    without querying the database. Changes made to those tables after they
+    have been read are not seen by the reader.
+
     See Also
     --------
     :class:`zipline.data.us_equity_pricing.SQLiteAdjustmentWriter`
@@ -1177,13 +1460,93 @@ class SQLiteAdjustmentReader(object):
                                        'record_date')
         }
 
+    @lazyval
+    def _adjustment_indices(self):
+        return {}
+
+    def get_adjustment_index(self, table_name):
+        """
+        Get the in memory index of the adjustments in one of the ratio
+        adjustment tables.
+
+        Parameters
+        ----------
+        table_name : {'splits', 'mergers', 'dividends'}
+            The table to index.
+
+        Returns
+        -------
+        index : zipline.data.adjustment_index.AdjustmentIndex
+            The adjustments in the table.
+        """
+        indices = self._adjustment_indices
+        try:
+            return indices[table_name]
+        except KeyError:
+            if table_name not in SQLITE_ADJUSTMENT_TABLENAMES:
+                raise ValueError(
+                    'Unknown adjustment table: %r' % (table_name,),
+                )
+            index = indices[table_name] = AdjustmentIndex.from_sqlite(
+                self.conn,
+                table_name,
+            )
+            return index
+
     def load_adjustments(self, columns, dates, assets):
-        return load_adjustments_from_sqlite(
-            self.conn,
-            list(columns),
-            dates,
-            assets,
-        )
+        """
+        Load a dictionary of Adjustment objects for each of ``columns``.
+
+        Parameters
+        ----------
+        columns : list[str]
+            List of column names for which adjustments are needed.
+        dates : pd.DatetimeIndex
+            Dates for which adjustments are needed.
+        assets : pd.Int64Index
+            Assets for which adjustments are needed.
+
+        Returns
+        -------
+        adjustments : list[dict[int -> Adjustment]]
+            A list of mappings from index to adjustment objects to apply at
+            that index.
+        """
+        columns = list(columns)
+        start_date = timedelta_to_integral_seconds(dates[0] - EPOCH)
+        end_date = timedelta_to_integral_seconds(dates[-1] - EPOCH)
+        dates_seconds = dates.values.astype('datetime64[s]').view(int64)
+
+        results = [{} for column in columns]
+        # splits affect prices and volumes, volumes is the inverse. mergers
+        # and dividends affect prices only.
+        for table_name in 'splits', 'mergers', 'dividends':
+            asset_ixs, effective_dates, ratios = self.get_adjustment_index(
+                table_name,
+            ).query(assets, start_date, end_date)
+            date_locs = dates_seconds.searchsorted(effective_dates)
+
+            for asset_ix, date_loc, ratio in zip(asset_ixs.tolist(),
+                                                 date_locs.tolist(),
+                                                 ratios.tolist()):
+                price_adj = Float64Multiply(
+                    0, date_loc, asset_ix, asset_ix, ratio,
+                )
+                for column, col_adjustments in zip(columns, results):
+                    if column != 'volume':
+                        adj = price_adj
+                    elif table_name == 'splits':
+                        adj = Float64Multiply(
+                            0, date_loc, asset_ix, asset_ix, 1.0 / ratio,
+                        )
+                    else:
+                        continue
+                    try:
+                        col_adjustments[date_loc].append(adj)
+                    except KeyError:
+                        col_adjustments[date_loc] = [adj]
+
+        return results
 
     def get_adjustments_for_sid(self, table_name, sid):
         t = (sid,)
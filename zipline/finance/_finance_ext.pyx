@@ -11,25 +11,30 @@ from zipline._protocol cimport InnerPosition
 from zipline.assets._assets cimport Future
 
 
-cpdef update_position_last_sale_prices(positions, get_price, dt):
+cpdef update_position_last_sale_prices(positions,
+                                       np.ndarray[np.float64_t] prices,
+                                       dt):
     """Update the positions' last sale prices.
 
     Parameters
     ----------
     positions : OrderedDict
         The positions to update.
-    get_price : callable[Asset, float]
-        The function to retrieve the price for the asset.
+    prices : np.ndarray[float64]
+        The price of each position, in the same order as ``positions``.
     dt : pd.Timestamp
         The dt to set as the last sale date if the price is not nan.
     """
     cdef InnerPosition inner_position
     cdef np.float64_t last_sale_price
+    cdef Py_ssize_t ix = 0
 
     for outer_position in itervalues(positions):
         inner_position = outer_position.inner_position
 
-        last_sale_price = get_price(inner_position.asset)
+        with cython.boundscheck(False), cython.wraparound(False):
+            last_sale_price = prices[ix]
+        ix += 1
 
         # inline ~isnan because this gets called once per position per minute
         if last_sale_price == last_sale_price:
@@ -112,20 +117,10 @@ cdef class PositionStats:
         return self
 
 
-cpdef calculate_position_tracker_stats(positions, PositionStats stats):
-    """Calculate various stats about the current positions.
-
-    Parameters
-    ----------
-    positions : OrderedDict
-        The ordered dictionary of positions.
-
-    Returns
-    -------
-    position_stats : PositionStats
-        The computed statistics.
+cdef tuple _position_exposure_buffers(PositionStats stats, Py_ssize_t npos):
+    """Get the sid and exposure arrays to write the exposure of ``npos``
+    positions into, reusing the memory of the previous stats where possible.
     """
-    cdef Py_ssize_t npos = len(positions)
     cdef np.ndarray[np.int64_t] index
     cdef np.ndarray[np.float64_t] position_exposure
 
@@ -134,22 +129,6 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
         stats.underlying_value_array
     )
 
-    cdef np.float64_t value
-    cdef np.float64_t exposure
-
-    cdef np.float64_t net_value
-    cdef np.float64_t gross_value
-    cdef np.float64_t long_value = 0.0
-    cdef np.float64_t short_value = 0.0
-
-    cdef np.float64_t net_exposure
-    cdef np.float64_t gross_exposure
-    cdef np.float64_t long_exposure = 0.0
-    cdef np.float64_t short_exposure = 0.0
-
-    cdef np.uint64_t longs_count = 0
-    cdef np.uint64_t shorts_count = 0
-
     # attempt to reuse the memory of the old exposure series
     if len(old_index) < npos:
         # we don't have enough space in the cached buffer, allocate a new
@@ -190,6 +169,60 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
             index=index,
         )
 
+    return index, position_exposure
+
+
+cdef _store_position_stats(PositionStats stats,
+                           np.float64_t long_value,
+                           np.float64_t short_value,
+                           np.float64_t long_exposure,
+                           np.float64_t short_exposure,
+                           np.uint64_t longs_count,
+                           np.uint64_t shorts_count):
+    stats.gross_exposure = long_exposure - short_exposure
+    stats.gross_value = long_value - short_value
+    stats.long_exposure = long_exposure
+    stats.long_value = long_value
+    stats.longs_count = longs_count
+    stats.net_exposure = long_exposure + short_exposure
+    stats.net_value = long_value + short_value
+    stats.short_exposure = short_exposure
+    stats.short_value = short_value
+    stats.shorts_count = shorts_count
+
+
+cpdef calculate_position_tracker_stats(positions, PositionStats stats):
+    """Calculate various stats about the current positions.
+
+    Parameters
+    ----------
+    positions : OrderedDict
+        The ordered dictionary of positions.
+
+    Returns
+    -------
+    position_stats : PositionStats
+        The computed statistics.
+    """
+    cdef np.ndarray[np.int64_t] index
+    cdef np.ndarray[np.float64_t] position_exposure
+    index, position_exposure = _position_exposure_buffers(
+        stats,
+        len(positions),
+    )
+
+    cdef np.float64_t value
+    cdef np.float64_t exposure
+
+    cdef np.float64_t long_value = 0.0
+    cdef np.float64_t short_value = 0.0
+
+    cdef np.float64_t long_exposure = 0.0
+    cdef np.float64_t short_exposure = 0.0
+
+    cdef np.uint64_t longs_count = 0
+    cdef np.uint64_t shorts_count = 0
+
     cdef InnerPosition position
     cdef Py_ssize_t ix = 0
 
@@ -226,22 +259,93 @@ cpdef calculate_position_tracker_stats(positions, PositionStats stats):
 
         ix += 1
 
-    net_value = long_value + short_value
-    gross_value = long_value - short_value
+    _store_position_stats(
+        stats,
+        long_value,
+        short_value,
+        long_exposure,
+        short_exposure,
+        longs_count,
+        shorts_count,
+    )
 
-    net_exposure = long_exposure + short_exposure
-    gross_exposure = long_exposure - short_exposure
 
-    stats.gross_exposure = gross_exposure
-    stats.gross_value = gross_value
-    stats.long_exposure = long_exposure
-    stats.long_value = long_value
-    stats.longs_count = longs_count
-    stats.net_exposure = net_exposure
-    stats.net_value = net_value
-    stats.short_exposure = short_exposure
-    stats.short_value = short_value
-    stats.shorts_count = shorts_count
+cpdef calculate_array_position_stats(
+        np.ndarray[np.int64_t] sids,
+        np.ndarray[np.int64_t] amounts,
+        np.ndarray[np.float64_t] last_sale_prices,
+        np.ndarray[np.float64_t] multipliers,
+        np.ndarray[np.uint8_t, cast=True] is_future,
+        PositionStats stats):
+    """Calculate various stats about the current positions of an
+    ``ArrayPositionTracker``.
+
+    Parameters
+    ----------
+    sids : np.ndarray[int64]
+        The sid of each position.
+    amounts : np.ndarray[int64]
+        The amount held of each position.
+    last_sale_prices : np.ndarray[float64]
+        The last sale price of each position.
+    multipliers : np.ndarray[float64]
+        The price multiplier of each position.
+    is_future : np.ndarray[bool]
+        Is each position a future?
+    stats : PositionStats
+        The stats to update.
+    """
+    cdef Py_ssize_t npos = len(sids)
+    cdef np.ndarray[np.int64_t] index
+    cdef np.ndarray[np.float64_t] position_exposure
+    index, position_exposure = _position_exposure_buffers(stats, npos)
+
+    cdef np.float64_t value
+    cdef np.float64_t exposure
+
+    cdef np.float64_t long_value = 0.0
+    cdef np.float64_t short_value = 0.0
+
+    cdef np.float64_t long_exposure = 0.0
+    cdef np.float64_t short_exposure = 0.0
+
+    cdef np.uint64_t longs_count = 0
+    cdef np.uint64_t shorts_count = 0
+
+    cdef Py_ssize_t ix
+
+    with cython.boundscheck(False), cython.wraparound(False):
+        for ix in range(npos):
+            exposure = amounts[ix] * last_sale_prices[ix]
+
+            if is_future[ix]:
+                # Futures don't have an inherent position value.
+                value = 0
+                exposure *= multipliers[ix]
+            else:
+                value = exposure
+
+            if exposure > 0:
+                longs_count += 1
+                long_value += value
+                long_exposure += exposure
+            elif exposure < 0:
+                shorts_count += 1
+                short_value += value
+                short_exposure += exposure
+
+            index[ix] = sids[ix]
+            position_exposure[ix] = exposure
+
+    _store_position_stats(
+        stats,
+        long_value,
+        short_value,
+        long_exposure,
+        short_exposure,
+        longs_count,
+        shorts_count,
+    )
 
 
 cpdef minute_annual_volatility(np.ndarray[np.int64_t] date_labels,
@@ -16,7 +16,7 @@ from logbook import Logger
 from collections import defaultdict
 from copy import copy
 
-from six import iteritems
+from six import itervalues
 
 from zipline.assets import Equity, Future, Asset
 from .blotter import Blotter
@@ -337,31 +337,71 @@ class SimulationBlotter(Blotter):
         transactions = []
         commissions = []
 
-        if self.open_orders:
-            for asset, asset_orders in iteritems(self.open_orders):
-                slippage = self.slippage_models[type(asset)]
-
-                for order, txn in \
-                        slippage.simulate(bar_data, asset, asset_orders):
-                    commission = self.commission_models[type(asset)]
-                    additional_commission = commission.calculate(order, txn)
-
-                    if additional_commission > 0:
-                        commissions.append({
-                            "asset": order.asset,
-                            "order": order,
-                            "cost": additional_commission
-                        })
-
-                    order.filled += txn.amount
-                    order.commission += additional_commission
-
-                    order.dt = txn.dt
-
-                    transactions.append(txn)
-
-                    if not order.open:
-                        closed_orders.append(order)
+        if not self.open_orders:
+            return transactions, commissions, closed_orders
+
+        # Simulate the orders of every asset which shares a slippage model
+        # at once.
+        assets_by_slippage = defaultdict(list)
+        for asset in self.open_orders:
+            slippage = self.slippage_models[type(asset)]
+            assets_by_slippage[id(slippage)].append((slippage, asset))
+
+        fills_by_asset = defaultdict(list)
+        for slippage_and_assets in itervalues(assets_by_slippage):
+            slippage = slippage_and_assets[0][0]
+            assets = [asset for _, asset in slippage_and_assets]
+            fills = slippage.simulate_batch(
+                bar_data,
+                assets,
+                [self.open_orders[asset] for asset in assets],
+            )
+            for order, txn in fills:
+                fills_by_asset[order.asset].append((order, txn))
+
+        fills = [
+            fill
+            for asset in self.open_orders
+            for fill in fills_by_asset[asset]
+        ]
+
+        # Each order is filled at most once per bar, so the commissions can
+        # all be computed before any order is updated.
+        fill_ixs_by_commission = defaultdict(list)
+        for ix, (order, _) in enumerate(fills):
+            commission = self.commission_models[type(order.asset)]
+            fill_ixs_by_commission[id(commission)].append((commission, ix))
+
+        additional_commissions = [None] * len(fills)
+        for commission_and_ixs in itervalues(fill_ixs_by_commission):
+            commission = commission_and_ixs[0][0]
+            ixs = [ix for _, ix in commission_and_ixs]
+            amounts = commission.calculate_many(
+                [fills[ix][0] for ix in ixs],
+                [fills[ix][1] for ix in ixs],
+            )
+            for ix, amount in zip(ixs, amounts.tolist()):
+                additional_commissions[ix] = amount
+
+        for (order, txn), additional_commission in zip(
+                fills,
+                additional_commissions):
+            if additional_commission > 0:
+                commissions.append({
+                    "asset": order.asset,
+                    "order": order,
+                    "cost": additional_commission
+                })
+
+            order.filled += txn.amount
+            order.commission += additional_commission
+
+            order.dt = txn.dt
+
+            transactions.append(txn)
+
+            if not order.open:
+                closed_orders.append(order)
 
         return transactions, commissions, closed_orders
 
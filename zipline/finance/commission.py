@@ -15,12 +15,17 @@
 from abc import abstractmethod
 from collections import defaultdict
 
+import numpy as np
 from six import with_metaclass
 from toolz import merge
 
 from zipline.assets import Equity, Future
 from zipline.finance.constants import FUTURE_EXCHANGE_FEES_BY_SYMBOL
-from zipline.finance.shared import AllowedAssetMarker, FinancialModelMeta
+from zipline.finance.shared import (
+    AllowedAssetMarker,
+    FinancialModelMeta,
+    implements_batch,
+)
 from zipline.utils.dummy import DummyMapping
 
 DEFAULT_PER_SHARE_COST = 0.001               # 0.1 cents per share
@@ -69,6 +74,53 @@ class CommissionModel(with_metaclass(FinancialModelMeta)):
         """
         raise NotImplementedError('calculate')
 
+    def calculate_many(self, orders, transactions):
+        """
+        Calculate the commission to charge for many order/transaction pairs.
+
+        Parameters
+        ----------
+        orders : list[zipline.finance.order.Order]
+            The orders being processed. Each order appears at most once.
+        transactions : list[zipline.finance.transaction.Transaction]
+            The transaction being processed for each order.
+
+        Returns
+        -------
+        amounts_charged : np.ndarray[float64]
+            The additional commission, in dollars, to attribute to each order.
+
+        Notes
+        -----
+        Models may implement ``calculate_batch`` to compute the commissions
+        from arrays instead of calling :meth:`calculate` for each pair:
+
+        ``calculate_batch(commissions, filled, amounts, prices)``
+
+        where ``commissions`` and ``filled`` are the commission already
+        charged on and the amount already filled of each order, and
+        ``amounts`` and ``prices`` describe each transaction. Subclasses
+        which override :meth:`calculate` use :meth:`calculate` for each pair.
+        """
+        if not implements_batch(self, 'calculate_batch', ('calculate',)):
+            return np.array(
+                [
+                    self.calculate(order, txn)
+                    for order, txn in zip(orders, transactions)
+                ],
+                dtype='float64',
+            )
+
+        return np.asarray(
+            self.calculate_batch(
+                np.array([order.commission for order in orders], dtype=float),
+                np.array([order.filled for order in orders], dtype=float),
+                np.array([txn.amount for txn in transactions], dtype=float),
+                np.array([txn.price for txn in transactions], dtype=float),
+            ),
+            dtype='float64',
+        )
+
 
 class NoCommission(CommissionModel):
     """A commission model where all transactions are free.
@@ -82,6 +134,10 @@ class NoCommission(CommissionModel):
     def calculate(order, transaction):
         return 0.0
 
+    @staticmethod
+    def calculate_batch(commissions, filled, amounts, prices):
+        return np.zeros(len(amounts))
+
 
 class EquityCommissionModel(with_metaclass(AllowedAssetMarker,
                                            CommissionModel)):
@@ -138,6 +194,37 @@ def calculate_per_unit_commission(order,
             return per_unit_total - order.commission
 
 
+def calculate_per_unit_commissions(commissions,
+                                   filled,
+                                   amounts,
+                                   cost_per_unit,
+                                   initial_commission,
+                                   min_trade_cost):
+    """
+    Vectorized version of :func:`calculate_per_unit_commission` for arrays of
+    the commission already paid on and the amount already filled of each
+    order, and the amount of each transaction.
+    """
+    additional_commissions = np.abs(amounts * cost_per_unit)
+    per_unit_totals = (
+        np.abs(filled * cost_per_unit) +
+        additional_commissions +
+        initial_commission
+    )
+    return np.where(
+        commissions == 0,
+        np.maximum(
+            min_trade_cost,
+            additional_commissions + initial_commission,
+        ),
+        np.where(
+            per_unit_totals < min_trade_cost,
+            0.0,
+            per_unit_totals - commissions,
+        ),
+    )
+
+
 class PerShare(EquityCommissionModel):
     """
     Calculates a commission for a transaction based on a per share cost with
@@ -177,6 +264,16 @@ class PerShare(EquityCommissionModel):
             min_trade_cost=self.min_trade_cost,
         )
 
+    def calculate_batch(self, commissions, filled, amounts, prices):
+        return calculate_per_unit_commissions(
+            commissions,
+            filled,
+            amounts,
+            cost_per_unit=self.cost_per_share,
+            initial_commission=0,
+            min_trade_cost=self.min_trade_cost,
+        )
+
 
 class PerContract(FutureCommissionModel):
     """
@@ -306,6 +403,9 @@ class PerTrade(CommissionModel):
             # commission.
             return 0.0
 
+    def calculate_batch(self, commissions, filled, amounts, prices):
+        return np.where(commissions == 0, self.cost, 0.0)
+
 
 class PerFutureTrade(PerContract):
     """
@@ -367,3 +467,6 @@ class PerDollar(EquityCommissionModel):
         """
         cost_per_share = transaction.price * self.cost_per_dollar
         return abs(transaction.amount) * cost_per_share
+
+    def calculate_batch(self, commissions, filled, amounts, prices):
+        return np.abs(amounts) * (prices * self.cost_per_dollar)
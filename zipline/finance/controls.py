@@ -16,9 +16,11 @@ import abc
 import logbook
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from six import with_metaclass
+from six.moves import zip
 
 from zipline.errors import (
     AccountControlViolation,
@@ -33,6 +35,16 @@ from zipline.utils.input_validation import (
 log = logbook.Logger('TradingControl')
 
 
+def _applies_to(control_asset, assets):
+    """
+    Find which of ``assets`` a control limited to ``control_asset`` applies
+    to, where None means all assets.
+    """
+    if control_asset is None:
+        return np.ones(len(assets), dtype=bool)
+    return np.array([asset == control_asset for asset in assets], dtype=bool)
+
+
 class TradingControl(with_metaclass(abc.ABCMeta)):
     """
     Abstract base class representing a fail-safe control on the behavior of any
@@ -67,6 +79,50 @@ class TradingControl(with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data,
+                      current_amounts,
+                      prices):
+        """
+        Validate orders for many assets at once.
+
+        Parameters
+        ----------
+        assets : list[Asset]
+            The assets of the orders.
+        amounts : np.ndarray[int64]
+            The amount of each order, aligned with ``assets``.
+        portfolio, algo_datetime, algo_current_data
+            The same as for ``validate``.
+        current_amounts : np.ndarray[int64]
+            The amount of each asset currently held.
+        prices : np.ndarray[float64]
+            The current price of each asset.
+
+        Notes
+        -----
+        By default, this calls ``validate`` for each order. Subclasses may
+        check all of the orders with array operations instead.
+        """
+        for asset, amount in zip(assets, amounts.tolist()):
+            self.validate(asset,
+                          amount,
+                          portfolio,
+                          algo_datetime,
+                          algo_current_data)
+
+    def handle_violations(self, assets, amounts, violations, datetime):
+        """
+        Call ``handle_violation`` for each order where ``violations`` is
+        True.
+        """
+        for ix in np.flatnonzero(violations):
+            self.handle_violation(assets[ix], amounts[ix], datetime)
+
     def _constraint_msg(self, metadata):
         constraint = repr(self)
         if metadata:
@@ -163,6 +219,26 @@ class RestrictedListOrder(TradingControl):
         if self.restrictions.is_restricted(asset, algo_datetime):
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data,
+                      current_amounts,
+                      prices):
+        """
+        Fail if any of the assets are in the restricted_list.
+        """
+        if not assets:
+            return
+
+        restricted = np.asarray(
+            self.restrictions.is_restricted(assets, algo_datetime),
+            dtype=bool,
+        )
+        self.handle_violations(assets, amounts, restricted, algo_datetime)
+
 
 class MaxOrderSize(TradingControl):
     """
@@ -222,6 +298,36 @@ class MaxOrderSize(TradingControl):
         if too_much_value:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data,
+                      current_amounts,
+                      prices):
+        """
+        Fail if the magnitude of any of the orders exceeds either
+        self.max_shares or self.max_notional.
+        """
+        applies = _applies_to(self.asset, assets)
+
+        if self.max_shares is not None:
+            self.handle_violations(
+                assets,
+                amounts,
+                applies & (np.abs(amounts) > self.max_shares),
+                algo_datetime,
+            )
+
+        if self.max_notional is not None:
+            self.handle_violations(
+                assets,
+                amounts,
+                applies & (np.abs(amounts * prices) > self.max_notional),
+                algo_datetime,
+            )
+
 
 class MaxPositionSize(TradingControl):
     """
@@ -286,6 +392,39 @@ class MaxPositionSize(TradingControl):
         if too_much_value:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data,
+                      current_amounts,
+                      prices):
+        """
+        Fail if any of the orders would cause the magnitude of our position
+        to be greater in shares than self.max_shares or greater in dollar
+        value than self.max_notional.
+        """
+        applies = _applies_to(self.asset, assets)
+        shares_post_order = current_amounts + amounts
+
+        if self.max_shares is not None:
+            self.handle_violations(
+                assets,
+                amounts,
+                applies & (np.abs(shares_post_order) > self.max_shares),
+                algo_datetime,
+            )
+
+        if self.max_notional is not None:
+            value_post_order = shares_post_order * prices
+            self.handle_violations(
+                assets,
+                amounts,
+                applies & (np.abs(value_post_order) > self.max_notional),
+                algo_datetime,
+            )
+
 
 class LongOnly(TradingControl):
     """
@@ -308,6 +447,25 @@ class LongOnly(TradingControl):
         if portfolio.positions[asset].amount + amount < 0:
             self.handle_violation(asset, amount, algo_datetime)
 
+    def validate_many(self,
+                      assets,
+                      amounts,
+                      portfolio,
+                      algo_datetime,
+                      algo_current_data,
+                      current_amounts,
+                      prices):
+        """
+        Fail if we would hold negative shares of any of the assets after
+        completing these orders.
+        """
+        self.handle_violations(
+            assets,
+            amounts,
+            current_amounts + amounts < 0,
+            algo_datetime,
+        )
+
 
 class AssetDateBounds(TradingControl):
     """
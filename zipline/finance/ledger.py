@@ -16,7 +16,6 @@
 from __future__ import division
 
 from collections import namedtuple, OrderedDict
-from functools import partial
 from math import isnan
 
 import logbook
@@ -28,9 +27,10 @@ from zipline.assets import Future
 from zipline.finance.transaction import Transaction
 import zipline.protocol as zp
 from zipline.utils.sentinel import sentinel
-from .position import Position
+from .position import ArrayPosition, Position
 from ._finance_ext import (
     PositionStats,
+    calculate_array_position_stats,
     calculate_position_tracker_stats,
     update_position_last_sale_prices,
 )
@@ -68,8 +68,7 @@ class PositionTracker(object):
         self._dirty_stats = True
 
         if asset not in self.positions:
-            position = Position(asset)
-            self.positions[asset] = position
+            position = self._open_position(asset)
         else:
             position = self.positions[asset]
 
@@ -88,22 +87,32 @@ class PositionTracker(object):
         asset = txn.asset
 
         if asset not in self.positions:
-            position = Position(asset)
-            self.positions[asset] = position
+            position = self._open_position(asset)
         else:
             position = self.positions[asset]
 
         position.update(txn)
 
         if position.amount == 0:
-            del self.positions[asset]
+            self._close_position(asset)
 
-            try:
-                # if this position exists in our user-facing dictionary,
-                # remove it as well.
-                del self._positions_store[asset]
-            except KeyError:
-                pass
+    def _open_position(self, asset):
+        """Start tracking a position in ``asset``, which is not held yet.
+        """
+        position = self.positions[asset] = Position(asset)
+        return position
+
+    def _close_position(self, asset):
+        """Stop tracking the position in ``asset``.
+        """
+        del self.positions[asset]
+
+        try:
+            # if this position exists in our user-facing dictionary,
+            # remove it as well.
+            del self._positions_store[asset]
+        except KeyError:
+            pass
 
     def handle_commission(self, asset, cost):
         # Adjust the cost basis of the stock if we own it
@@ -213,9 +222,7 @@ class PositionTracker(object):
             if payment_asset in self.positions:
                 position = self.positions[payment_asset]
             else:
-                position = self.positions[payment_asset] = Position(
-                    payment_asset,
-                )
+                position = self._open_position(payment_asset)
 
             position.amount += share_count
 
@@ -264,25 +271,32 @@ class PositionTracker(object):
                               handle_non_market_minutes=False):
         self._dirty_stats = True
 
+        assets = self._held_assets()
+        if not len(assets):
+            return
+
         if handle_non_market_minutes:
             previous_minute = data_portal.trading_calendar.previous_minute(dt)
-            get_price = partial(
-                data_portal.get_adjusted_value,
-                field='price',
-                dt=previous_minute,
+            prices = data_portal.get_spot_prices(
+                assets,
+                previous_minute,
+                self.data_frequency,
                 perspective_dt=dt,
-                data_frequency=self.data_frequency,
             )
-
         else:
-            get_price = partial(
-                data_portal.get_scalar_asset_spot_value,
-                field='price',
-                dt=dt,
-                data_frequency=self.data_frequency,
+            prices = data_portal.get_spot_prices(
+                assets,
+                dt,
+                self.data_frequency,
             )
 
-        update_position_last_sale_prices(self.positions, get_price, dt)
+        self._update_last_sale_prices(prices, dt)
+
+    def _held_assets(self):
+        return list(self.positions)
+
+    def _update_last_sale_prices(self, prices, dt):
+        update_position_last_sale_prices(self.positions, prices, dt)
 
     @property
     def stats(self):
@@ -299,11 +313,144 @@ class PositionTracker(object):
         the stats may have changed.
         """
         if self._dirty_stats:
-            calculate_position_tracker_stats(self.positions, self._stats)
+            self._calculate_stats()
             self._dirty_stats = False
 
         return self._stats
 
+    def _calculate_stats(self):
+        calculate_position_tracker_stats(self.positions, self._stats)
+
+
+class ArrayPositionTracker(PositionTracker):
+    """A position tracker that stores the positions in arrays.
+
+    Each field of the positions is held in one array, and each asset held is
+    assigned a slot in the arrays. Syncing the last sale prices and
+    computing the stats work on the arrays instead of looping over the
+    position objects, and the user-facing positions only change when an
+    asset is opened or closed. The objects in ``positions`` are
+    :class:`~zipline.finance.position.ArrayPosition` views over a slot.
+
+    Parameters
+    ----------
+    data_frequency : {'daily', 'minute'}
+        The data frequency of the simulation.
+    """
+    _initial_capacity = 16
+
+    # (name, dtype, value of an empty slot)
+    _column_specs = (
+        ('asset', object, None),
+        ('sid', 'int64', 0),
+        ('amount', 'int64', 0),
+        ('cost_basis', 'float64', 0.0),
+        ('last_sale_price', 'float64', 0.0),
+        ('last_sale_date', object, None),
+        ('multiplier', 'float64', 1.0),
+        ('is_future', 'bool', False),
+    )
+
+    def __init__(self, data_frequency):
+        super(ArrayPositionTracker, self).__init__(data_frequency)
+
+        # The positions hold a reference to this dict, so it is updated in
+        # place when the columns are reallocated.
+        self._columns = {
+            name: np.full(self._initial_capacity, empty, dtype=dtype)
+            for name, dtype, empty in self._column_specs
+        }
+
+        # The number of slots in use, including the slots of positions which
+        # have been closed but not yet compacted away.
+        self._size = 0
+        self._closed_slots = 0
+
+    def _open_position(self, asset):
+        slot = self._size
+        if slot == len(self._columns['sid']):
+            self._grow()
+
+        columns = self._columns
+        for name, _, empty in self._column_specs:
+            columns[name][slot] = empty
+
+        columns['asset'][slot] = asset
+        columns['sid'][slot] = asset.sid
+        if isinstance(asset, Future):
+            columns['multiplier'][slot] = asset.price_multiplier
+            columns['is_future'][slot] = True
+
+        self._size = slot + 1
+
+        position = self.positions[asset] = ArrayPosition(columns, slot)
+        self._positions_store[asset] = zp.Position(position)
+        return position
+
+    def _close_position(self, asset):
+        self.positions.pop(asset)._detach()
+        del self._positions_store[asset]
+
+        # The slot is left in place so that closing many positions in a bar
+        # only moves the remaining positions once.
+        self._closed_slots += 1
+
+    def _grow(self):
+        capacity = 2 * len(self._columns['sid'])
+        size = self._size
+        columns = self._columns
+        for name, dtype, empty in self._column_specs:
+            column = np.full(capacity, empty, dtype=dtype)
+            column[:size] = columns[name][:size]
+            columns[name] = column
+
+    def _compact(self):
+        """Remove the slots of closed positions, keeping the open positions
+        in the order they were opened.
+        """
+        if not self._closed_slots:
+            return
+
+        positions = list(itervalues(self.positions))
+        live = np.array([p._slot for p in positions], dtype='int64')
+        size = len(live)
+        for column in itervalues(self._columns):
+            column[:size] = column[live]
+
+        for slot, position in enumerate(positions):
+            position._move(slot)
+
+        self._size = size
+        self._closed_slots = 0
+
+    def _column(self, name):
+        return self._columns[name][:self._size]
+
+    def get_positions(self):
+        # ``_positions_store`` is kept up to date as positions are opened and
+        # closed, and its positions read the current values from the arrays.
+        return self._positions_store
+
+    def _held_assets(self):
+        self._compact()
+        return self._column('asset')
+
+    def _update_last_sale_prices(self, prices, dt):
+        have_price = ~np.isnan(prices)
+        self._column('last_sale_price')[have_price] = prices[have_price]
+        self._column('last_sale_date')[have_price] = dt
+
+    def _calculate_stats(self):
+        self._compact()
+        calculate_array_position_stats(
+            self._column('sid'),
+            self._column('amount'),
+            self._column('last_sale_price'),
+            self._column('multiplier'),
+            self._column('is_future'),
+            self._stats,
+        )
+
 
 if PY2:
     def move_to_end(ordered_dict, key, last=False):
@@ -361,8 +508,23 @@ class Ledger(object):
     daily_returns_array : np.ndarray
         The daily returns as an ndarray. Days that have not yet finished will
         hold a value of ``np.nan``.
+
+    Parameters
+    ----------
+    trading_sessions : pd.DatetimeIndex
+        The sessions of the simulation.
+    capital_base : float
+        The starting value of the portfolio.
+    data_frequency : {'daily', 'minute'}
+        The data frequency of the simulation.
+    position_tracker_class : type, optional
+        The type of the position tracker. default: PositionTracker
     """
-    def __init__(self, trading_sessions, capital_base, data_frequency):
+    def __init__(self,
+                 trading_sessions,
+                 capital_base,
+                 data_frequency,
+                 position_tracker_class=PositionTracker):
         if len(trading_sessions):
             start = trading_sessions[0]
         else:
@@ -396,7 +558,7 @@ class Ledger(object):
         # way to tangled up at the moment but we aren't fixing it today.
         self._account_overrides = {}
 
-        self.position_tracker = PositionTracker(data_frequency)
+        self.position_tracker = position_tracker_class(data_frequency)
 
         self._processed_transactions = {}
 
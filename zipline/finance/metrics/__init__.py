@@ -27,6 +27,7 @@ from .metric import (
     BenchmarkReturnsAndVolatility,
     CashFlow,
     DailyLedgerField,
+    DeferredCumulativeRiskMetrics,
     MaxLeverage,
     NumTradingDays,
     Orders,
@@ -107,6 +108,23 @@ def default_metrics():
     }
 
 
+@register('deferred')
+def deferred_metrics():
+    """The default metrics, with the cumulative risk statistics computed once
+    at the end of the simulation instead of on every bar.
+
+    The daily perf is the same as with the default metrics, but the
+    cumulative risk statistics are not available in the packets while the
+    simulation runs.
+    """
+    metrics = {
+        metric for metric in default_metrics()
+        if not isinstance(metric, (AlphaBeta, ReturnsStatistic))
+    }
+    metrics.add(DeferredCumulativeRiskMetrics())
+    return metrics
+
+
 @register('classic')
 @deprecated(
     'The original risk packet has been deprecated and will be removed in a '
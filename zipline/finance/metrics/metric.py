@@ -24,6 +24,7 @@ from six import iteritems
 
 from zipline.utils.exploding_object import NamedExplodingObject
 from zipline.finance._finance_ext import minute_annual_volatility
+from . import online
 
 
 class SimpleLedgerField(object):
@@ -405,6 +406,12 @@ class ReturnsStatistic(object):
     field_name : str, optional
         The name of the field. If not provided, it will be
         ``function.__name__``.
+
+    Notes
+    -----
+    The empyrical functions in ``online.ONLINE_STATISTICS`` are computed
+    incrementally, in constant time per bar. Any other function is called on
+    all of the returns so far on every bar.
     """
     def __init__(self, function, field_name=None):
         if field_name is None:
@@ -412,6 +419,14 @@ class ReturnsStatistic(object):
 
         self._function = function
         self._field_name = field_name
+        self._online_type = online.ONLINE_STATISTICS.get(function)
+        self.start_of_simulation()
+
+    def start_of_simulation(self, *args):
+        if self._online_type is not None:
+            self._online = self._online_type()
+        else:
+            self._online = None
 
     def end_of_bar(self,
                    packet,
@@ -419,7 +434,10 @@ class ReturnsStatistic(object):
                    dt,
                    session_ix,
                    data_portal):
-        res = self._function(ledger.daily_returns_array[:session_ix + 1])
+        if self._online is not None:
+            res = self._online.update(session_ix, ledger.daily_returns_array)
+        else:
+            res = self._function(ledger.daily_returns_array[:session_ix + 1])
         if not np.isfinite(res):
             res = None
         packet['cumulative_risk_metrics'][self._field_name] = res
@@ -440,6 +458,7 @@ class AlphaBeta(object):
             sessions[0],
             sessions[-1],
         ).values
+        self._alpha_beta = online.AlphaBeta()
 
     def end_of_bar(self,
                    packet,
@@ -448,9 +467,10 @@ class AlphaBeta(object):
                    session_ix,
                    data_portal):
         risk = packet['cumulative_risk_metrics']
-        alpha, beta = ep.alpha_beta_aligned(
-            ledger.daily_returns_array[:session_ix + 1],
-            self._daily_returns_array[:session_ix + 1],
+        alpha, beta = self._alpha_beta.update(
+            session_ix,
+            ledger.daily_returns_array,
+            self._daily_returns_array,
         )
 
         if np.isnan(alpha):
@@ -464,6 +484,71 @@ class AlphaBeta(object):
     end_of_session = end_of_bar
 
 
+class DeferredCumulativeRiskMetrics(object):
+    """The cumulative risk statistics of the algorithm returns, computed for
+    every session at once at the end of the simulation.
+
+    This reports the same fields as ``AlphaBeta`` and the ``ReturnsStatistic``
+    metrics of the default metrics set, but does no work while the simulation
+    runs. The fields are written into each session's packet when the
+    simulation ends, and are not reported in minute packets.
+    """
+    _statistics = (
+        ('algo_volatility', online.AnnualVolatility),
+        ('sharpe', online.SharpeRatio),
+        ('sortino', online.SortinoRatio),
+        ('max_drawdown', online.MaxDrawdown),
+    )
+
+    def start_of_simulation(self,
+                            ledger,
+                            emission_rate,
+                            trading_calendar,
+                            sessions,
+                            benchmark_source):
+        self._benchmark_returns = benchmark_source.daily_returns(
+            sessions[0],
+            sessions[-1],
+        ).values
+        self._session_risk_metrics = []
+
+    def end_of_session(self,
+                       packet,
+                       ledger,
+                       session,
+                       session_ix,
+                       data_portal):
+        self._session_risk_metrics.append(packet['cumulative_risk_metrics'])
+
+    def end_of_simulation(self,
+                          packet,
+                          ledger,
+                          trading_calendar,
+                          sessions,
+                          data_portal,
+                          benchmark_source):
+        returns = ledger.daily_returns_array
+        statistics = [
+            (field, statistic_type())
+            for field, statistic_type in self._statistics
+        ]
+        alpha_beta = online.AlphaBeta()
+
+        # One pass over the final returns, folding in a session at a time.
+        for session_ix, risk in enumerate(self._session_risk_metrics):
+            for field, statistic in statistics:
+                res = statistic.update(session_ix, returns)
+                risk[field] = res if np.isfinite(res) else None
+
+            alpha, beta = alpha_beta.update(
+                session_ix,
+                returns,
+                self._benchmark_returns,
+            )
+            risk['alpha'] = None if np.isnan(alpha) else alpha
+            risk['beta'] = None if np.isnan(beta) else beta
+
+
 class MaxLeverage(object):
     """Tracks the maximum account leverage.
     """
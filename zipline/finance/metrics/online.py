@@ -0,0 +1,240 @@
+#
+# Copyright 2018 Quantopian, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming versions of the empyrical statistics reported by the risk
+metrics.
+
+Each statistic folds in the returns of completed sessions one at a time,
+so computing it for every bar of a simulation takes constant time per bar
+instead of time proportional to the number of sessions so far.
+"""
+from math import sqrt
+
+import empyrical as ep
+import numpy as np
+from six.moves import zip
+
+#: The number of sessions in a year, as used by empyrical for daily returns.
+ANNUALIZATION_FACTOR = 252
+
+
+def _divide(numerator, denominator):
+    """Divide with numpy semantics, where division by zero gives inf or nan.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.true_divide(numerator, denominator)
+
+
+class OnlineStatistic(object):
+    """A statistic of a growing sequence of daily returns.
+
+    Subclasses define the state of the statistic for no returns (``_empty``),
+    how to add one session's values to a state (``_push``), and how to
+    compute the statistic from a state (``_compute``).
+    """
+    def __init__(self):
+        self._state = self._empty()
+        self._count = 0
+
+    def update(self, session_ix, *arrays):
+        """Compute the statistic of ``array[:session_ix + 1]`` for each of
+        ``arrays``.
+
+        Parameters
+        ----------
+        session_ix : int
+            The index of the current session.
+        *arrays : np.ndarray[float64]
+            The daily values the statistic is computed from.
+
+        Returns
+        -------
+        statistic : float
+            The value of the statistic.
+
+        Notes
+        -----
+        The values of the sessions before ``session_ix`` must not change
+        between calls. The value of ``session_ix`` itself may change, as it
+        holds the partial return of the session in progress, so it is only
+        folded into the state once a later session is seen.
+        """
+        push = self._push
+        state = self._state
+        for values in zip(*(array[self._count:session_ix]
+                            for array in arrays)):
+            state = push(state, *values)
+        self._state = state
+        self._count = session_ix
+
+        current = [array[session_ix] for array in arrays]
+        return self._compute(push(state, *current), session_ix + 1)
+
+
+class _Moments(OnlineStatistic):
+    """Base class for statistics of the mean and variance of the returns.
+
+    The state is ``(count, mean, m2)`` over the non-nan returns, updated with
+    Welford's algorithm.
+    """
+    def _empty(self):
+        return 0, np.nan, 0.0
+
+    def _push(self, state, value):
+        if np.isnan(value):
+            return state
+
+        count, mean, m2 = state
+        count += 1
+        if count == 1:
+            return count, value, 0.0
+
+        delta = value - mean
+        mean += delta / count
+        return count, mean, m2 + delta * (value - mean)
+
+    @staticmethod
+    def _std(count, m2):
+        if count < 2:
+            return np.nan
+        return sqrt(m2 / (count - 1))
+
+
+class AnnualVolatility(_Moments):
+    """Streaming ``empyrical.annual_volatility``.
+    """
+    def _compute(self, state, length):
+        if length < 2:
+            return np.nan
+        count, _, m2 = state
+        return self._std(count, m2) * ANNUALIZATION_FACTOR ** (1.0 / 2.0)
+
+
+class SharpeRatio(_Moments):
+    """Streaming ``empyrical.sharpe_ratio``.
+    """
+    def _compute(self, state, length):
+        if length < 2:
+            return np.nan
+        count, mean, m2 = state
+        return _divide(mean, self._std(count, m2)) * sqrt(ANNUALIZATION_FACTOR)
+
+
+class SortinoRatio(OnlineStatistic):
+    """Streaming ``empyrical.sortino_ratio``.
+
+    The state is ``(count, mean, downside_sum_of_squares)`` over the non-nan
+    returns.
+    """
+    def _empty(self):
+        return 0, np.nan, 0.0
+
+    def _push(self, state, value):
+        if np.isnan(value):
+            return state
+
+        count, mean, downside = state
+        count += 1
+        if count == 1:
+            mean = value
+        else:
+            mean += (value - mean) / count
+        if value < 0:
+            downside += value * value
+        return count, mean, downside
+
+    def _compute(self, state, length):
+        if length < 2:
+            return np.nan
+        count, mean, downside = state
+        if not count:
+            return np.nan
+
+        downside_risk = sqrt(downside / count) * sqrt(ANNUALIZATION_FACTOR)
+        return _divide(mean * ANNUALIZATION_FACTOR, downside_risk)
+
+
+class MaxDrawdown(OnlineStatistic):
+    """Streaming ``empyrical.max_drawdown``.
+
+    The state is ``(cumulative_growth, peak_value, max_drawdown)``. Values
+    start at 100, like empyrical, so the results are identical.
+    """
+    _start = 100.0
+
+    def _empty(self):
+        return 1.0, self._start, 0.0
+
+    def _push(self, state, value):
+        growth, peak, drawdown = state
+        if not np.isnan(value):
+            growth *= 1 + value
+        current = growth * self._start
+        peak = np.fmax(peak, current)
+        drawdown = np.fmin(drawdown, (current - peak) / peak)
+        return growth, peak, drawdown
+
+    def _compute(self, state, length):
+        return state[2]
+
+
+class AlphaBeta(OnlineStatistic):
+    """Streaming ``empyrical.alpha_beta_aligned``.
+
+    ``update`` takes the algorithm returns and then the benchmark returns,
+    and returns an ``(alpha, beta)`` pair. The state is
+    ``(count, returns_mean, benchmark_mean, benchmark_m2, comoment)`` over the
+    sessions where both returns are not nan.
+    """
+    def _empty(self):
+        return 0, 0.0, 0.0, 0.0, 0.0
+
+    def _push(self, state, returns, benchmark):
+        if np.isnan(returns) or np.isnan(benchmark):
+            return state
+
+        count, returns_mean, benchmark_mean, benchmark_m2, comoment = state
+        count += 1
+        benchmark_delta = benchmark - benchmark_mean
+        benchmark_mean += benchmark_delta / count
+        returns_mean += (returns - returns_mean) / count
+        benchmark_m2 += benchmark_delta * (benchmark - benchmark_mean)
+        comoment += benchmark_delta * (returns - returns_mean)
+        return count, returns_mean, benchmark_mean, benchmark_m2, comoment
+
+    def _compute(self, state, length):
+        if length < 2:
+            return np.nan, np.nan
+
+        count, returns_mean, benchmark_mean, benchmark_m2, comoment = state
+        if not count:
+            return np.nan, np.nan
+
+        benchmark_variance = benchmark_m2 / count
+        if benchmark_variance < 1e-30:
+            return np.nan, np.nan
+
+        beta = (comoment / count) / benchmark_variance
+        alpha = (returns_mean - beta * benchmark_mean) * ANNUALIZATION_FACTOR
+        return alpha, beta
+
+
+#: The streaming implementation of empyrical statistics used with
+#: ``ReturnsStatistic``.
+ONLINE_STATISTICS = {
+    ep.annual_volatility: AnnualVolatility,
+    ep.sharpe_ratio: SharpeRatio,
+    ep.sortino_ratio: SortinoRatio,
+    ep.max_drawdown: MaxDrawdown,
+}
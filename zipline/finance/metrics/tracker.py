@@ -16,7 +16,7 @@ from __future__ import division
 
 import logbook
 
-from ..ledger import Ledger
+from ..ledger import Ledger, PositionTracker
 from zipline.utils.exploding_object import NamedExplodingObject
 
 
@@ -45,6 +45,8 @@ class MetricsTracker(object):
         The asset finder used in the simulation.
     metrics : list[Metric]
         The metrics to track.
+    position_tracker_class : type, optional
+        The type of the ledger's position tracker. default: PositionTracker
     """
     _hooks = (
         'start_of_simulation',
@@ -72,7 +74,8 @@ class MetricsTracker(object):
                  emission_rate,
                  data_frequency,
                  asset_finder,
-                 metrics):
+                 metrics,
+                 position_tracker_class=PositionTracker):
         self.emission_rate = emission_rate
 
         self._trading_calendar = trading_calendar
@@ -94,7 +97,12 @@ class MetricsTracker(object):
         )
         self._total_session_count = len(sessions)
 
-        self._ledger = Ledger(sessions, capital_base, data_frequency)
+        self._ledger = Ledger(
+            sessions,
+            capital_base,
+            data_frequency,
+            position_tracker_class=position_tracker_class,
+        )
 
         self._benchmark_source = NamedExplodingObject(
             'self._benchmark_source',
@@ -223,3 +223,60 @@ last_sale_price: {last_sale_price}"
             'cost_basis': self.cost_basis,
             'last_sale_price': self.last_sale_price
         }
+
+
+class ArrayPosition(Position):
+    """A position whose values are stored in the arrays of an
+    :class:`~zipline.finance.ledger.ArrayPositionTracker`.
+
+    Parameters
+    ----------
+    columns : dict[str, np.ndarray]
+        The tracker's arrays, by field name.
+    slot : int
+        The index of this position in the arrays.
+
+    Notes
+    -----
+    When the position is closed it is detached from the arrays, and holds its
+    final values like a ``Position``.
+    """
+    __slots__ = '_columns', '_slot'
+
+    _fields = frozenset({
+        'asset',
+        'amount',
+        'cost_basis',
+        'last_sale_price',
+        'last_sale_date',
+    })
+
+    def __init__(self, columns, slot):
+        object.__setattr__(self, '_columns', columns)
+        object.__setattr__(self, '_slot', slot)
+
+    def __getattr__(self, attr):
+        if self._slot is None:
+            return getattr(self.inner_position, attr)
+        if attr not in self._fields:
+            raise AttributeError(attr)
+        return self._columns[attr].item(self._slot)
+
+    def __setattr__(self, attr, value):
+        if self._slot is None:
+            setattr(self.inner_position, attr, value)
+        elif attr == 'asset' or attr not in self._fields:
+            raise AttributeError('cannot set %r on a position' % attr)
+        else:
+            self._columns[attr][self._slot] = value
+
+    def _move(self, slot):
+        object.__setattr__(self, '_slot', slot)
+
+    def _detach(self):
+        inner = zp.InnerPosition(
+            **{field: getattr(self, field) for field in self._fields}
+        )
+        object.__setattr__(self, 'inner_position', inner)
+        object.__setattr__(self, '_columns', None)
+        object.__setattr__(self, '_slot', None)
@@ -42,3 +42,37 @@ class FinancialModelMeta(ABCMeta):
 
 class AllowedAssetMarker(FinancialModelMeta):
     pass
+
+
+def implements_batch(model, batch_method, scalar_methods):
+    """Check if a model has a batch implementation that matches its scalar
+    implementation.
+
+    Parameters
+    ----------
+    model : SlippageModel or CommissionModel
+        The model to check.
+    batch_method : str
+        The name of the method which processes many orders at once.
+    scalar_methods : iterable[str]
+        The names of the methods which process one order at a time.
+
+    Returns
+    -------
+    implements_batch : bool
+        True if ``batch_method`` is defined on the same class as, or a
+        subclass of, the class which defines the scalar methods.
+
+    Notes
+    -----
+    A subclass of a model with a batch implementation may override the
+    scalar methods to change how orders are filled. The inherited batch
+    implementation would not know about that, so it must not be used.
+    """
+    for cls in type(model).__mro__:
+        namespace = vars(cls)
+        if batch_method in namespace:
+            return True
+        if any(method in namespace for method in scalar_methods):
+            return False
+    return False
@@ -25,7 +25,11 @@ from toolz import merge
 from zipline.assets import Equity, Future
 from zipline.errors import HistoryWindowStartsBeforeData
 from zipline.finance.constants import ROOT_SYMBOL_TO_ETA
-from zipline.finance.shared import AllowedAssetMarker, FinancialModelMeta
+from zipline.finance.shared import (
+    AllowedAssetMarker,
+    FinancialModelMeta,
+    implements_batch,
+)
 from zipline.finance.transaction import create_transaction
 from zipline.utils.cache import ExpiringCache
 from zipline.utils.dummy import DummyMapping
@@ -80,6 +84,32 @@ def fill_price_worse_than_limit_price(fill_price, order):
     return False
 
 
+def fill_prices_worse_than_limit_prices(fill_prices, directions, limits):
+    """
+    Checks whether each fill price is worse than its order's limit price.
+
+    Parameters
+    ----------
+    fill_prices : np.ndarray[float64]
+        The prices to check.
+    directions : np.ndarray[float64]
+        The direction of each order, 1 for a buy and -1 for a sell.
+    limits : np.ndarray[float64]
+        The limit price of each order, or nan for orders without a limit.
+
+    Returns
+    -------
+    worse : np.ndarray[bool]
+        Whether each fill price is above the limit price (for a buy) or below
+        the limit price (for a sell). See
+        :func:`fill_price_worse_than_limit_price`.
+    """
+    return (
+        ((directions > 0) & (fill_prices > limits)) |
+        ((directions < 0) & (fill_prices < limits))
+    )
+
+
 class SlippageModel(with_metaclass(FinancialModelMeta)):
     """Abstract interface for defining a slippage model.
     """
@@ -165,6 +195,134 @@ class SlippageModel(with_metaclass(FinancialModelMeta)):
                 self._volume_for_bar += abs(txn.amount)
                 yield order, txn
 
+    def simulate_batch(self, data, assets, orders):
+        """Simulate the open orders of many assets.
+
+        Parameters
+        ----------
+        data : BarData
+            The data for the given bar.
+        assets : list[Asset]
+            The assets with open orders.
+        orders : list[list[Order]]
+            The open orders of each asset.
+
+        Returns
+        -------
+        fills : list[(Order, Transaction)]
+            The orders which were filled and their transactions, in the same
+            order as calling :meth:`simulate` for each asset.
+
+        Notes
+        -----
+        Models may implement ``process_order_batch`` to fill orders for many
+        assets at once. It receives arrays aligned by order, where each order
+        is for a different asset:
+
+        ``process_order_batch(prices, volumes, volumes_for_bar, amounts,
+        open_amounts, directions, limits)``
+
+        ``volumes_for_bar`` is the volume already filled for each asset in
+        this bar, and ``limits`` is nan for orders without a limit price. It
+        returns ``(execution_prices, execution_amounts, liquidity_exceeded)``
+        where the execution price is nan for orders which are not filled,
+        and ``liquidity_exceeded`` marks the assets whose remaining orders
+        can't be filled in this bar, like raising ``LiquidityExceeded`` from
+        ``process_order``.
+
+        Models which do not implement ``process_order_batch``, or subclasses
+        which override ``process_order`` or ``simulate``, are simulated one
+        asset at a time.
+
+        Afterwards, :attr:`volume_for_bar` is the volume filled for the last
+        asset, as if :meth:`simulate` was called for each asset in turn.
+        """
+        if not implements_batch(
+                self,
+                'process_order_batch',
+                ('process_order', 'simulate')):
+            return [
+                fill
+                for asset, asset_orders in zip(assets, orders)
+                for fill in self.simulate(data, asset, asset_orders)
+            ]
+
+        self._volume_for_bar = 0
+        if not assets:
+            return []
+
+        dt = data.current_dt
+        volumes = np.asarray(data.current(assets, 'volume'), dtype='float64')
+        prices = np.asarray(data.current(assets, 'close'), dtype='float64')
+        volumes_for_bar = np.zeros(len(assets))
+
+        # Assets whose remaining orders can't be filled in this bar.
+        done = (volumes == 0) | np.isnan(prices)
+
+        fills = [[] for _ in assets]
+
+        # The orders of an asset are filled in order, so each pass fills the
+        # next order of every asset which can still trade.
+        for order_ix in range(max(map(len, orders))):
+            asset_ixs = []
+            batch = []
+            for asset_ix in np.flatnonzero(~done):
+                asset_orders = orders[asset_ix]
+                if order_ix >= len(asset_orders):
+                    continue
+
+                order = asset_orders[order_ix]
+                if order.open_amount == 0:
+                    continue
+
+                order.check_triggers(prices[asset_ix], dt)
+                if not order.triggered:
+                    continue
+
+                asset_ixs.append(asset_ix)
+                batch.append(order)
+
+            if not batch:
+                continue
+
+            asset_ixs = np.array(asset_ixs)
+            execution_prices, execution_amounts, liquidity_exceeded = (
+                self.process_order_batch(
+                    prices[asset_ixs],
+                    volumes[asset_ixs],
+                    volumes_for_bar[asset_ixs],
+                    np.array([order.amount for order in batch], dtype=float),
+                    np.array(
+                        [order.open_amount for order in batch],
+                        dtype=float,
+                    ),
+                    np.array([order.direction for order in batch]),
+                    np.array(
+                        [order.limit or np.nan for order in batch],
+                        dtype=float,
+                    ),
+                )
+            )
+            done[asset_ixs[liquidity_exceeded]] = True
+
+            filled = ~(np.isnan(execution_prices) | liquidity_exceeded)
+            for ix in np.flatnonzero(filled):
+                asset_ix = asset_ixs[ix]
+                txn = create_transaction(
+                    batch[ix],
+                    dt,
+                    execution_prices[ix].item(),
+                    execution_amounts[ix].item(),
+                )
+                volumes_for_bar[asset_ix] += abs(txn.amount)
+                fills[asset_ix].append((batch[ix], txn))
+
+        # Like after calling ``simulate`` for each asset, ``volume_for_bar``
+        # is the volume filled for the last asset.
+        self._volume_for_bar = sum(abs(txn.amount) for _, txn in fills[-1])
+
+        return [fill for asset_fills in fills for fill in asset_fills]
+
     def asdict(self):
         return self.__dict__
 
@@ -269,6 +427,53 @@ class VolumeShareSlippage(SlippageModel):
             math.copysign(cur_volume, order.direction)
         )
 
+    def process_order_batch(self,
+                            prices,
+                            volumes,
+                            volumes_for_bar,
+                            amounts,
+                            open_amounts,
+                            directions,
+                            limits):
+        max_volume = self.volume_limit * volumes
+
+        # price impact accounts for the total volume of transactions
+        # created against the current minute bar
+        remaining_volume = max_volume - volumes_for_bar
+        liquidity_exceeded = remaining_volume < 1
+
+        # the current order amount will be the min of the
+        # volume available in the bar or the open amount.
+        cur_volume = np.trunc(
+            np.minimum(remaining_volume, np.abs(open_amounts)),
+        )
+
+        # tally the current amount into our total amount ordered.
+        # total amount will be used to calculate price impact
+        total_volume = volumes_for_bar + cur_volume
+
+        volume_share = np.minimum(total_volume / volumes, self.volume_limit)
+
+        simulated_impact = volume_share ** 2 \
+            * np.copysign(self.price_impact, directions) \
+            * prices
+        impacted_prices = prices + simulated_impact
+
+        unfilled = (
+            liquidity_exceeded |
+            (cur_volume < 1) |
+            fill_prices_worse_than_limit_prices(
+                impacted_prices,
+                directions,
+                limits,
+            )
+        )
+        return (
+            np.where(unfilled, np.nan, impacted_prices),
+            np.copysign(cur_volume, directions),
+            liquidity_exceeded,
+        )
+
 
 class FixedSlippage(SlippageModel):
     """
@@ -296,6 +501,20 @@ class FixedSlippage(SlippageModel):
             order.amount
         )
 
+    def process_order_batch(self,
+                            prices,
+                            volumes,
+                            volumes_for_bar,
+                            amounts,
+                            open_amounts,
+                            directions,
+                            limits):
+        return (
+            prices + (self.spread / 2.0 * directions),
+            amounts,
+            np.zeros(len(prices), dtype=bool),
+        )
+
 
 class MarketImpactBase(SlippageModel):
     """
@@ -581,3 +800,24 @@ class FixedBasisPointsSlippage(SlippageModel):
             price + price * (self.percentage * order.direction),
             shares_to_fill * order.direction
         )
+
+    def process_order_batch(self,
+                            prices,
+                            volumes,
+                            volumes_for_bar,
+                            amounts,
+                            open_amounts,
+                            directions,
+                            limits):
+        max_volume = np.trunc(self.volume_limit * volumes)
+        shares_to_fill = np.minimum(
+            np.abs(open_amounts),
+            max_volume - volumes_for_bar,
+        )
+        liquidity_exceeded = shares_to_fill == 0
+
+        return (
+            prices + prices * (self.percentage * directions),
+            shares_to_fill * directions,
+            liquidity_exceeded,
+        )
@@ -70,6 +70,14 @@ cdef class MinuteSimulationClock:
             )
         return minutes_by_session
 
+    def all_minutes(self):
+        """The minutes at which this clock emits bars, in order.
+        """
+        return pd.DatetimeIndex(np.concatenate([
+            self.minutes_by_session[session_nano].asi8
+            for session_nano in self.sessions_nanos
+        ]), tz='UTC')
+
     def __iter__(self):
         minute_emission = self.minute_emission
 
@@ -18,7 +18,7 @@ from logbook import Logger, Processor
 from zipline.finance.order import ORDER_STATUS
 from zipline.protocol import BarData
 from zipline.utils.api_support import ZiplineAPI
-from six import viewkeys
+from six import itervalues, viewkeys
 
 from zipline.gens.sim_engine import (
     BAR,
@@ -94,6 +94,20 @@ class AlgorithmSimulator(object):
             universe_func=universe_func
         )
 
+    def _is_idle_bar(self, dt):
+        """
+        Check if the algorithm has nothing to do in the bar at ``dt``: no
+        scheduled event triggers, there is no capital change and there are
+        no open or new orders to process.
+        """
+        algo = self.algo
+        return not (
+            algo.event_manager.next_trigger(dt) == dt.value or
+            dt in algo.capital_changes or
+            algo.blotter.new_orders or
+            any(itervalues(algo.blotter.open_orders))
+        )
+
     def transform(self):
         """
         Main generator work loop.
@@ -102,6 +116,12 @@ class AlgorithmSimulator(object):
         metrics_tracker = algo.metrics_tracker
         emission_rate = metrics_tracker.emission_rate
 
+        # When performance is only emitted at the end of each session, the
+        # minutes where the algorithm has nothing to do are skipped.
+        fast_forward = (
+            algo.data_frequency == 'minute' and emission_rate == 'daily'
+        )
+
         def every_bar(dt_to_use, current_data=self.current_data,
                       handle_data=algo.event_manager.handle_data):
             for capital_change in calculate_minute_capital_changes(dt_to_use):
@@ -202,12 +222,20 @@ class AlgorithmSimulator(object):
 
             for dt, action in self.clock:
                 if action == BAR:
+                    if fast_forward and self._is_idle_bar(dt):
+                        continue
+
                     for capital_change_packet in every_bar(dt):
                         yield capital_change_packet
                 elif action == SESSION_START:
                     for capital_change_packet in once_a_day(dt):
                         yield capital_change_packet
                 elif action == SESSION_END:
+                    if fast_forward:
+                        # The last bars of the session may have been skipped.
+                        self.simulation_dt = dt
+                        algo.on_dt_changed(dt)
+
                     # End of the session.
                     positions = metrics_tracker.positions
                     position_assets = algo.asset_finder.retrieve_all(positions)
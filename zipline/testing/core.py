@@ -721,6 +721,13 @@ class FakeDataPortal(DataPortal):
         else:
             return 1.0
 
+    def get_spot_values(self, assets, field, dt, data_frequency,
+                        perspective_dt=None):
+        if field == "volume":
+            return np.full(len(assets), 100.0)
+        else:
+            return np.full(len(assets), 1.0)
+
     def get_history_window(self, assets, end_dt, bar_count, frequency, field,
                            data_frequency, ffill=True):
         end_idx = self.trading_calendar.all_sessions.searchsorted(end_dt)
@@ -764,6 +771,13 @@ class FetcherDataPortal(DataPortal):
         # otherwise just return a fixed value
         return int(asset)
 
+    def get_spot_values(self, assets, field, dt, data_frequency,
+                        perspective_dt=None):
+        return np.array([
+            self.get_spot_value(asset, field, dt, data_frequency)
+            for asset in assets
+        ], dtype=np.float64)
+
     # XXX: These aren't actually the methods that are used by the superclasses,
     # so these don't do anything, and this class will likely produce unexpected
     # results for history().
@@ -931,6 +931,9 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
         If this flag is set, use the value as the `read_all_threshold`
         parameter to BcolzDailyBarReader, otherwise use the default
         value.
+    BCOLZ_DAILY_BAR_WRITE_MMAP : bool
+        If this flag is set, the daily bars are also written as memory
+        mappable columns, which the BcolzDailyBarReader will read from.
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE : bool
         If this flag is set, `make_equity_daily_bar_data` will read data from
         the minute bar reader defined by a `WithBcolzEquityMinuteBarReader`.
@@ -950,6 +953,7 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
     """
     BCOLZ_DAILY_BAR_PATH = 'daily_equity_pricing.bcolz'
     BCOLZ_DAILY_BAR_READ_ALL_THRESHOLD = None
+    BCOLZ_DAILY_BAR_WRITE_MMAP = False
     EQUITY_DAILY_BAR_SOURCE_FROM_MINUTE = False
     # allows WithBcolzEquityDailyBarReaderFromCSVs to call the
     # `write_csvs`method without needing to reimplement `init_class_fixtures`
@@ -971,7 +975,13 @@ class WithBcolzEquityDailyBarReader(WithEquityDailyBarData, WithTmpDir):
 
         trading_calendar = cls.trading_calendars[Equity]
         cls.bcolz_daily_bar_ctable = t = getattr(
-            BcolzDailyBarWriter(p, trading_calendar, days[0], days[-1]),
+            BcolzDailyBarWriter(
+                p,
+                trading_calendar,
+                days[0],
+                days[-1],
+                write_mmap=cls.BCOLZ_DAILY_BAR_WRITE_MMAP,
+            ),
             cls._write_method_name,
         )(
             cls.make_equity_daily_bar_data(),
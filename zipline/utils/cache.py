@@ -1,13 +1,12 @@
 """
 Caching utilities for zipline
 """
-from collections import MutableMapping
+from collections import MutableMapping, OrderedDict
 import errno
 from functools import partial
 import os
 import pickle
-from distutils import dir_util
-from shutil import rmtree, move
+from shutil import copy2, rmtree, move
 from tempfile import mkdtemp, NamedTemporaryFile
 
 import pandas as pd
@@ -102,8 +101,30 @@ class ExpiringCache(object):
 
     cleanup : callable, optional
         A method that takes a single argument, a cached object, and is called
-        upon expiry of the cached object, prior to deleting the object. If not
-        provided, defaults to a no-op.
+        upon expiry or eviction of the cached object, prior to deleting the
+        object. If not provided, defaults to a no-op.
+    max_bytes : int, optional
+        The maximum total size of the cached objects, as measured by
+        ``sizeof``. When adding an object puts the cache over this limit, the
+        least recently used objects are evicted until it fits again. The most
+        recently added object is never evicted. This may not be combined with
+        ``cache``. If not provided, the cache is not bounded by size.
+    sizeof : callable, optional
+        A method that takes a single argument, a value being added to the
+        cache, and returns its size in bytes. Required with ``max_bytes``.
+
+    Attributes
+    ----------
+    hits : int
+        The number of calls to ``get`` which returned a value.
+    misses : int
+        The number of calls to ``get`` which raised a KeyError, either
+        because the key was missing or because its value had expired.
+    evictions : int
+        The number of values evicted to stay under ``max_bytes``, or to make
+        room in a full size-bounded ``cache`` like ``lru.LRU``.
+    nbytes : int
+        The total size of the cached values, when ``max_bytes`` is given.
 
     Examples
     --------
@@ -120,13 +141,33 @@ class ExpiringCache(object):
     KeyError: 'foo'
     """
 
-    def __init__(self, cache=None, cleanup=lambda value_to_clean: None):
+    def __init__(self,
+                 cache=None,
+                 cleanup=lambda value_to_clean: None,
+                 max_bytes=None,
+                 sizeof=None):
+        if max_bytes is not None:
+            if cache is not None:
+                raise ValueError('cannot pass both cache and max_bytes')
+            if sizeof is None:
+                raise ValueError('sizeof is required with max_bytes')
+            # Ordered from least to most recently used.
+            cache = OrderedDict()
+
         if cache is not None:
             self._cache = cache
         else:
             self._cache = {}
 
         self.cleanup = cleanup
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._sizes = {}
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get(self, key, dt):
         """Get the value of a cached object.
@@ -150,12 +191,26 @@ class ExpiringCache(object):
             has expired.
         """
         try:
-            return self._cache[key].unwrap(dt)
+            cached = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            raise
+
+        try:
+            value = cached.unwrap(dt)
         except Expired:
-            self.cleanup(self._cache[key]._unsafe_get_value())
-            del self._cache[key]
+            self.misses += 1
+            self.cleanup(cached._unsafe_get_value())
+            self._delete(key)
             raise KeyError(key)
 
+        self.hits += 1
+        if self.max_bytes is not None:
+            # Move the key to the most recently used end.
+            del self._cache[key]
+            self._cache[key] = cached
+        return value
+
     def set(self, key, value, expiration_dt):
         """Adds a new key value pair to the cache.
 
@@ -169,7 +224,35 @@ class ExpiringCache(object):
             When should this mapping expire? The cache is considered invalid
             for dates **strictly greater** than ``expiration_dt``.
         """
+        if self.max_bytes is None:
+            cache = self._cache
+            if key not in cache:
+                # A full ``lru.LRU`` drops its least recently used value to
+                # make room for the new key.
+                get_size = getattr(cache, 'get_size', None)
+                if get_size is not None and len(cache) >= get_size():
+                    self.evictions += 1
+            cache[key] = CachedObject(value, expiration_dt)
+            return
+
+        if key in self._cache:
+            self._delete(key)
+        size = self._sizeof(value)
         self._cache[key] = CachedObject(value, expiration_dt)
+        self._sizes[key] = size
+        self.nbytes += size
+
+        cache = self._cache
+        while self.nbytes > self.max_bytes and len(cache) > 1:
+            evicted_key, evicted = cache.popitem(last=False)
+            self.nbytes -= self._sizes.pop(evicted_key)
+            self.evictions += 1
+            self.cleanup(evicted._unsafe_get_value())
+
+    def _delete(self, key):
+        del self._cache[key]
+        if self.max_bytes is not None:
+            self.nbytes -= self._sizes.pop(key)
 
 
 class dataframe_cache(MutableMapping):
@@ -343,16 +426,20 @@ class working_dir(object):
     final_path : str
         The location to move the file when committing.
     *args, **kwargs
-        Forwarded to tmp_dir.
+        Forwarded to mkdtemp.
 
     Notes
     -----
     The file is moved on __exit__ if there are no exceptions.
-    ``working_dir`` uses :func:`dir_util.copy_tree` to move the actual files,
-    meaning it has as strong of guarantees as :func:`dir_util.copy_tree`.
+    ``working_dir`` hard-links each file into ``final_path``, replacing any
+    existing file, and falls back to copying the file when it cannot be
+    linked, for example when the temporary directory is on another
+    filesystem. This is not atomic.
+    Passing ``dir`` to create the temporary directory on the same filesystem
+    as ``final_path`` avoids copying the data.
     """
     def __init__(self, final_path, *args, **kwargs):
-        self.path = mkdtemp()
+        self.path = mkdtemp(*args, **kwargs)
         self._final_path = final_path
 
     def ensure_dir(self, *path_parts):
@@ -380,7 +467,21 @@ class working_dir(object):
     def _commit(self):
         """Sync the temporary directory to the final path.
         """
-        dir_util.copy_tree(self.path, self._final_path)
+        for dirpath, _, filenames in os.walk(self.path):
+            target = os.path.join(
+                self._final_path,
+                os.path.relpath(dirpath, self.path),
+            )
+            ensure_directory(target)
+            for filename in filenames:
+                src = os.path.join(dirpath, filename)
+                dest = os.path.join(target, filename)
+                if os.path.exists(dest):
+                    os.remove(dest)
+                try:
+                    os.link(src, dest)
+                except OSError:
+                    copy2(src, dest)
 
     def __enter__(self):
         return self
@@ -59,6 +59,11 @@ __all__ = [
 MAX_MONTH_RANGE = 23
 MAX_WEEK_RANGE = 5
 
+# Marks the events which haven't been compiled yet.
+_uncompiled = sentinel('_uncompiled')
+# Marks the events which trigger at every minute once compiled.
+_every_minute = sentinel('_every_minute')
+
 
 def naive_to_utc(ts):
     """
@@ -179,6 +184,93 @@ def lossless_float_to_int(funcname, func, argname, arg):
     raise TypeError(arg)
 
 
+def _defined_before(cls, name, other):
+    """
+    Check if ``name`` is defined on ``cls`` or one of its bases no later in
+    the mro than ``other``.
+    """
+    for base in cls.__mro__:
+        namespace = vars(base)
+        if name in namespace:
+            return True
+        if other in namespace:
+            return False
+    return False
+
+
+def _session_locs(cal, minutes):
+    """
+    Find the session of each minute, like ``cal.minute_to_session_label``.
+
+    Minutes outside of a session of ``cal``, for example when the rule's
+    calendar is not the simulation's calendar, belong to the next session.
+
+    Returns
+    -------
+    session_locs : np.ndarray[intp]
+        The location of the session of each minute in ``cal.all_sessions``.
+    is_open : np.ndarray[bool]
+        Whether each minute is a minute of its session.
+    """
+    minute_values = minutes.asi8
+    session_locs = cal.market_closes_nanos.searchsorted(minute_values)
+    is_open = (
+        cal.market_opens_nanos.searchsorted(minute_values, side='right') - 1
+    ) == session_locs
+    return session_locs, is_open
+
+
+def _first_minute_of_sessions(cal, minutes):
+    """
+    Group minutes by session, see ``_session_locs``.
+
+    Returns
+    -------
+    first_ixs : np.ndarray[intp]
+        The index of the first minute of each session.
+    session_ixs : np.ndarray[intp]
+        The index of the session of each minute.
+    """
+    session_locs, _ = _session_locs(cal, minutes)
+    _, first_ixs, session_ixs = np.unique(
+        session_locs,
+        return_index=True,
+        return_inverse=True,
+    )
+    return first_ixs, session_ixs
+
+
+class TriggerMinutes(object):
+    """
+    The minutes at which an event triggers, with a cursor at the next one.
+
+    Parameters
+    ----------
+    minutes : np.ndarray[int64]
+        The sorted trigger minutes, as nanoseconds since the epoch.
+    """
+    def __init__(self, minutes):
+        self._minutes = minutes.tolist()
+        self._ix = 0
+
+    def next_trigger(self, dt_value):
+        """
+        Advance to the first trigger minute at or after ``dt_value``, which
+        must not decrease between calls.
+
+        Returns
+        -------
+        next_trigger : int or None
+            The trigger minute in nanoseconds, or None if there is none.
+        """
+        minutes = self._minutes
+        ix = self._ix
+        while ix < len(minutes) and minutes[ix] < dt_value:
+            ix += 1
+        self._ix = ix
+        return minutes[ix] if ix < len(minutes) else None
+
+
 class EventManager(object):
     """Manages a list of Event objects.
     This manages the logic for checking the rules and dispatching to the
@@ -192,6 +284,11 @@ class EventManager(object):
     """
     def __init__(self, create_context=None):
         self._events = []
+        # The TriggerMinutes of each event once the manager is compiled.
+        # Events whose rules can't be compiled are None, and events which
+        # haven't been used since the manager was compiled are _uncompiled.
+        self._triggers = []
+        self._minutes = None
         self._create_context = (
             create_context
             if create_context is not None else
@@ -202,19 +299,92 @@ class EventManager(object):
         """
         Adds an event to the manager.
         """
+        # The rule of a new event is only compiled when it is first used, so
+        # that it starts from the first minute it would have been called at.
+        triggers = _uncompiled if self._minutes is not None else None
         if prepend:
             self._events.insert(0, event)
+            self._triggers.insert(0, triggers)
         else:
             self._events.append(event)
+            self._triggers.append(triggers)
+
+    def compile(self, minutes):
+        """
+        Compute the minutes at which each event triggers ahead of time.
+
+        After this, ``handle_data`` compares the current minute with the next
+        trigger minute of each event instead of calling its rule, except for
+        the rules which can't be compiled.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            Every minute ``handle_data`` will be called at, in order.
+        """
+        self._minutes = minutes
+        self._triggers = [_uncompiled] * len(self._events)
+
+    def _event_triggers(self, ix, dt):
+        triggers = self._triggers[ix]
+        if triggers is _uncompiled:
+            minutes = self._minutes[self._minutes.searchsorted(dt):]
+            trigger_mask = self._events[ix].rule.trigger_minutes(minutes)
+            if trigger_mask is None:
+                triggers = None
+            elif len(trigger_mask) and trigger_mask.all():
+                # Don't keep a list of every minute for events like
+                # ``handle_data``.
+                triggers = _every_minute
+            else:
+                triggers = TriggerMinutes(minutes.asi8[trigger_mask])
+            self._triggers[ix] = triggers
+        return triggers
+
+    def next_trigger(self, dt):
+        """
+        Find the first minute at or after ``dt`` at which any event may
+        trigger.
+
+        Parameters
+        ----------
+        dt : pd.Timestamp
+            The current minute. This must not decrease between calls.
+
+        Returns
+        -------
+        next_trigger : int or None
+            The minute in nanoseconds since the epoch, or None if no event
+            triggers again. This is ``dt`` itself if any event's rule must be
+            called at every minute.
+        """
+        dt_value = dt.value
+        next_trigger = None
+        for ix in range(len(self._events)):
+            triggers = self._event_triggers(ix, dt)
+            if triggers is None or triggers is _every_minute:
+                return dt_value
+
+            event_next_trigger = triggers.next_trigger(dt_value)
+            if event_next_trigger is not None and (
+                    next_trigger is None or event_next_trigger < next_trigger):
+                next_trigger = event_next_trigger
+        return next_trigger
 
     def handle_data(self, context, data, dt):
         with self._create_context(data):
-            for event in self._events:
-                event.handle_data(
-                    context,
-                    data,
-                    dt,
-                )
+            # Events added by the callbacks are dispatched in this bar too,
+            # so the list is walked by index.
+            ix = 0
+            while ix < len(self._events):
+                event = self._events[ix]
+                triggers = self._event_triggers(ix, dt)
+                if triggers is None:
+                    event.handle_data(context, data, dt)
+                elif (triggers is _every_minute or
+                      triggers.next_trigger(dt.value) == dt.value):
+                    event.callback(context, data)
+                ix += 1
 
 
 class Event(namedtuple('Event', ['rule', 'callback'])):
@@ -256,6 +426,33 @@ class EventRule(six.with_metaclass(ABCMeta)):
         """
         raise NotImplementedError('should_trigger')
 
+    def trigger_minutes(self, minutes):
+        """
+        Compute the minutes at which the rule triggers, without changing the
+        state of the rule.
+
+        Parameters
+        ----------
+        minutes : pd.DatetimeIndex
+            The minutes ``should_trigger`` would be called at, in order.
+
+        Returns
+        -------
+        trigger_minutes : np.ndarray[bool] or None
+            Whether ``should_trigger`` would return True at each minute, or
+            None if that can't be known ahead of time.
+
+        Notes
+        -----
+        Rules compute this in ``_trigger_minutes``, which is not used by
+        subclasses that override ``should_trigger``. ``_trigger_minutes``
+        may also return None, in which case the rule is called at every
+        minute.
+        """
+        if _defined_before(type(self), '_trigger_minutes', 'should_trigger'):
+            return self._trigger_minutes(minutes)
+        return None
+
 
 class StatelessRule(EventRule):
     """
@@ -272,6 +469,19 @@ class StatelessRule(EventRule):
         return ComposedRule(self, rule, ComposedRule.lazy_and)
     __and__ = and_
 
+    def trigger_minutes(self, minutes):
+        if _defined_before(type(self), '_trigger_minutes', 'should_trigger'):
+            return self._trigger_minutes(minutes)
+        return self._call_each_minute(minutes)
+
+    def _call_each_minute(self, minutes):
+        # Stateless rules give the same result whenever they are called, so
+        # they may be evaluated ahead of time.
+        return np.array(
+            [bool(self.should_trigger(dt)) for dt in minutes],
+            dtype=bool,
+        )
+
 
 class ComposedRule(StatelessRule):
     """
@@ -313,6 +523,18 @@ class ComposedRule(StatelessRule):
         """
         return first_should_trigger(dt) and second_should_trigger(dt)
 
+    def _trigger_minutes(self, minutes):
+        if self.composer is not ComposedRule.lazy_and:
+            return self._call_each_minute(minutes)
+
+        first = self.first.trigger_minutes(minutes)
+        if first is None:
+            return None
+        second = self.second.trigger_minutes(minutes)
+        if second is None:
+            return None
+        return first & second
+
     @property
     def cal(self):
         return self.first.cal
@@ -335,6 +557,9 @@ class Always(StatelessRule):
         return True
     should_trigger = always_trigger
 
+    def _trigger_minutes(self, minutes):
+        return np.ones(len(minutes), dtype=bool)
+
 
 class Never(StatelessRule):
     """
@@ -348,6 +573,9 @@ class Never(StatelessRule):
         return False
     should_trigger = never_trigger
 
+    def _trigger_minutes(self, minutes):
+        return np.zeros(len(minutes), dtype=bool)
+
 
 class AfterOpen(StatelessRule):
     """
@@ -370,9 +598,10 @@ class AfterOpen(StatelessRule):
 
         self._one_minute = datetime.timedelta(minutes=1)
 
-    def calculate_dates(self, dt):
+    def _periods(self, dt):
         """
-        Given a date, find that day's open and period end (open + offset).
+        Given a date, find that day's open, period end (open + offset) and
+        close, without changing the state of the rule.
         """
         period_start, period_close = self.cal.open_and_close_for_session(
             self.cal.minute_to_session_label(dt),
@@ -381,10 +610,19 @@ class AfterOpen(StatelessRule):
         # Align the market open and close times here with the execution times
         # used by the simulation clock. This ensures that scheduled functions
         # trigger at the correct times.
-        self._period_start = self.cal.execution_time_from_open(period_start)
-        self._period_close = self.cal.execution_time_from_close(period_close)
+        period_start = self.cal.execution_time_from_open(period_start)
+        period_close = self.cal.execution_time_from_close(period_close)
 
-        self._period_end = self._period_start + self.offset - self._one_minute
+        period_end = period_start + self.offset - self._one_minute
+        return period_start, period_end, period_close
+
+    def calculate_dates(self, dt):
+        """
+        Given a date, find that day's open and period end (open + offset).
+        """
+        (self._period_start,
+         self._period_end,
+         self._period_close) = self._periods(dt)
 
     def should_trigger(self, dt):
         # There are two reasons why we might want to recalculate the dates.
@@ -404,6 +642,14 @@ class AfterOpen(StatelessRule):
 
         return dt == self._period_end
 
+    def _trigger_minutes(self, minutes):
+        first_ixs, session_ixs = _first_minute_of_sessions(self.cal, minutes)
+        period_ends = np.empty(len(first_ixs), dtype='int64')
+        for session_ix, minute_ix in enumerate(first_ixs):
+            period_ends[session_ix] = \
+                self._periods(minutes[minute_ix])[1].value
+        return minutes.asi8 == period_ends[session_ixs]
+
 
 class BeforeClose(StatelessRule):
     """
@@ -426,9 +672,10 @@ class BeforeClose(StatelessRule):
 
         self._one_minute = datetime.timedelta(minutes=1)
 
-    def calculate_dates(self, dt):
+    def _periods(self, dt):
         """
-        Given a dt, find that day's close and period start (close - offset).
+        Given a dt, find that day's period start (close - offset) and close,
+        without changing the state of the rule.
         """
         period_end = self.cal.open_and_close_for_session(
             self.cal.minute_to_session_label(dt),
@@ -437,9 +684,14 @@ class BeforeClose(StatelessRule):
         # Align the market close time here with the execution time used by the
         # simulation clock. This ensures that scheduled functions trigger at
         # the correct times.
-        self._period_end = self.cal.execution_time_from_close(period_end)
+        period_end = self.cal.execution_time_from_close(period_end)
+        return period_end - self.offset, period_end
 
-        self._period_start = self._period_end - self.offset
+    def calculate_dates(self, dt):
+        """
+        Given a dt, find that day's close and period start (close - offset).
+        """
+        self._period_start, self._period_end = self._periods(dt)
         self._period_close = self._period_end
 
     def should_trigger(self, dt):
@@ -457,6 +709,14 @@ class BeforeClose(StatelessRule):
 
         return self._period_start == dt
 
+    def _trigger_minutes(self, minutes):
+        first_ixs, session_ixs = _first_minute_of_sessions(self.cal, minutes)
+        period_starts = np.empty(len(first_ixs), dtype='int64')
+        for session_ix, minute_ix in enumerate(first_ixs):
+            period_starts[session_ix] = \
+                self._periods(minutes[minute_ix])[0].value
+        return minutes.asi8 == period_starts[session_ixs]
+
 
 class NotHalfDay(StatelessRule):
     """
@@ -466,6 +726,13 @@ class NotHalfDay(StatelessRule):
         return self.cal.minute_to_session_label(dt) \
             not in self.cal.early_closes
 
+    def _trigger_minutes(self, minutes):
+        session_locs, _ = _session_locs(self.cal, minutes)
+        return ~np.in1d(
+            self.cal.all_sessions.asi8[session_locs],
+            self.cal.early_closes.asi8,
+        )
+
 
 class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
     @preprocess(n=lossless_float_to_int('TradingDayOfWeekRule'))
@@ -480,6 +747,16 @@ class TradingDayOfWeekRule(six.with_metaclass(ABCMeta, StatelessRule)):
         val = self.cal.minute_to_session_label(dt, direction="none").value
         return val in self.execution_period_values
 
+    def _trigger_minutes(self, minutes):
+        session_locs, is_open = _session_locs(self.cal, minutes)
+        if not is_open.all():
+            # ``should_trigger`` raises for minutes outside of a session.
+            return None
+        return np.in1d(
+            self.cal.all_sessions.asi8[session_locs],
+            list(self.execution_period_values),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -525,6 +802,16 @@ class TradingDayOfMonthRule(six.with_metaclass(ABCMeta, StatelessRule)):
         value = self.cal.minute_to_session_label(dt, direction="none").value
         return value in self.execution_period_values
 
+    def _trigger_minutes(self, minutes):
+        session_locs, is_open = _session_locs(self.cal, minutes)
+        if not is_open.all():
+            # ``should_trigger`` raises for minutes outside of a session.
+            return None
+        return np.in1d(
+            self.cal.all_sessions.asi8[session_locs],
+            list(self.execution_period_values),
+        )
+
     @lazyval
     def execution_period_values(self):
         # calculate the list of periods that match the given criteria
@@ -600,6 +887,41 @@ class OncePerDay(StatefulRule):
             self.triggered = True
             return True
 
+    def _trigger_minutes(self, minutes):
+        rule_triggers = self.rule.trigger_minutes(minutes)
+        if rule_triggers is None:
+            return None
+
+        minute_values = minutes.asi8
+        rule_trigger_ixs = np.flatnonzero(rule_triggers)
+        one_day = pd.Timedelta(1, unit='d').value
+        triggers = np.zeros(len(minutes), dtype=bool)
+
+        # Walk through the minutes the rule resets at, starting with the rest
+        # of the current day. The rule resets at the first minute on or after
+        # one day from the previous reset.
+        triggered = self.triggered
+        start = 0
+        if self.date is None:
+            end = 0
+        else:
+            end = minute_values.searchsorted(self.next_date.value)
+
+        while True:
+            # Trigger at the first minute the underlying rule triggers.
+            trigger_ix = rule_trigger_ixs.searchsorted(start)
+            if (not triggered and
+                    trigger_ix < len(rule_trigger_ixs) and
+                    rule_trigger_ixs[trigger_ix] < end):
+                triggers[rule_trigger_ixs[trigger_ix]] = True
+
+            if end >= len(minute_values):
+                return triggers
+
+            triggered = False
+            start = end
+            end = minute_values.searchsorted(minute_values[start] + one_day)
+
 
 # Factory API
 
@@ -1,3 +1,5 @@
+from collections import deque
+
 from six.moves import map as imap
 from toolz import compose, identity
 
@@ -142,3 +144,49 @@ class SequentialPool(object):
     @staticmethod
     def join():
         pass
+
+
+def bounded_imap(pool, f, iterable, max_pending=None):
+    """Lazily apply a function to each of the elements of ``iterable`` in
+    ``pool``, yielding the results in order while keeping at most
+    ``max_pending`` calls outstanding.
+
+    Parameters
+    ----------
+    pool : SequentialPool or multiprocessing.Pool
+        The pool to run ``f`` in.
+    f : callable[A, B]
+        The function to apply. When ``pool`` runs in other processes this
+        must be picklable.
+    iterable : iterable[A]
+        The elements to apply ``f`` to.
+    max_pending : int, optional
+        The maximum number of calls submitted to ``pool`` whose results have
+        not been consumed. Defaults to twice the number of processes in
+        ``pool``.
+
+    Returns
+    -------
+    results : iterable[B]
+        The results of ``f`` in the order of ``iterable``.
+
+    Notes
+    -----
+    Unlike ``Pool.imap``, this does not consume ``iterable`` faster than the
+    results are consumed, which bounds the memory used when the results are
+    large and the consumer, for example a bar writer, is slower than the
+    workers.
+    """
+    if max_pending is None:
+        # ``SequentialPool`` doesn't have any processes and runs each call
+        # eagerly.
+        max_pending = 2 * getattr(pool, '_processes', 1)
+
+    pending = deque()
+    for element in iterable:
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+        pending.append(pool.apply_async(f, (element,)))
+
+    while pending:
+        yield pending.popleft().get()